@@ -4,42 +4,47 @@ import numpy as np
 
 from threading import Thread, Event, enumerate as list_threads
 
-from queue import SimpleQueue
+from queue import SimpleQueue, Empty
+from collections import deque
 
 from RobotClass import Robot
+from TaskScheduler import CancellationToken
+from TrajectoryExecutor import TrajectoryExecutor
 from CameraManagement import TopCamera, DetailCamera
 
 from Functionalities import communicateError, sleep
 from ImageModule import saveImage, imageSharpness, markTextOnImage, imageContrast, cropToRectangle
 from Functionalities import pi, testMemoryDemand
-from KinematicsModule.Kinematics import RotVec2RPY  # Slow Python implementation
-from KinematicsLib.cKinematics import toolPositionDifference, jointAngleDifference, spatialDifference
+from KinematicsModule.Backend import RotVec2RPY, convertRotations
+from KinematicsModule.Backend import toolPositionDifference, jointAngleDifference, spatialDifference
 
 
 class MainManager:
-    Robot = Robot
-    TopCamera = TopCamera
-    DetailCamera = DetailCamera
-    _image = None
-    _imageInfo = []
-    currentObject = ()
-    ImageAvailable = Event()
-
-    def __init__(self):
-        self.tryConnect()
-
-    def tryConnect(self):
+    def __init__(self, robot_arguments=None):
+        # Every manager has its own robot and images, so one process can run several cells
+        self.Robot = None
+        self.TopCamera = None
+        self.DetailCamera = None
+        self._image = None
+        self._imageInfo = []
+        self._recentImages = deque(maxlen=16)  # The (time, image) of the last frames, to find the one taken nearest to a moment
+        self.currentObject = ()
+        self.ImageAvailable = Event()
+        self.tryConnect(dict() if robot_arguments is None else robot_arguments)
+
+    def tryConnect(self, robot_arguments):
         # Start these parts safely before anything else:
         ReturnErrorMessageQueue = SimpleQueue()
 
-        def startAsync(this, error_queue, constructor):
+        def startAsync(this, error_queue, constructor, arguments):
             try:
-                setattr(this, constructor.__name__, constructor())
+                setattr(this, constructor.__name__, constructor(**arguments))
             except Exception as e:
                 # Startup of this part has failed and we need to shutdown all parts
                 error_queue.put(e)
 
-        startThreads = [Thread(target=startAsync, args=[self, ReturnErrorMessageQueue, partname], name='{} startAsync'.format(partname)) for partname in [Robot, TopCamera, DetailCamera]]
+        parts = [(Robot, robot_arguments), (TopCamera, dict()), (DetailCamera, dict())]
+        startThreads = [Thread(target=startAsync, args=[self, ReturnErrorMessageQueue, partname, arguments], name='{} startAsync'.format(partname)) for partname, arguments in parts]
         [x.start() for x in startThreads]
         [x.join() for x in startThreads]
 
@@ -72,7 +77,7 @@ class MainManager:
 
     def isConnected(self):
         answer = [False]*4
-        for i, part in enumerate([self.Robot.ModBusReader, self.Robot.RobotCCO, self.TopCamera, self.DetailCamera]):
+        for i, part in enumerate([self.Robot.StateReader, self.Robot.RobotCCO, self.TopCamera, self.DetailCamera]):
             try:
                 answer[i] = part.isConnected()
             except Exception as e:
@@ -87,6 +92,7 @@ class MainManager:
             if image is not None and image_info is not None:
                 self._image = image.copy()
                 self._imageInfo = image_info.copy()
+                self._recentImages.append((time.monotonic(), self._image))
                 if not self.ImageAvailable.isSet():
                     self.ImageAvailable.set()
         except Exception as e:
@@ -110,6 +116,24 @@ class MainManager:
         else:
             raise ReferenceError("_image not found, reference was deleted.")
 
+    def waitForImageAt(self, moment, stop_event):
+        r"""
+        Wait for the first frame after a time.monotonic() moment, and return the
+        time and a copy of the frame taken nearest to the moment.
+        """
+        MAX_TIME = 1.0
+        start_time = time.time()
+        while not stop_event.isSet():
+            frames = list(self._recentImages)
+            if frames and frames[-1][0] >= moment:
+                image_time, image = min(frames, key=lambda frame: abs(frame[0] - moment))
+                return image_time, image.copy()
+            if time.time() - start_time > MAX_TIME:
+                raise TimeoutError("Waiting for image took too long.")
+            self.ImageAvailable.clear()
+            self.ImageAvailable.wait(0.01)
+        return None, None
+
     @staticmethod
     def deleteAllImages(stop_event):
         if stop_event.isSet():
@@ -168,14 +192,17 @@ class MainManager:
         while not stop_event.isSet() and not self.ImageAvailable.isSet():
             sleep(0.01, stop_event)
 
+    # Commands from the GUI run before the next queued pickup
+    MANUAL_PRIORITY = 1
+
     def openGripper(self):
-        self.Robot.giveTask(self.Robot.openGripper)
+        return self.Robot.giveTask(self.Robot.openGripper, self.MANUAL_PRIORITY)
 
     def closeGripper(self):
-        self.Robot.giveTask(self.Robot.closeGripper)
+        return self.Robot.giveTask(self.Robot.closeGripper, self.MANUAL_PRIORITY)
 
     def goHome(self):
-        self.Robot.giveTask(self.Robot.goHome)
+        return self.Robot.giveTask(self.Robot.goHome, self.MANUAL_PRIORITY)
 
     def optimise(self, stop_event, info, objective, transform_position, new_target):
         if stop_event.isSet():
@@ -317,15 +344,14 @@ class MainManager:
         return self.optimise(stop_event, opt_info, objective, apply_angle_transformation, new_value)
 
     def startRobotTask(self):
-        def continuousTask(stop_event_as_argument):
-            while not stop_event_as_argument.isSet():
-                if not self._imageInfo:
-                    raise ValueError("Image info should not be None, possibly no items.")
-                try:
-                    pickupTask(stop_event_as_argument)
-                except Exception as e:
-                    communicateError(e)
-                    break
+        # All pickups share one token, so halting the robot ends the chain
+        continuous_token = CancellationToken()
+
+        def continueTask(future):
+            # Give the next pickup once the last one is done, until one fails or is cancelled
+            if continuous_token.isCancelled() or future.cancelled() or future.exception() is not None:
+                return
+            self.Robot.giveTask(pickupTask, token=continuous_token).add_done_callback(continueTask)
 
         def testPickup(stop_event_as_argument):
             self.Robot.pickUpObject(stop_event_as_argument, self._imageInfo[0])
@@ -352,25 +378,12 @@ class MainManager:
             yaw, pitch, roll = RotVec2RPY(*tool_position[3:])  # Unpack into function input
             print(yaw, pitch, roll)
 
-            # Get rotation matrices for the conversion:
-            sin = np.sin
-            cos = np.cos
-            yawMatrix = np.array([
-                [cos(yaw), -sin(yaw), 0],
-                [sin(yaw), cos(yaw), 0],
-                [0, 0, 1]])
-            pitchMatrix = np.array([
-                [cos(pitch), 0, sin(pitch)],
-                [0, 1, 0],
-                [-sin(pitch), 0, cos(pitch)]])
-            rollMatrix = np.array([
-                [1, 0, 0],
-                [0, cos(roll), -sin(roll)],
-                [0, sin(roll), cos(roll)]])
+            # Get the rotation matrix for the conversion, calibrated with the angles of RotVec2RPY() in reverse order:
+            rotation = convertRotations([roll, pitch, yaw], 'rpy', 'matrix')
 
             print(-real_length/2.0*1.0e-3)
             CALIBRATION = 0.005
-            new_pos = np.array([-CALIBRATION, 0, real_length/2.0*1.0e-3]).dot(yawMatrix.dot(pitchMatrix.dot(rollMatrix)))  # Calibrated
+            new_pos = np.array([-CALIBRATION, 0, real_length/2.0*1.0e-3]).dot(rotation)  # Calibrated
 
             tool_position[0] += new_pos[0]
             tool_position[1] += new_pos[1]
@@ -382,7 +395,7 @@ class MainManager:
                 best_image = self.waitForNextAvailableImage(stop_event_as_argument)
                 saveImage(best_image, stop_event_as_argument)
 
-                new_pos = np.array([CALIBRATION*2.0/num_pieces, 0, -PIECE_LENGTH * 1.0e-3]).dot(yawMatrix.dot(pitchMatrix.dot(rollMatrix)))
+                new_pos = np.array([CALIBRATION*2.0/num_pieces, 0, -PIECE_LENGTH * 1.0e-3]).dot(rotation)
                 tool_position[0] += new_pos[0]
                 tool_position[1] += new_pos[1]
                 tool_position[2] += new_pos[2]
@@ -398,7 +411,12 @@ class MainManager:
 
             self.Robot.turnWhiteLampON(stop_event_as_argument)
             self.currentObject = self._imageInfo[0]
-            X, Y, w, h, angle = self.Robot.pickUpObject(stop_event_as_argument, self.currentObject)
+            picked = self.Robot.pickUpObject(stop_event_as_argument, self.currentObject)
+            if picked is None:  # Nothing to present: end the chain of pickups
+                print("The object was not picked up, stopping the pickups.")
+                continuous_token.cancel()
+                return
+            X, Y, w, h, angle = picked
             # small lego brick: 76.47 x 103.75 pixels
             # big lego brick:   76.38 x 204.11 pixels
             # big alum piece:  131.27 x 389.68 pixels
@@ -433,40 +451,43 @@ class MainManager:
                 tool_position = self.Robot.getToolPosition()
                 yaw, pitch, roll = RotVec2RPY(*tool_position[3:])  # Unpack into function input
 
-                # Get rotation matrices for the conversion:
-                sin = np.sin
-                cos = np.cos
-                yawMatrix = np.array([
-                    [cos(yaw), -sin(yaw), 0],
-                    [sin(yaw), cos(yaw), 0],
-                    [0, 0, 1]])
-                pitchMatrix = np.array([
-                    [cos(pitch), 0, sin(pitch)],
-                    [0, 1, 0],
-                    [-sin(pitch), 0, cos(pitch)]])
-                rollMatrix = np.array([
-                    [1, 0, 0],
-                    [0, cos(roll), -sin(roll)],
-                    [0, sin(roll), cos(roll)]])
+                # Get the rotation matrix for the conversion, calibrated with the angles of RotVec2RPY() in reverse order:
+                rotation = convertRotations([roll, pitch, yaw], 'rpy', 'matrix')
 
                 # Move to one of the ends:
                 CALIBRATION = 0.005  # millimeter
-                new_pos = np.array([-CALIBRATION, 0, (real_length - PIECE_LENGTH) / 2.0 * 1.0e-3]).dot(yawMatrix.dot(pitchMatrix.dot(rollMatrix)))  # Calibrated
+                new_pos = np.array([-CALIBRATION, 0, (real_length - PIECE_LENGTH) / 2.0 * 1.0e-3]).dot(rotation)  # Calibrated
                 tool_position[0] += new_pos[0]
                 tool_position[1] += new_pos[1]
                 tool_position[2] += new_pos[2]
                 self.Robot.moveToolTo(stop_event_as_argument, tool_position, 'movel', velocity=0.1)
-                sleep(0.35, stop_event_as_argument)
 
-                for i in range(num_pieces):
-                    new_pos = np.array([CALIBRATION * 2.0 / num_pieces, 0, -PIECE_LENGTH * 1.0e-3]).dot(yawMatrix.dot(pitchMatrix.dot(rollMatrix)))
-                    tool_position[0] += new_pos[0]
-                    tool_position[1] += new_pos[1]
-                    tool_position[2] += new_pos[2]
-                    self.Robot.moveToolTo(stop_event_as_argument, tool_position, 'movel', velocity=0.1)
-                    sleep(0.35, stop_event_as_argument)
-                    best_image = self.waitForNextAvailableImage(stop_event_as_argument)
+                # Sweep along the object in one continuous motion. The streaming thread notes when
+                # the tool passes every piece, and the frame taken nearest to that moment is saved
+                SWEEP_VELOCITY = 0.01  # m/s, slow enough to not blur the images
+                new_pos = np.array([CALIBRATION * 2.0, 0, -PIECE_LENGTH * num_pieces * 1.0e-3]).dot(rotation)
+                tool_position[0] += new_pos[0]
+                tool_position[1] += new_pos[1]
+                tool_position[2] += new_pos[2]
+                captures = SimpleQueue()
+                history = self.Robot.StateReader.History
+                executor = TrajectoryExecutor(self.Robot)
+                executor.sweepLine(stop_event_as_argument, tool_position, velocity=SWEEP_VELOCITY,
+                                   marks=[(i + 1) / num_pieces for i in range(num_pieces)],
+                                   progress_callback=lambda index, state: captures.put((index, state.Time, state.ToolPosition)))
+                while executor.isRunning() or not captures.empty():
+                    try:
+                        index, mark_time, mark_position = captures.get(timeout=0.1)
+                    except Empty:
+                        continue
+                    image_time, best_image = self.waitForImageAt(mark_time, stop_event_as_argument)
+                    if best_image is None:
+                        break
+                    # Where the tool was when the frame was taken, from the history of the states
+                    offset = np.linalg.norm(history.at(image_time)[history.TOOL][:3] - np.array(mark_position[:3]))
+                    print("Piece {} of {}: image taken {:.2f} mm from its mark".format(index + 1, num_pieces, offset * 1.0e3))
                     saveImage(best_image, stop_event_as_argument)
+                executor.join()
 
             best_image = self.waitForNextAvailableImage(stop_event_as_argument)
             saveImage(best_image, stop_event_as_argument)
@@ -483,7 +504,9 @@ class MainManager:
 
             self.Robot.dropObject(stop_event_as_argument)
 
-        self.Robot.giveTask(continuousTask)
+        future = self.Robot.giveTask(pickupTask, token=continuous_token)
+        future.add_done_callback(continueTask)
+        return future
 
     def stopRobotTask(self):
         self.Robot.halt()
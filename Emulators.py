@@ -0,0 +1,1086 @@
+import re
+import ast
+import time
+import math
+import random
+import operator
+import struct
+import asyncio
+import numpy as np
+
+from threading import Thread, Event, Lock
+
+from Functionalities import pi
+
+
+# The modbus application header and the request that follows it
+MBAP_HEADER = struct.Struct('>HHHB')
+READ_REQUEST = struct.Struct('>BHH')
+
+
+def scriptedTrajectory(waypoints, period):
+    r"""
+    Make a trajectory that moves linearly between the given waypoints, spending
+    the same time on every segment, and starts over after the last waypoint.
+
+    Parameters:
+    ----------
+    waypoints : list of tuples
+        The (joint_angles, tool_position, tool_bit, tool_current) the robot
+        passes through, in radians, meters, a bit and milli ampere.
+    period : float
+        The time in seconds it takes to pass all waypoints once.
+
+    Returns:
+    ----------
+    trajectory : function handle
+        The function that returns the (joint_angles, tool_position, tool_bit,
+        tool_current) at a given time in seconds.
+    """
+    if len(waypoints) < 2:
+        raise ValueError("A trajectory needs at least two waypoints.")
+    segments = len(waypoints)
+
+    def trajectory(t):
+        position = (t % period) / period * segments
+        index = int(position) % segments
+        fraction = position - int(position)
+        (joints0, tool0, bit, current), (joints1, tool1, _, _) = waypoints[index], waypoints[(index + 1) % segments]
+        joint_angles = [a + fraction * (b - a) for a, b in zip(joints0, joints1)]
+        tool_position = [a + fraction * (b - a) for a, b in zip(tool0, tool1)]
+        return joint_angles, tool_position, bit, current
+    return trajectory
+
+
+def kinematicTrajectory(start_angles, end_angles, period, tool_orientation=(0.0, pi, 0.0), forward_kinematics=None):
+    r"""
+    Make a trajectory that moves the joints back and forth between two sets of
+    joint angles with a smooth cosine profile. The tool position follows from
+    the forward kinematics, the tool orientation is kept constant.
+
+    Parameters:
+    ----------
+    start_angles, end_angles : list, list
+        The joint angles in radians between which the robot moves.
+    period : float
+        The time in seconds it takes to move back and forth once.
+    tool_orientation : tuple
+        The rotation vector of the tool.
+    forward_kinematics : function handle
+        The forward kinematics returning the X, Y and Z lists of all joints.
+        Defaults to the fastest available implementation.
+    """
+    if forward_kinematics is None:
+        from KinematicsModule.Backend import ForwardKinematics as forward_kinematics
+
+    def trajectory(t):
+        fraction = 0.5 - 0.5 * math.cos(2.0 * pi * t / period)
+        joint_angles = [a + fraction * (b - a) for a, b in zip(start_angles, end_angles)]
+        X, Y, Z = forward_kinematics(joint_angles)
+        tool_position = [X[-1], Y[-1], Z[-1], *tool_orientation]
+        return joint_angles, tool_position, 0, 0
+    return trajectory
+
+
+def defaultTrajectory():
+    r"""
+    Make a trajectory that moves between the initial position of the robot and
+    the position in which objects are presented to the detail camera.
+    """
+    init = [i * pi / 180 for i in [61.42, -93.00, 94.65, -91.59, -90.0, 0.0]]
+    read = [i * pi / 180 for i in [4.27, -89.63, 101.81, -103.13, 97.65, 90.0]]
+    return scriptedTrajectory([(init, [0.0, -0.4, 0.3, 0.0, pi, 0.0], 0, 0),
+                               (read, [-0.45, -0.1, 0.75, 0.0, 0.0, pi / 2], 1, 20)], period=10.0)
+
+
+class ServerEmulator:
+    r"""
+    Class used to run a local stand-in for one of the servers of the UR5 in an
+    asyncio event loop in a daemon thread. Child classes implement handleClient().
+
+    Attributes:
+    -------
+    Address : tuple
+        The IP address and port the emulator listens on. Port 0 picks a free port.
+    Trajectory : function handle
+        The function that returns the (joint_angles, tool_position, tool_bit,
+        tool_current) at a given time in seconds since the start.
+    """
+
+    def __init__(self, trajectory=None, ip="127.0.0.1", port=0):
+        self.Address = (ip, port)
+        self.Trajectory = defaultTrajectory() if trajectory is None else trajectory
+        self._startTime = time.monotonic()
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    def __repr__(self):
+        return "{} {}".format(type(self).__name__, self.Address)
+
+    def now(self):
+        r""" The time in seconds since the emulator was made. """
+        return time.monotonic() - self._startTime
+
+    async def handleClient(self, reader, writer):
+        r""" Class method to override by any instance. """
+        raise NotImplementedError("handleClient() method not implemented")
+
+    def serve(self, serving_event):
+        r"""
+        Run the asyncio event loop of the emulator. Meant to run in a thread.
+        """
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(asyncio.start_server(self.handleClient, *self.Address))
+        self.Address = self._server.sockets[0].getsockname()[:2]  # In case port 0 was asked for
+        serving_event.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:  # The handlers close their connections when cancelled
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    def start(self):
+        r"""
+        Start serving in a daemon thread and wait until the server listens.
+        """
+        servingEvent = Event()
+        self._thread = Thread(target=self.serve, args=[servingEvent], daemon=True, name='{}Thread'.format(type(self).__name__))
+        self._thread.start()
+        servingEvent.wait()
+        return self
+
+    def shutdownSafely(self):
+        if self._loop is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+
+class ModBusEmulator(ServerEmulator):
+    r"""
+    Class used to stand in for the modbus server of the UR5, so the ModBusReader
+    can be exercised and benchmarked without the robot. Serves registers 1,
+    270-275, 400-405 and 770 from a trajectory over Modbus TCP with asyncio,
+    with a configurable response latency, jitter and drop rate. Replies are
+    sent as soon as their own delay has passed, so with jitter they can arrive
+    out of order, just like pipelined replies from a busy server.
+
+    Attributes:
+    -------
+    Latency : float
+        The time in seconds before a request is answered.
+    Jitter : float
+        The maximum random deviation in seconds from the latency.
+    DropRate : float
+        The fraction of requests that is never answered.
+    RequestCount : int
+        The number of requests received so far.
+    DropCount : int
+        The number of requests that were dropped so far.
+
+    Example:
+    -------
+    -> emulator = ModBusEmulator(latency=0.002).start()
+    -> reader = ModBusReader(*emulator.Address)
+    """
+
+    def __init__(self, trajectory=None, ip="127.0.0.1", port=0, latency=0.0, jitter=0.0, drop_rate=0.0, seed=None):
+        super(ModBusEmulator, self).__init__(trajectory, ip, port)
+        self.Latency = latency
+        self.Jitter = jitter
+        self.DropRate = drop_rate
+        self.RequestCount = 0
+        self.DropCount = 0
+        self._random = random.Random(seed)
+
+    def registers(self, t):
+        r"""
+        Encode the state of the trajectory at time t in the registers of the
+        UR5 modbus: angles in milli rad and positions in tenths of a mm, as
+        16 bit two's complement values.
+        """
+        joint_angles, tool_position, tool_bit, tool_current = self.Trajectory(t)
+        registers = {1: int(tool_bit) << 8, 770: int(tool_current) & 0xFF}
+        for address, angle in zip(range(270, 276), joint_angles):
+            registers[address] = round(angle * 1.0e3) & 0xFFFF
+        for address, value in zip(range(400, 403), tool_position[:3]):
+            registers[address] = round(value * 1.0e4) & 0xFFFF
+        for address, angle in zip(range(403, 406), tool_position[3:]):
+            registers[address] = round(angle * 1.0e3) & 0xFFFF
+        return registers
+
+    def reply(self, transaction_id, unit, function_code, start, count):
+        r"""
+        Build the reply to a read request. Unused registers read as zero, other
+        function codes are answered with the 'illegal function' exception.
+        """
+        if function_code != 3:
+            return MBAP_HEADER.pack(transaction_id, 0, 3, unit) + bytes([function_code | 0x80, 1])
+        registers = self.registers(self.now())
+        values = [registers.get(address, 0) for address in range(start, start + count)]
+        data = struct.pack('>BB{}H'.format(count), 3, 2 * count, *values)
+        return MBAP_HEADER.pack(transaction_id, 0, len(data) + 1, unit) + data
+
+    def delay(self):
+        return max(0.0, self.Latency + self._random.uniform(-self.Jitter, self.Jitter))
+
+    async def respond(self, writer, delay, message):
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+        if not writer.is_closing():
+            writer.write(message)
+
+    async def handleClient(self, reader, writer):
+        r"""
+        Answer all requests of one client until it disconnects. Every request is
+        answered in its own task, so requests that were sent back to back are
+        served concurrently.
+        """
+        try:
+            while True:
+                header = await reader.readexactly(MBAP_HEADER.size)
+                transaction_id, _, length, unit = MBAP_HEADER.unpack(header)
+                request = await reader.readexactly(length - 1)
+                self.RequestCount += 1
+                if self._random.random() < self.DropRate:
+                    self.DropCount += 1
+                    continue
+                function_code, start, count = READ_REQUEST.unpack_from(request)
+                message = self.reply(transaction_id, unit, function_code, start, count)
+                asyncio.ensure_future(self.respond(writer, self.delay(), message))
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+class RealTimeEmulator(ServerEmulator):
+    r"""
+    Class used to stand in for the real-time interface of the UR5 on port 30003,
+    which pushes a packet of 1116 bytes with the robot state to every client at
+    125 Hz. Only the values the RealTimeReader decodes are filled in.
+
+    Attributes:
+    -------
+    Frequency : float
+        The number of packets per second.
+    PacketLength : int
+        The length of a packet in bytes.
+    """
+
+    PacketLength = 1116
+
+    def __init__(self, trajectory=None, ip="127.0.0.1", port=0, frequency=125.0):
+        super(RealTimeEmulator, self).__init__(trajectory, ip, port)
+        self.Frequency = frequency
+
+    def packet(self, t, last_joint_angles):
+        r"""
+        Build the packet with the state of the trajectory at time t. The joint
+        velocities are the difference with the last joint angles.
+        """
+        joint_angles, tool_position, tool_bit, _ = self.Trajectory(t)
+        joint_velocities = [(a - b) * self.Frequency for a, b in zip(joint_angles, last_joint_angles)]
+        packet = bytearray(self.PacketLength)
+        struct.pack_into('>i', packet, 0, self.PacketLength)
+        struct.pack_into('>d', packet, 4, t)
+        struct.pack_into('>6d', packet, 252, *joint_angles)
+        struct.pack_into('>6d', packet, 300, *joint_velocities)
+        struct.pack_into('>6d', packet, 444, *tool_position)
+        struct.pack_into('>d', packet, 756, 7.0)  # ROBOT_MODE_RUNNING
+        struct.pack_into('>d', packet, 1044, float(int(tool_bit) << 8))
+        return packet, joint_angles
+
+    async def handleClient(self, reader, writer):
+        r"""
+        Push packets to one client at a fixed rate until it disconnects.
+        """
+        period = 1.0 / self.Frequency
+        next_time = time.monotonic()
+        last_joint_angles = self.Trajectory(self.now())[0]
+        try:
+            while not writer.is_closing():
+                packet, last_joint_angles = self.packet(self.now(), last_joint_angles)
+                writer.write(packet)
+                await writer.drain()
+                next_time += period
+                await asyncio.sleep(max(0.0, next_time - time.monotonic()))
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+class RTDEEmulator(ServerEmulator):
+    r"""
+    Class used to stand in for the Real-Time Data Exchange interface of the UR5
+    on port 30004. Answers the protocol version, output setup, start and pause
+    requests, and pushes data packages with the negotiated recipe at the
+    requested frequency while started. Variables it does not know are answered
+    with NOT_FOUND, like the controller does.
+
+    Attributes:
+    -------
+    Outputs : dict
+        The RTDE data type of every output variable the emulator serves.
+    """
+
+    Outputs = {'timestamp': 'DOUBLE', 'actual_q': 'VECTOR6D', 'actual_qd': 'VECTOR6D', 'actual_current': 'VECTOR6D',
+               'actual_TCP_pose': 'VECTOR6D', 'actual_digital_output_bits': 'UINT64', 'robot_mode': 'INT32'}
+
+    def outputs(self, t, last):
+        r"""
+        The values of all output variables at time t. The joint velocities are
+        the difference with the last joint angles over the elapsed time.
+        """
+        joint_angles, tool_position, tool_bit, _ = self.Trajectory(t)
+        last_t, last_joint_angles = last
+        dt = max(t - last_t, 1.0e-9)
+        return {'timestamp': t, 'actual_q': joint_angles, 'actual_qd': [(a - b) / dt for a, b in zip(joint_angles, last_joint_angles)],
+                'actual_current': [0.0] * 6, 'actual_TCP_pose': tool_position,
+                'actual_digital_output_bits': int(tool_bit) << 8, 'robot_mode': 7}
+
+    async def stream(self, writer, recipe, frequency):
+        r"""
+        Push data packages of the recipe at the given frequency until cancelled.
+        """
+        from RTDE import packRTDE, RTDE_DATA_PACKAGE
+
+        period = 1.0 / frequency
+        next_time = time.monotonic()
+        t = self.now()
+        last = (t, self.Trajectory(t)[0])
+        while not writer.is_closing():
+            t = self.now()
+            values = self.outputs(t, last)
+            last = (t, values['actual_q'])
+            flat = list()
+            for name in recipe.Names:
+                value = values[name]
+                flat.extend(value if isinstance(value, (list, tuple)) else [value])
+            writer.write(packRTDE(RTDE_DATA_PACKAGE, bytes([recipe.ID]) + recipe.Format.pack(*flat)))
+            next_time += period
+            await asyncio.sleep(max(0.0, next_time - time.monotonic()))
+
+    async def handleClient(self, reader, writer):
+        r"""
+        Answer the control packages of one client until it disconnects.
+        """
+        from RTDE import (RTDE_HEADER, RTDERecipe, packRTDE, RTDE_REQUEST_PROTOCOL_VERSION, RTDE_GET_URCONTROL_VERSION,
+                          RTDE_CONTROL_PACKAGE_SETUP_OUTPUTS, RTDE_CONTROL_PACKAGE_START, RTDE_CONTROL_PACKAGE_PAUSE)
+
+        recipe = None
+        frequency = 125.0
+        streaming = None
+        try:
+            while True:
+                size, package_type = RTDE_HEADER.unpack(await reader.readexactly(RTDE_HEADER.size))
+                payload = await reader.readexactly(size - RTDE_HEADER.size)
+                if package_type == RTDE_REQUEST_PROTOCOL_VERSION:
+                    accepted = struct.unpack('>H', payload)[0] in (1, 2)
+                    writer.write(packRTDE(package_type, bytes([accepted])))
+                elif package_type == RTDE_GET_URCONTROL_VERSION:
+                    writer.write(packRTDE(package_type, struct.pack('>IIII', 3, 15, 0, 0)))
+                elif package_type == RTDE_CONTROL_PACKAGE_SETUP_OUTPUTS:
+                    frequency = min(struct.unpack_from('>d', payload)[0], 125.0)
+                    names = payload[8:].decode().split(',')
+                    types = [self.Outputs.get(name, 'NOT_FOUND') for name in names]
+                    writer.write(packRTDE(package_type, bytes([1]) + ','.join(types).encode()))
+                    if 'NOT_FOUND' not in types:
+                        recipe = RTDERecipe(1, names, types)
+                elif package_type == RTDE_CONTROL_PACKAGE_START:
+                    accepted = recipe is not None
+                    writer.write(packRTDE(package_type, bytes([accepted])))
+                    if accepted and streaming is None:
+                        streaming = asyncio.ensure_future(self.stream(writer, recipe, frequency))
+                elif package_type == RTDE_CONTROL_PACKAGE_PAUSE:
+                    if streaming is not None:
+                        streaming.cancel()
+                        streaming = None
+                    writer.write(packRTDE(package_type, bytes([1])))
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            if streaming is not None:
+                streaming.cancel()
+            writer.close()
+
+
+def parseExpression(text):
+    r"""
+    Parse a URscript expression into a Python syntax tree. The expressions of
+    URscript that the emulator understands are valid Python: numbers, strings,
+    lists, poses p[...], variables, indexing, arithmetic, comparisons and calls.
+    """
+    try:
+        return ast.parse(text.strip(), mode='eval').body
+    except SyntaxError:
+        raise ValueError("Cannot parse the URscript expression {}.".format(text.strip()))
+
+
+def parseProgram(lines):
+    r"""
+    Parse the lines of a URscript program, without its def and end, into a list
+    of statements. The statements are ('expr', expression), ('assign', name,
+    expression), ('break',), ('while', condition, body) and ('if', branches),
+    where the branches are (condition, body) and else has the condition None.
+    """
+    program = list()
+    blocks = [(None, program)]  # The open blocks, innermost last: the statement and the body new lines go to
+    for line in lines:
+        line = line.split('#')[0].strip()
+        if not line:
+            continue
+        statement, body = blocks[-1]
+        match = re.fullmatch(r'(?:while|if|elif)\s+(.+?)\s*:|else\s*:|end|break', line)
+        if match is None:
+            assignment = re.fullmatch(r'(?:global\s+|local\s+)?(\w+)\s*=(?!=)\s*(.+)', line)
+            if assignment is not None:
+                body.append(('assign', assignment.group(1), parseExpression(assignment.group(2))))
+            else:
+                body.append(('expr', parseExpression(line)))
+            continue
+        keyword = line.split()[0].rstrip(':')
+        if keyword == 'break':
+            body.append(('break',))
+        elif keyword == 'end':
+            if len(blocks) == 1:
+                raise ValueError("end without a block to close.")
+            blocks.pop()
+        elif keyword == 'while':
+            loop = ('while', parseExpression(match.group(1)), list())
+            body.append(loop)
+            blocks.append((loop, loop[2]))
+        elif keyword == 'if':
+            branch = list()
+            condition = ('if', [(parseExpression(match.group(1)), branch)])
+            body.append(condition)
+            blocks.append((condition, branch))
+        else:
+            if statement is None or statement[0] != 'if':
+                raise ValueError("{} without an if.".format(keyword))
+            branch = list()
+            statement[1].append((parseExpression(match.group(1)) if keyword == 'elif' else None, branch))
+            blocks[-1] = (statement, branch)
+    if len(blocks) > 1:
+        raise ValueError("A block is not closed with end.")
+    return program
+
+
+class SimulatedArm:
+    r"""
+    Class used to simulate the motion of the UR5 arm on its own clock, which
+    runs TimeScale times faster than the wall clock. Every motion is planned as
+    a path of joint angles that is followed with a trapezoidal velocity
+    profile, limited by the velocity and acceleration of the command and by
+    the limits of the joints. A new motion starts from the current joint angles
+    at rest. The tool sits at ToolOffset from the flange of the last wrist.
+
+    The arm is a trajectory for the ModBusEmulator and the RealTimeEmulator:
+    calling it returns the (joint_angles, tool_position, tool_bit, tool_current)
+    of now, the time argument of the emulators is ignored.
+
+    Attributes:
+    -------
+    TimeScale : float
+        How much faster than the wall clock the arm moves.
+    MaxJointSpeed : float
+        The largest speed of a joint, in rad/s.
+    MaxJointAcceleration : float
+        The largest acceleration of a joint, in rad/s^2.
+    DigitalOutputs : int
+        The bits of the digital outputs. Output 8 is the gripper.
+    GripperTime : float
+        How long the current through the gripper peaks after it was switched.
+    ToolOffset : np.array
+        The 4 x 4 pose of the tool in the frame of the flange, like toolTransform().
+    """
+
+    PERIOD = 0.002  # s between the samples of a profile
+    RESOLUTION = 0.001  # m between the samples of the path of a movel
+
+    def __init__(self, joint_angles=None, time_scale=1.0, max_joint_speed=pi, max_joint_acceleration=4*pi, tool_offset=(0.0, 0.0, 0.15, 0.0, 0.0, 0.0)):
+        from KinematicsModule.Backend import convertRotations, provides
+
+        if not (provides('interpolateToolPath') and provides('toolPathToJointPath')):  # Fail now, not on the first movel
+            raise ImportError("The SimulatedArm needs the inverse kinematics of the compiled backend for movel. "
+                              "Build it with make in KinematicsModule.")
+        if joint_angles is None:
+            joint_angles = [i * pi / 180 for i in [61.42, -93.00, 94.65, -91.59, -90.0, 0.0]]
+        self.TimeScale = time_scale
+        self.MaxJointSpeed = max_joint_speed
+        self.MaxJointAcceleration = max_joint_acceleration
+        self.DigitalOutputs = 0
+        self.GripperTime = 0.3
+        self.ToolOffset = np.eye(4)
+        self.ToolOffset[:3, :3] = convertRotations(np.array(tool_offset[3:], np.float64), 'rotvec', 'matrix')
+        self.ToolOffset[:3, 3] = tool_offset[:3]
+        self._startTime = time.monotonic()
+        self._switchTime = -math.inf
+        self._lock = Lock()
+        self._motion = None
+        self.rest(np.array(joint_angles, np.float64))
+
+    def __repr__(self):
+        return "SimulatedArm at {}x".format(self.TimeScale)
+
+    def now(self):
+        r""" The time of the arm in seconds. """
+        return (time.monotonic() - self._startTime) * self.TimeScale
+
+    def rest(self, joint_angles):
+        with self._lock:
+            self._motion = (self.now(), np.array([0.0]), np.array([0.0]), np.array([joint_angles, joint_angles]), 0.0)
+
+    def sample(self, motion, t):
+        r"""
+        Return the joint angles of a motion at time t, and its fraction.
+        """
+        start_time, times, fractions, joint_path, _ = motion
+        fraction = float(np.interp(t - start_time, times, fractions))
+        position = fraction * (len(joint_path) - 1)
+        index = min(int(position), len(joint_path) - 2)
+        return joint_path[index] + (position - index) * (joint_path[index + 1] - joint_path[index]), fraction
+
+    def jointAngles(self):
+        with self._lock:
+            return self.sample(self._motion, self.now())[0]
+
+    def isMoving(self):
+        with self._lock:
+            start_time, times, _, _, _ = self._motion
+            return self.now() - start_time < times[-1]
+
+    def remainingTime(self):
+        r""" The time in seconds of the arm until the current motion ends. """
+        with self._lock:
+            start_time, times, _, _, _ = self._motion
+            return max(0.0, times[-1] - (self.now() - start_time))
+
+    def toolPosition(self, joint_angles):
+        from KinematicsModule.Backend import forwardKinematicsFrames, convertRotations
+
+        _, frames = forwardKinematicsFrames(joint_angles)
+        tool = frames[0].dot(self.ToolOffset)
+        rotation = convertRotations(np.ascontiguousarray(tool[:, :3]), 'matrix', 'rotvec')
+        return [*tool[:, 3].tolist(), *np.asarray(rotation).tolist()]
+
+    def follow(self, joint_path, length, velocity, acceleration):
+        r"""
+        Start moving along a path of joint angles with a trapezoidal profile.
+        The velocity and acceleration along the path are lowered until no joint
+        exceeds its limits.
+
+        Parameters:
+        ----------
+        joint_path : np.array
+            The N x 6 joint angles the arm passes through, evenly spaced along the path.
+        length : float
+            The length of the path in the units of the velocity, meters for a
+            movel and radians for a movej.
+        """
+        from TrajectoryExecutor import trapezoidalProfile
+
+        joint_distance = np.abs(np.diff(joint_path, axis=0)).max(axis=1).sum()
+        if length <= 1e-9 or joint_distance <= 1e-9:
+            return
+        stretch = joint_distance / length  # rad per unit of the path, at most
+        velocity = min(velocity, self.MaxJointSpeed / stretch)
+        acceleration = min(acceleration, self.MaxJointAcceleration / stretch)
+        distances, _ = trapezoidalProfile(length, velocity, acceleration, self.PERIOD)
+        times = np.arange(len(distances)) * self.PERIOD
+        with self._lock:
+            self._motion = (self.now(), times, distances / length, joint_path, length)
+
+    def moveJoints(self, joint_angles, acceleration=1.4, velocity=1.05, duration=0.0):
+        r"""
+        Move linearly in joint space, like movej. A duration replaces the
+        velocity, unless the joints cannot move that fast.
+        """
+        start = self.jointAngles()
+        target = np.array(joint_angles, np.float64)
+        length = np.abs(target - start).max()
+        if duration > 0:
+            velocity, acceleration = 2 * length / duration, 4 * length / duration**2  # Reach the target in the duration
+        self.follow(np.array([start, target]), length, velocity, acceleration)
+
+    def servo(self, joint_angles, duration):
+        r"""
+        Move to the joint angles at a constant speed in the duration, like servoj.
+        Unlike the other motions, a setpoint does not start from rest, so a
+        stream of setpoints is followed without stopping at each of them.
+        """
+        start = self.jointAngles()
+        target = np.array(joint_angles, np.float64)
+        with self._lock:
+            self._motion = (self.now(), np.array([0.0, duration]), np.array([0.0, 1.0]), np.array([start, target]), np.abs(target - start).max())
+
+    def speedLinear(self, tool_velocity, duration):
+        r"""
+        Move the tool at a constant velocity during the duration, like speedl.
+        The velocity is integrated from where the current motion ends, not from
+        where the arm is now, so a setpoint that comes in a little early does
+        not lose the distance the previous one had left. The pose after the
+        duration is converted to joint angles and reached like a servoj setpoint.
+
+        Parameters:
+        ----------
+        tool_velocity : list
+            The velocity of the tool in m/s and its angular velocity in rad/s,
+            both in the base frame.
+        """
+        from KinematicsModule.Backend import convertRotations, toolPathToJointPath
+
+        with self._lock:
+            start_time, times, _, _, _ = self._motion
+            start_angles = self.sample(self._motion, start_time + times[-1])[0]
+        target = np.array(self.toolPosition(start_angles), np.float64)
+        velocity = np.array(tool_velocity, np.float64)
+        rotation = convertRotations(velocity[3:] * duration, 'rotvec', 'matrix').dot(convertRotations(target[3:], 'rotvec', 'matrix'))
+        target[:3] += velocity[:3] * duration
+        target[3:] = convertRotations(np.ascontiguousarray(rotation), 'matrix', 'rotvec')
+        self.servo(toolPathToJointPath(np.array([target]), start_angles, self.ToolOffset)[-1], duration)
+
+    def moveLinear(self, tool_position, acceleration=1.2, velocity=0.25):
+        r"""
+        Move the tool in a straight line, like movel. The path is sampled every
+        millimeter and converted to joint angles with the inverse kinematics.
+        A rotation without a translation is followed in joint space.
+        """
+        from KinematicsModule.Backend import interpolateToolPath, toolPathToJointPath
+
+        start_angles = self.jointAngles()
+        start = np.array(self.toolPosition(start_angles), np.float64)
+        target = np.array(tool_position, np.float64)
+        length = np.linalg.norm(target[:3] - start[:3])
+        samples = max(2, int(np.ceil(length / self.RESOLUTION)) + 1)
+        joint_path = toolPathToJointPath(interpolateToolPath(start, target, samples), start_angles, self.ToolOffset)
+        if length < self.RESOLUTION:
+            self.follow(joint_path, np.abs(joint_path[-1] - joint_path[0]).max(), 1.05, 1.4)
+        else:
+            self.follow(joint_path, length, velocity, acceleration)
+
+    def targetAngles(self, target):
+        r"""
+        Return the joint angles of a movej target: joint angles, or a pose
+        ('p', list) that is reached with the configuration nearest to now.
+        """
+        from KinematicsModule.Backend import toolPathToJointPath
+
+        if isinstance(target, tuple):  # Raises a ValueError when the pose cannot be reached
+            return toolPathToJointPath(np.array([target[1]], np.float64), self.jointAngles(), self.ToolOffset, 2*pi)[-1]
+        return target
+
+    def stop(self, deceleration):
+        r"""
+        Decelerate along the current path until the arm stands still, like stopj and stopl.
+        """
+        with self._lock:
+            now = self.now()
+            motion = self._motion
+            _, fraction = self.sample(motion, now)
+            _, later = self.sample(motion, now + self.PERIOD)
+            start_time, times, fractions, joint_path, length = motion
+            if now - start_time >= times[-1] or length <= 0:
+                return
+            speed = (later - fraction) * length / self.PERIOD
+            stop_time = speed / max(deceleration, 1e-9)
+            stop_times = np.append(np.arange(0, stop_time, self.PERIOD), stop_time)
+            stop_fractions = fraction + (speed * stop_times - 0.5 * deceleration * stop_times**2) / length
+            self._motion = (now, stop_times, np.minimum(stop_fractions, 1.0), joint_path, length)
+
+    def setDigitalOut(self, port_number, on):
+        with self._lock:
+            if bool(self.DigitalOutputs >> port_number & 1) != on:
+                self.DigitalOutputs ^= 1 << port_number
+                if port_number == 8:
+                    self._switchTime = self.now()
+
+    def __call__(self, t=None):
+        joint_angles = self.jointAngles()
+        tool_bit = self.DigitalOutputs >> 8 & 1
+        tool_current = 60 if self.now() - self._switchTime < self.GripperTime else 20  # mA, peaks while the gripper moves
+        return joint_angles.tolist(), self.toolPosition(joint_angles), tool_bit, tool_current
+
+
+class ScriptEmulator(RealTimeEmulator):
+    r"""
+    Class used to stand in for port 30003 of the UR5, which executes URscript
+    and pushes the real-time packets to every client. Understands movej, movel,
+    servoj, speedl, stopj, stopl, set_digital_out, sleep, socket_open,
+    socket_read_ascii_float and socket_close, variables, while and if blocks,
+    on their own or inside a def ... end program, and moves a SimulatedArm.
+    Like on the controller, every program that is received replaces the one
+    that runs, but the arm finishes its current motion unless the new program
+    moves or stops it. Blend radii are ignored, so the arm stops at every
+    waypoint. Like on the controller, servoj and speedl return when their
+    time t has passed since the previous setpoint was due, so a program that
+    streams setpoints keeps the pace of the stream.
+
+    Attributes:
+    -------
+    Arm : SimulatedArm
+        The arm the scripts move, and the trajectory of the packets.
+    ProgramCount : int
+        The number of programs received so far.
+    """
+
+    OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+                 ast.Mod: operator.mod, ast.Pow: operator.pow, ast.USub: operator.neg, ast.UAdd: operator.pos,
+                 ast.Not: operator.not_, ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+                 ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+    def __init__(self, arm, ip="127.0.0.1", port=0, frequency=125.0):
+        super(ScriptEmulator, self).__init__(arm, ip, port, frequency)
+        self.Arm = arm
+        self.ProgramCount = 0
+        self._program = None
+        self._setpointDeadline = None
+
+    async def execute(self, lines):
+        r"""
+        Execute the lines of one program, waiting for every move to finish.
+        """
+        sockets = dict()  # The sockets the program opened, by name
+        self._setpointDeadline = None
+        try:
+            await self.executeBlock(parseProgram(lines), dict(), sockets)
+        except (ValueError, IndexError, TypeError, OSError) as e:  # The controller halts the program on an error
+            print("{} stops the program: {}".format(self, e))
+        finally:
+            for _, writer in sockets.values():
+                writer.close()
+
+    async def executeBlock(self, statements, variables, sockets):
+        r"""
+        Execute a list of statements from parseProgram(). Returns True when a
+        break leaves the block.
+        """
+        for statement in statements:
+            kind = statement[0]
+            if kind == 'break':
+                return True
+            elif kind == 'expr':
+                await self.evaluate(statement[1], variables, sockets)
+            elif kind == 'assign':
+                variables[statement[1]] = await self.evaluate(statement[2], variables, sockets)
+            elif kind == 'while':
+                while await self.evaluate(statement[1], variables, sockets):
+                    if await self.executeBlock(statement[2], variables, sockets):
+                        break
+                    await asyncio.sleep(0)  # Let the packets be pushed during loops that do not wait
+            elif kind == 'if':
+                for condition, body in statement[1]:
+                    if condition is None or await self.evaluate(condition, variables, sockets):
+                        if await self.executeBlock(body, variables, sockets):
+                            return True
+                        break
+        return False
+
+    async def evaluate(self, node, variables, sockets):
+        r"""
+        Evaluate an expression from parseExpression(). Poses p[...] are returned
+        as ('p', list) to tell them apart from joint angles.
+        """
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [await self.evaluate(element, variables, sockets) for element in node.elts]
+        if isinstance(node, ast.Name):
+            if node.id not in variables:
+                raise ValueError("{} is not defined.".format(node.id))
+            return variables[node.id]
+        if isinstance(node, ast.Subscript):
+            index = await self.evaluate(node.slice, variables, sockets)
+            if isinstance(node.value, ast.Name) and node.value.id == 'p' and 'p' not in variables:
+                return 'p', [float(value) for value in index]
+            return (await self.evaluate(node.value, variables, sockets))[int(index)]
+        if isinstance(node, ast.UnaryOp) and type(node.op) in self.OPERATORS:
+            return self.OPERATORS[type(node.op)](await self.evaluate(node.operand, variables, sockets))
+        if isinstance(node, ast.BinOp) and type(node.op) in self.OPERATORS:
+            return self.OPERATORS[type(node.op)](await self.evaluate(node.left, variables, sockets),
+                                                 await self.evaluate(node.right, variables, sockets))
+        if isinstance(node, ast.BoolOp):
+            conjunction = isinstance(node.op, ast.And)
+            for value in node.values:  # Stop at the first value that decides the result
+                result = await self.evaluate(value, variables, sockets)
+                if bool(result) != conjunction:
+                    break
+            return result
+        if isinstance(node, ast.Compare) and all(type(operation) in self.OPERATORS for operation in node.ops):
+            left = await self.evaluate(node.left, variables, sockets)
+            for operation, comparator in zip(node.ops, node.comparators):
+                right = await self.evaluate(comparator, variables, sockets)
+                if not self.OPERATORS[type(operation)](left, right):
+                    return False
+                left = right
+            return True
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            args = [await self.evaluate(argument, variables, sockets) for argument in node.args]
+            kwargs = {keyword.arg: await self.evaluate(keyword.value, variables, sockets) for keyword in node.keywords}
+            return await self.call(node.func.id, args, kwargs, sockets)
+        raise ValueError("The emulator does not understand {}.".format(ast.dump(node)))
+
+    async def call(self, name, args, kwargs, sockets):
+        r"""
+        Call a URscript function. Moves and stops return once the arm stands still.
+        """
+        arm = self.Arm
+        if name == 'movej':
+            arm.moveJoints(arm.targetAngles(args[0]), kwargs.get('a', 1.4), kwargs.get('v', 1.05), kwargs.get('t', 0.0))
+        elif name == 'movel':
+            target = args[0][1] if isinstance(args[0], tuple) else arm.toolPosition(args[0])
+            arm.moveLinear(target, kwargs.get('a', 1.2), kwargs.get('v', 0.25))
+        elif name == 'servoj':  # Returns when the next setpoint is due
+            duration = args[3] if len(args) > 3 else kwargs.get('t', 0.008)
+            arm.servo(args[0], duration)
+            await self.waitForNextSetpoint(duration)
+            return None
+        elif name == 'speedl':
+            duration = args[2] if len(args) > 2 else kwargs.get('t', 0.008)
+            arm.speedLinear(args[0], duration)
+            await self.waitForNextSetpoint(duration)
+            return None
+        elif name in ('stopj', 'stopl'):
+            arm.stop(args[0] if args else kwargs.get('a', 1.0))
+        elif name == 'set_digital_out':
+            arm.setDigitalOut(int(args[0]), bool(args[1]))
+            return None
+        elif name == 'sleep':
+            await asyncio.sleep(args[0] / arm.TimeScale)
+            return None
+        elif name == 'socket_open':
+            return await self.openSocket(sockets, *args, **kwargs)
+        elif name == 'socket_read_ascii_float':
+            return await self.readSocketFloats(sockets, *args, **kwargs)
+        elif name == 'socket_close':
+            _, writer = sockets.pop(args[0] if args else kwargs.get('socket_name', 'socket_0'), (None, None))
+            if writer is not None:
+                writer.close()
+            return None
+        else:
+            print("{} ignores {}().".format(self, name))
+            return None
+        while arm.isMoving():
+            await asyncio.sleep(arm.remainingTime() / arm.TimeScale + 1e-4)
+
+    async def waitForNextSetpoint(self, duration):
+        r"""
+        Wait until the next setpoint of servoj or speedl is due. The deadlines
+        are counted from the first setpoint, so the time the program spends
+        between two setpoints does not add up over the stream. A setpoint that
+        arrives later than its deadline starts the count again.
+        """
+        now = asyncio.get_event_loop().time()
+        period = duration / self.Arm.TimeScale
+        if self._setpointDeadline is None or now > self._setpointDeadline + period:
+            self._setpointDeadline = now
+        self._setpointDeadline += period
+        await asyncio.sleep(self._setpointDeadline - now)
+
+    @staticmethod
+    async def openSocket(sockets, address, port, socket_name='socket_0'):
+        try:
+            sockets[socket_name] = await asyncio.open_connection(address, int(port))
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    async def readSocketFloats(sockets, number, socket_name='socket_0', timeout=2.0):
+        r"""
+        Read a line (v1,v2,...) of number values, like socket_read_ascii_float:
+        returns [number, v1, v2, ...], or [0] on a timeout, a closed socket or
+        a line with another number of values.
+        """
+        if socket_name not in sockets:
+            return [0]
+        reader, _ = sockets[socket_name]
+        try:
+            line = (await asyncio.wait_for(reader.readline(), timeout)).decode().strip()
+            values = [float(value) for value in line[1:-1].split(',')] if line.startswith('(') and line.endswith(')') else []
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            return [0]
+        return [number] + values if len(values) == number else [0]
+
+    def run(self, lines):
+        if self._program is not None:
+            self._program.cancel()
+        self.ProgramCount += 1
+        self._program = asyncio.ensure_future(self.execute(lines))
+
+    async def handleClient(self, reader, writer):
+        r"""
+        Push the packets to one client while reading its scripts, until it
+        disconnects. A line that starts with def starts a program that ends
+        with the end of the def, every other line is a program of its own.
+        """
+        pushing = asyncio.ensure_future(super(ScriptEmulator, self).handleClient(reader, writer))
+        program = None
+        depth = 0  # The number of open blocks of the program, the def included
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.decode().strip()
+                if not line:
+                    continue
+                if program is None:
+                    if re.match(r'def\s+\w+\s*\(\s*\)\s*:', line):
+                        program, depth = list(), 1
+                    else:
+                        self.run([line])
+                    continue
+                if re.match(r'(while|if)\b.*:$', line):
+                    depth += 1
+                elif line == 'end':
+                    depth -= 1
+                    if depth == 0:
+                        self.run(program)
+                        program = None
+                        continue
+                program.append(line)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            pushing.cancel()
+            writer.close()
+
+
+class ControllerEmulator:
+    r"""
+    Class used to stand in for the whole UR5 controller, so the Robot class can
+    run its tasks end to end without the robot, faster than real time when the
+    time scale is larger than 1. A SimulatedArm is moved by the scripts the
+    ScriptEmulator receives and is served by a ModBusEmulator, both on free
+    local ports by default.
+
+    Attributes:
+    -------
+    Arm : SimulatedArm
+        The simulated arm.
+    ModBus : ModBusEmulator
+        The stand-in for the modbus server, for the ModBusReader.
+    Script : ScriptEmulator
+        The stand-in for port 30003, for the RobotCCO and the RealTimeReader.
+
+    Example:
+    -------
+    -> emulator = ControllerEmulator(time_scale=10.0).start()
+    -> robot = Robot(**emulator.robotArguments())
+    """
+
+    def __init__(self, joint_angles=None, ip="127.0.0.1", modbus_port=0, script_port=0, time_scale=1.0, latency=0.0):
+        self.Arm = SimulatedArm(joint_angles, time_scale)
+        self.ModBus = ModBusEmulator(self.Arm, ip, modbus_port, latency=latency)
+        self.Script = ScriptEmulator(self.Arm, ip, script_port)
+
+    def __repr__(self):
+        return "ControllerEmulator {}".format(self.ModBus.Address[0])
+
+    def start(self):
+        self.ModBus.start()
+        self.Script.start()
+        return self
+
+    def robotArguments(self):
+        r"""
+        The ip and ports to give to the Robot.
+        """
+        return {'ip': self.ModBus.Address[0], 'state_port': self.ModBus.Address[1], 'command_port': self.Script.Address[1]}
+
+    def shutdownSafely(self):
+        self.ModBus.shutdownSafely()
+        self.Script.shutdownSafely()
+
+
+def SpeedOfModBusReader(pipelined=False, latency=0.0, jitter=0.0, drop_rate=0.0, duration=5.0):
+    r"""
+    Measure how many cycles per second the ModBusReader completes against the
+    emulator.
+    """
+    from Readers import ModBusReader
+
+    emulator = ModBusEmulator(latency=latency, jitter=jitter, drop_rate=drop_rate).start()
+    reader = ModBusReader(*emulator.Address, pipelined=pipelined)
+    start_count = reader.History.Count
+    time.sleep(duration)
+    cycles = reader.History.Count - start_count
+    in_flight, latencies = reader.getTransactionStatistics()
+    reader.shutdownSafely()
+    emulator.shutdownSafely()
+    print("pipelined={}, latency={} s: {} cycles per second, {} requests in flight".format(pipelined, latency, cycles / duration, in_flight))
+    for block, seconds in latencies.items():
+        print("   {}: {:.2f} ms".format(block, seconds * 1.0e3))
+
+
+def SpeedOfRealTimeReader(duration=5.0):
+    r"""
+    Measure how many states per second the RealTimeReader publishes from the
+    emulator.
+    """
+    from Readers import RealTimeReader
+
+    emulator = RealTimeEmulator().start()
+    reader = RealTimeReader(*emulator.Address)
+    start_count = reader.History.Count
+    time.sleep(duration)
+    cycles = reader.History.Count - start_count
+    reader.shutdownSafely()
+    emulator.shutdownSafely()
+    print("real-time: {} states per second".format(cycles / duration))
+
+
+def SpeedOfRTDEReader(duration=5.0):
+    r"""
+    Measure how many states per second the RTDEReader publishes from the
+    emulator.
+    """
+    from RTDE import RTDEReader
+
+    emulator = RTDEEmulator().start()
+    reader = RTDEReader(*emulator.Address)
+    start_count = reader.History.Count
+    time.sleep(duration)
+    cycles = reader.History.Count - start_count
+    reader.shutdownSafely()
+    emulator.shutdownSafely()
+    print("RTDE: {} states per second".format(cycles / duration))
+
+
+def SpeedOfPickProgram(time_scale=10.0):
+    r"""
+    Pick up an object over the light box with a Robot that drives the
+    ControllerEmulator, with the moves validated, and measure how long it
+    takes. Raises a RuntimeError when the pick does not reach all its steps.
+    """
+    from RobotClass import Robot
+
+    emulator = ControllerEmulator(time_scale=time_scale).start()
+    robot = Robot(**emulator.robotArguments())
+    try:
+        robot.Tasks.waitUntilIdle()
+        start_time = time.time()
+        picked = robot.giveTask(lambda stop_event: robot.pickUpObject(stop_event, ((0.05, 0.05), (0.02, 0.02), 0.1))).result()
+        duration = time.time() - start_time
+        if picked is None or robot.isGripperOpen():
+            raise RuntimeError("The pick did not reach all its steps.")
+        print("pick at {}x: {:.2f} s".format(time_scale, duration))
+    finally:
+        robot.shutdownSafely()
+        emulator.shutdownSafely()
+
+
+if __name__ == '__main__':
+    SpeedOfModBusReader(pipelined=False, latency=0.002, jitter=0.001)
+    SpeedOfModBusReader(pipelined=True, latency=0.002, jitter=0.001)
+    SpeedOfRealTimeReader()
+    SpeedOfRTDEReader()
+    SpeedOfPickProgram()
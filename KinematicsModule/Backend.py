@@ -0,0 +1,140 @@
+import importlib
+from threading import Lock
+
+
+# Every function is looked up in the fastest backend that can be imported and
+# provides it: the compiled KinematicsLib.cKinematics, then the vectorised NumPy
+# implementation, then the pure Python implementation. Nothing is imported
+# before a function is first called, so importing this module is cheap even
+# when the extension was not built:
+#   from KinematicsModule.Backend import ForwardKinematics, activeBackend
+BACKENDS = (('compiled', 'KinematicsLib.cKinematics'),
+            ('numpy', 'KinematicsModule.NumpyKinematics'),
+            ('python', 'KinematicsModule.Kinematics'))
+
+# The functions the backends export. Looking up any other lowercase name
+# raises an AttributeError right away, instead of when it is first called.
+FUNCTIONS = frozenset((
+    'ForwardKinematics', 'ForwardKinematicsCython', 'ForwardKinematicsBatch', 'forwardKinematicsFrames',
+    'InverseKinematics', 'InverseKinematicsBatch', 'nearestSolution', 'Jacobian', 'JacobianBatch', 'predictPositions',
+    'toolTransform', 'interpolateToolPath', 'toolPathToJointPath',
+    'setObstacles', 'loadScene', 'reloadScene', 'detectCollision', 'detectPointCollision', 'collisionBatch',
+    'linkClearance', 'sweptPathClearance', 'sweptPathCollision',
+    'toolPositionDifference', 'jointAngleDifference', 'spatialDifference',
+    'convertRotations', 'composePoses', 'invertPose', 'applyPose', 'RPY2RotVec', 'RPY2RotVecRodr', 'RotVec2RPY',
+    'rpyToMatrix', 'matrixToRPY', 'rotvecToQuaternion', 'quaternionToRotvec', 'quaternionToMatrix', 'matrixToQuaternion'))
+
+MODULES = dict()  # The imported modules by backend name, None if the import failed
+IMPORT_LOCK = Lock()
+WARNED = set()  # The missing functions that were reported by providesOrWarn()
+
+
+def loadBackend(name):
+    r"""
+    Import a backend once, and return its module or None when it is not available.
+    """
+    with IMPORT_LOCK:
+        if name not in MODULES:
+            try:
+                MODULES[name] = importlib.import_module(dict(BACKENDS)[name])
+            except ImportError as e:
+                print("Kinematics backend {} is not available: {}".format(name, e))
+                MODULES[name] = None
+        return MODULES[name]
+
+
+def activeBackend():
+    r"""
+    Return the name of the fastest backend that is available: 'compiled',
+    'numpy' or 'python'. Functions it lacks come from the next backends.
+    """
+    for name, _ in BACKENDS:
+        if loadBackend(name) is not None:
+            return name
+    raise ImportError("None of the kinematics backends can be imported.")
+
+
+def backendOf(function_name):
+    r"""
+    Return the name of the backend that provides a function, or None.
+    """
+    for name, _ in BACKENDS:
+        module = loadBackend(name)
+        if module is not None and hasattr(module, function_name):
+            return name
+    return None
+
+
+def provides(function_name):
+    r"""
+    Test whether any backend provides a function, for instance the swept path
+    checks that only the compiled backend has.
+    """
+    return backendOf(function_name) is not None
+
+
+def providesOrWarn(function_name, consequence):
+    r"""
+    Test whether any backend provides a function, and print once per function
+    what is skipped when none does, so a check is not disabled silently.
+
+    Parameters:
+    ----------
+    function_name : str
+        The function, like 'sweptPathCollision'.
+    consequence : str
+        What is skipped without it, like "moves are not validated".
+    """
+    if provides(function_name):
+        return True
+    with IMPORT_LOCK:
+        if function_name in WARNED:
+            return False
+        WARNED.add(function_name)
+    print("Warning: no kinematics backend provides {}, so {}. Build the compiled backend with make in "
+          "KinematicsModule.".format(function_name, consequence))
+    return False
+
+
+def resolve(name):
+    r"""
+    Return the attribute of the fastest backend that provides it.
+    """
+    backend = backendOf(name)
+    if backend is None:
+        raise AttributeError("No kinematics backend provides {}, the active backend is {}.".format(name, activeBackend()))
+    return getattr(MODULES[backend], name)
+
+
+def lazyFunction(name):
+    r"""
+    Return a function that resolves the backend function on its first call and
+    calls it directly from then on.
+    """
+    function = None
+
+    def call(*args, **kwargs):
+        nonlocal function
+        if function is None:
+            function = resolve(name)
+        return function(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = "Call {} of the fastest kinematics backend that provides it.".format(name)
+    return call
+
+
+def __getattr__(name):
+    r"""
+    Constants like OBSTACLE_NAMES can change when the scene is reloaded, so they
+    are looked up on every access. The names in FUNCTIONS are lazy functions.
+    """
+    if name.startswith('_'):
+        raise AttributeError(name)
+    if name.isupper():
+        return resolve(name)
+    if name not in FUNCTIONS:
+        raise AttributeError("No kinematics backend exports {}.".format(name))
+    function = lazyFunction(name)
+    globals()[name] = function
+    return function
@@ -0,0 +1,273 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import numpy as np
+
+sys.path.append(os.getcwd())  # Append the current path tp PYTHONPATH to include parent directories
+from KinematicsModule import Kinematics  # Slow Python implementation
+from KinematicsLib import cKinematics  # Fast C and Cython implementation
+
+
+# Where the results of the last run and the baseline they are compared to are stored by default
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_results.json")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+BENCHMARKS = dict()
+
+
+def benchmark(name):
+    r"""
+    Register a benchmark under a name. The benchmark is a function that takes
+    the batch size n and prepares the input, and returns a function without
+    arguments that processes the n items once.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def jointAngles(n, seed=0):
+    return np.random.default_rng(seed).uniform(-np.pi, np.pi, (n, 6))
+
+
+def freeJointAngles(n, seed=0):
+    r"""
+    Joint angles around the initial position of the robot, which do not collide,
+    so the collision checks do not print.
+    """
+    initial = np.radians([61.42, -93.00, 94.65, -91.59, -90.0, 0.0])
+    return initial + np.random.default_rng(seed).uniform(-0.2, 0.2, (n, 6))
+
+
+def toolPositions(n, seed=1):
+    return np.random.default_rng(seed).uniform(-0.5, 0.5, (n, 6))
+
+
+@benchmark("python.ForwardKinematics")
+def pythonForwardKinematics(n):
+    joint_angles = jointAngles(n).tolist()
+    return lambda: [Kinematics.ForwardKinematics(angles) for angles in joint_angles]
+
+
+@benchmark("cython.ForwardKinematics")
+def cythonForwardKinematics(n):
+    joint_angles = jointAngles(n).tolist()
+    return lambda: [cKinematics.ForwardKinematicsCython(angles) for angles in joint_angles]
+
+
+@benchmark("c.ForwardKinematics")
+def cForwardKinematics(n):
+    joint_angles = jointAngles(n).tolist()
+    return lambda: [cKinematics.ForwardKinematics(angles) for angles in joint_angles]
+
+
+@benchmark("batch.ForwardKinematics")
+def batchForwardKinematics(n):
+    joint_angles = jointAngles(n)
+    positions = np.empty((n, 10, 3))
+    return lambda: cKinematics.ForwardKinematicsBatch(joint_angles, positions)
+
+
+@benchmark("batch.ForwardKinematics.threads")
+def threadedForwardKinematics(n):
+    joint_angles = jointAngles(n)
+    positions = np.empty((n, 10, 3))
+    return lambda: cKinematics.ForwardKinematicsBatch(joint_angles, positions, num_threads=os.cpu_count())
+
+
+@benchmark("batch.InverseKinematics")
+def batchInverseKinematics(n):
+    tool_positions = toolPositions(n)
+    solutions = np.empty((n, 8, 6))
+    return lambda: cKinematics.InverseKinematicsBatch(tool_positions, solutions)
+
+
+@benchmark("batch.Jacobian")
+def batchJacobian(n):
+    joint_angles = jointAngles(n)
+    jacobians = np.empty((n, 10, 3, 6))
+    return lambda: cKinematics.JacobianBatch(joint_angles, jacobians=jacobians)
+
+
+@benchmark("python.detectCollision")
+def pythonCollision(n):
+    positions = [Kinematics.ForwardKinematics(angles) for angles in freeJointAngles(n).tolist()]
+    return lambda: [Kinematics.detectCollision(position) for position in positions]
+
+
+@benchmark("cython.detectCollision")
+def cythonCollision(n):
+    positions = [cKinematics.ForwardKinematics(angles) for angles in freeJointAngles(n).tolist()]
+    return lambda: [cKinematics.detectCollision(position) for position in positions]
+
+
+@benchmark("batch.collisionBatch")
+def batchCollision(n):
+    joint_angles = freeJointAngles(n)
+    return lambda: cKinematics.collisionBatch(joint_angles)
+
+
+@benchmark("batch.sweptPathClearance")
+def batchClearance(n):
+    joint_angles = freeJointAngles(n)
+    return lambda: cKinematics.sweptPathClearance(joint_angles)
+
+
+@benchmark("batch.convertRotations")
+def batchRotations(n):
+    rotation_vectors = toolPositions(n)[:, 3:].copy()
+    return lambda: cKinematics.convertRotations(rotation_vectors, 'rotvec', 'rpy')
+
+
+@benchmark("cython.toolPositionDifference")
+def toolPositionDifference(n):
+    pairs = list(zip(toolPositions(n).tolist(), toolPositions(n, 2).tolist()))
+    return lambda: [cKinematics.toolPositionDifference(a, b) for a, b in pairs]
+
+
+@benchmark("cython.jointAngleDifference")
+def jointAngleDifference(n):
+    pairs = list(zip(jointAngles(n).tolist(), jointAngles(n, 2).tolist()))
+    return lambda: [cKinematics.jointAngleDifference(a, b) for a, b in pairs]
+
+
+@benchmark("cython.spatialDifference")
+def spatialDifference(n):
+    pairs = list(zip(toolPositions(n).tolist(), toolPositions(n, 2).tolist()))
+    return lambda: [cKinematics.spatialDifference(a, b) for a, b in pairs]
+
+
+def machineInfo():
+    r"""
+    Describe the machine the benchmarks run on, to tell whether two results
+    can be compared.
+    """
+    return {"node": platform.node(), "system": platform.platform(), "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(), "python": platform.python_version(), "numpy": np.__version__,
+            "cKinematics": os.path.basename(cKinematics.__file__)}
+
+
+def runBenchmark(name, n, repeats=5, min_time=0.1):
+    r"""
+    Time one benchmark at one batch size. Every repeat runs the batch as often
+    as fits in min_time seconds, at least once.
+
+    Returns:
+    ----------
+    result : dict
+        The best and the median number of items per second over the repeats.
+    """
+    run = BENCHMARKS[name](n)
+    run()  # Warm up
+    rates = list()
+    for _ in range(repeats):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            run()
+            count += 1
+            interval = time.perf_counter() - start
+            if interval >= min_time:
+                break
+        rates.append(count*n/interval)
+    return {"best": max(rates), "median": float(np.median(rates))}
+
+
+def runBenchmarks(names=None, sizes=(1, 100, 10000), repeats=5, min_time=0.1, verbose=True):
+    r"""
+    Run the benchmarks at every batch size.
+
+    Parameters:
+    ----------
+    names : list of str
+        The benchmarks to run, all of BENCHMARKS by default. A name that ends
+        with a dot selects every benchmark that starts with it, like "batch.".
+    sizes : list of int
+        The batch sizes.
+
+    Returns:
+    ----------
+    report : dict
+        The machine info, the time and the results by name and batch size, in
+        items per second. Can be saved with json.
+    """
+    if names:
+        unknown = [pattern for pattern in names if not any(name == pattern or (pattern.endswith('.') and name.startswith(pattern))
+                                                           for name in BENCHMARKS)]
+        if unknown:
+            raise ValueError("There are no benchmarks {}.".format(', '.join(unknown)))
+    names = list(BENCHMARKS) if not names else [name for pattern in names for name in BENCHMARKS
+                                                 if name == pattern or (pattern.endswith('.') and name.startswith(pattern))]
+    results = dict()
+    for name in names:
+        results[name] = dict()
+        for n in sizes:
+            results[name][str(n)] = runBenchmark(name, n, repeats, min_time)
+            if verbose:
+                print("{:<34} n = {:<8} {:>14.0f} items per second".format(name, n, results[name][str(n)]["best"]))
+    return {"machine": machineInfo(), "time": time.strftime("%Y-%m-%d %H:%M:%S"), "results": results}
+
+
+def compareToBaseline(report, baseline, tolerance=0.2, verbose=True):
+    r"""
+    Flag the benchmarks that became slower than the baseline by more than the
+    tolerance, comparing the best rates of the names and sizes both contain.
+
+    Returns:
+    ----------
+    regressions : list of tuple
+        The name, the batch size and the ratio of the new to the old rate of
+        every regression.
+    """
+    if verbose and report["machine"] != baseline["machine"]:
+        print("The baseline was measured on another machine or setup, compare with care.")
+    regressions = list()
+    for name, sizes in report["results"].items():
+        for n, result in sizes.items():
+            old = baseline["results"].get(name, dict()).get(n)
+            if old is None:
+                continue
+            ratio = result["best"] / old["best"]
+            if ratio < 1 - tolerance:
+                regressions.append((name, int(n), ratio))
+            if verbose:
+                print("{:<34} n = {:<8} {:>7.2f}x {}".format(name, n, ratio, "REGRESSION" if ratio < 1 - tolerance else ""))
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmark the kinematics implementations.")
+    parser.add_argument("names", nargs="*", help="The benchmarks to run, all by default: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1, 100, 10000], help="The batch sizes.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1, help="The least number of seconds per repeat.")
+    parser.add_argument("--output", default=RESULTS_PATH, help="Where to save the results as json.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="The results to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="The fraction a benchmark may slow down.")
+    arguments = parser.parse_args(arguments)
+
+    report = runBenchmarks(arguments.names, arguments.sizes, arguments.repeats, arguments.min_time)
+    with open(arguments.output, 'w') as file:
+        json.dump(report, file, indent=4)
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as file:
+            json.dump(report, file, indent=4)
+        return 0
+    if not os.path.exists(arguments.baseline):
+        print("No baseline at {}, store one with --save-baseline.".format(arguments.baseline))
+        return 0
+    with open(arguments.baseline) as file:
+        baseline = json.load(file)
+    regressions = compareToBaseline(report, baseline, arguments.tolerance)
+    if regressions:
+        print("{} benchmarks became slower than the baseline.".format(len(regressions)))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+import os
+import json
+import time
+import hashlib
+import numpy as np
+
+import sys
+sys.path.append(os.getcwd())  # Append the current path tp PYTHONPATH to include parent directories
+from KinematicsLib import cKinematics
+from KinematicsLib.cKinematics import collisionBatch, PackedCells
+
+
+# Where the table of the robot waypoints is stored: a bit file and a json header
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "collision_table")
+
+
+def sceneDigest(path=None):
+    r"""
+    Return the sha1 of a scene file, to recognise the scene a table was built for.
+    """
+    with open(cKinematics.SCENE_FILE if path is None else path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+class CollisionTable:
+    r"""
+    Class used to answer collision queries in joint space with a lookup instead
+    of forward kinematics. A box of joint space around the configurations the
+    robot works in is divided into cells, and every cell is stored with 2 bits:
+    FREE if the arm is free at all corners of the cell, COLLIDING if it collides
+    at all corners, and MIXED otherwise. MIXED cells are grown by one cell, so
+    a cell is only FREE when its neighbours have no collision in any corner
+    either. The last joint only rotates the tool flange and is not part of the
+    table, and neither is the tool. Configurations outside the box are MIXED.
+
+    The bits are memory-mapped, so loading a table is cheap and the pages are
+    read from disk when they are needed.
+
+    Attributes:
+    -------
+    FREE, COLLIDING, MIXED : int
+        The codes of a cell.
+    JOINTS : int
+        The number of joints in the table.
+    Lows : np.array
+        The lower corner of the box, in radians.
+    Steps : np.array
+        The size of a cell along every joint, in radians.
+    Shape : tuple of int
+        The number of cells along every joint.
+    Strides : tuple of int
+        The number of cells between two neighbours along every joint.
+    Bits : np.memmap
+        The packed codes, 4 cells per byte, in C order.
+    Cells : PackedCells
+        The grid and the Bits in C, for a fast lookup().
+    Scene : str
+        The sha1 of the scene file the table was built for.
+    SceneModified : float
+        The modification time of the loaded scene the table was last verified for.
+    """
+
+    __slots__ = ('Lows', 'Steps', 'Shape', 'Strides', 'Bits', 'Cells', 'Scene', 'SceneModified')
+
+    FREE = 0
+    COLLIDING = 1
+    MIXED = 2
+    JOINTS = 5
+
+    def __init__(self, lows, steps, shape, bits, scene):
+        self.Lows = np.asarray(lows, np.float64)
+        self.Steps = np.asarray(steps, np.float64)
+        self.Shape = tuple(int(n) for n in shape)
+        self.Strides = tuple(int(np.prod(self.Shape[i + 1:])) for i in range(self.JOINTS))
+        self.Bits = bits
+        self.Cells = PackedCells(self.Lows, self.Steps, self.Shape, bits)
+        self.Scene = scene
+        self.SceneModified = None
+
+    def __repr__(self):
+        return "CollisionTable {} cells, {:.1f} MB".format('x'.join(map(str, self.Shape)), self.Bits.nbytes / 1e6)
+
+    def __len__(self):
+        return int(np.prod(self.Shape))
+
+    def isCurrent(self):
+        r"""
+        Test if the table was built for the scene that is loaded now. The scene
+        file is only hashed again after it was reloaded.
+        """
+        if self.SceneModified != cKinematics.SCENE_MODIFIED:
+            if cKinematics.SCENE_FILE is None or sceneDigest() != self.Scene:
+                return False
+            self.SceneModified = cKinematics.SCENE_MODIFIED
+        return True
+
+    def lookup(self, joint_angles):
+        r"""
+        Return the code of the cell that contains a configuration, in O(1).
+
+        Parameters:
+        ----------
+        joint_angles : list
+            The six joint angles, in radians. The last one is ignored.
+
+        Returns:
+        ----------
+        code : int
+            FREE, COLLIDING or MIXED. Outside the table the code is MIXED.
+        """
+        return self.Cells.code(joint_angles, self.MIXED)
+
+    def lookupBatch(self, joint_angles):
+        r"""
+        Return the codes of the cells of many configurations, as an N uint8 array.
+        """
+        joint_angles = np.asarray(joint_angles, np.float64).reshape(-1, 6)[:, :self.JOINTS]
+        cells = np.floor((joint_angles - self.Lows) / self.Steps).astype(np.int64)
+        inside = ((cells >= 0) & (cells < self.Shape)).all(axis=1)
+        index = (np.where(inside[:, None], cells, 0) * self.Strides).sum(axis=1)
+        codes = (self.Bits[index >> 2] >> ((index & 3) << 1).astype(np.uint8)) & 3
+        codes[~inside] = self.MIXED
+        return codes.astype(np.uint8)
+
+    @classmethod
+    def load(cls, path=TABLE_PATH):
+        r"""
+        Memory-map a table that was saved by build().
+        """
+        with open(path + ".json") as file:
+            header = json.load(file)
+        bits = np.memmap(path + ".bits", np.uint8, mode='r', shape=(header["bytes"],))
+        return cls(header["lows"], header["steps"], header["shape"], bits, header["scene"])
+
+    @classmethod
+    def build(cls, waypoints, path=TABLE_PATH, resolution=0.05, padding=0.2, num_threads=1, verbose=True):
+        r"""
+        Build the table for the box around a number of configurations and save
+        it. Every corner of every cell is tested with collisionBatch(), which
+        takes about 0.3 us per corner.
+
+        Parameters:
+        ----------
+        waypoints : list
+            The configurations the box should contain, as lists of six joint angles.
+        path : str
+            The path of the table, without extension.
+        resolution : float
+            The largest size of a cell, in radians.
+        padding : float
+            The margin around the waypoints, in radians.
+        num_threads : int
+            The number of OpenMP threads for collisionBatch().
+
+        Returns:
+        ----------
+        table : CollisionTable
+            The memory-mapped table that was saved.
+        """
+        start_time = time.time()
+        waypoints = np.asarray(waypoints, np.float64).reshape(-1, 6)[:, :cls.JOINTS]
+        lows = waypoints.min(axis=0) - padding
+        highs = waypoints.max(axis=0) + padding
+        shape = np.maximum(np.ceil((highs - lows) / resolution).astype(np.int64), 1)
+        steps = (highs - lows) / shape
+
+        # Test every corner, one slice of the first joint at a time
+        corners = tuple(int(n) + 1 for n in shape)
+        colliding = np.empty(corners, np.bool_)
+        grid = np.meshgrid(*[lows[j] + steps[j] * np.arange(corners[j]) for j in range(1, cls.JOINTS)], indexing='ij')
+        joint_angles = np.zeros((grid[0].size, 6), np.float64)
+        for j in range(1, cls.JOINTS):
+            joint_angles[:, j] = grid[j - 1].ravel()
+        for i in range(corners[0]):
+            joint_angles[:, 0] = lows[0] + steps[0] * i
+            colliding[i] = (collisionBatch(joint_angles, num_threads=num_threads) > 0).reshape(corners[1:])
+
+        # A cell is free or colliding if all its corners agree
+        free, full = np.ones(tuple(shape), np.bool_), np.ones(tuple(shape), np.bool_)
+        for corner in np.ndindex(*(2,) * cls.JOINTS):
+            values = colliding[tuple(slice(offset, offset + n) for offset, n in zip(corner, shape))]
+            free &= ~values
+            full &= values
+        mixed = ~(free | full)
+
+        # Grow the mixed cells by one cell, to cover collisions between the corners
+        grown = mixed.copy()
+        for j in range(cls.JOINTS):
+            before, after = [slice(None)] * cls.JOINTS, [slice(None)] * cls.JOINTS
+            before[j], after[j] = slice(None, -1), slice(1, None)
+            grown[tuple(before)] |= mixed[tuple(after)]
+            grown[tuple(after)] |= mixed[tuple(before)]
+        codes = np.where(grown, cls.MIXED, np.where(full, cls.COLLIDING, cls.FREE)).astype(np.uint8).ravel()
+
+        # Pack 4 cells in every byte
+        codes = np.concatenate((codes, np.zeros(-len(codes) % 4, np.uint8))).reshape(-1, 4)
+        packed = codes[:, 0] | (codes[:, 1] << 2) | (codes[:, 2] << 4) | (codes[:, 3] << 6)
+        packed.tofile(path + ".bits")
+        with open(path + ".json", 'w') as file:
+            json.dump({"lows": lows.tolist(), "steps": steps.tolist(), "shape": shape.tolist(), "bytes": len(packed),
+                       "scene": sceneDigest()}, file, indent=4)
+
+        table = cls.load(path)
+        if verbose:
+            counts = np.bincount(codes.ravel()[:len(table)], minlength=3)
+            print("Built the {} in {:.1f} seconds: {:.1%} free, {:.1%} colliding, {:.1%} mixed.".format(
+                table, time.time() - start_time, *(counts / len(table))))
+        return table
+
+
+if __name__ == '__main__':
+    # The configurations of the Robot class, in degrees
+    waypoints = [[61.42, -93.00, 94.65, -91.59, -90.0, 0.0],   # JointAngleInit
+                 [87.28, -74.56, 113.86, -129.29, -89.91, -2.73],   # JointAngleDropObject
+                 [4.27, -89.63, 101.81, -103.13, 97.65, 90.0]]  # JointAngleReadObject
+    table = CollisionTable.build(np.radians(waypoints), num_threads=os.cpu_count())
+    print(table.lookupBatch(np.radians(waypoints)))
@@ -1,7 +1,10 @@
 import numpy as np
 import time
 
-import cv2  # For Rodrigues
+from KinematicsModule.Scene import readScene, pointCollision
+
+
+SCENE = readScene()
 
 
 def T(theta, d, r, alpha):
@@ -96,8 +99,8 @@ def detectCollision(positions):
     """
     Detect whether any of the spatial positions computed by the forward kinematics
     is out of bounds. This prevents the robot arm from bumping into the container,
-    or into the cameras or the screen. Add a margin e for security.
-    Replaced by a faster Cython implementation.
+    or into the cameras or the screen. The obstacles and their margins come from
+    the scene file. Replaced by a faster Cython implementation.
 
     Parameters:
     ----------
@@ -111,36 +114,10 @@ def detectCollision(positions):
     """
 
     X, Y, Z = positions
-    X = np.array(X[2:])  # We don't need all the positions
-    Y = np.array(Y[2:])
-    Z = np.array(Z[2:])
-
-    # Are we inside of the box?
-    e = 0.05
-    BOX_X_MIN = -0.832
-    BOX_X_MAX =  0.490
-    BOX_Y_MIN = -0.713
-    BOX_Y_MAX =  0.265
-    BOX_Z_MIN =  0.000
-    if not (((BOX_X_MIN + e < X) & (X < BOX_X_MAX - e)).all() and ((BOX_Y_MIN + e < Y) & (Y < BOX_Y_MAX - e)).all() and (BOX_Z_MIN < Z).all()):
-        print("box")
-        return True
-    # Are we bumping into the camera and the light?
-    CAM_X_MIN = -0.568
-    CAM_X_MAX = -0.364
-    CAM_Y_MIN = -0.266
-    CAM_Y_MAX =  0.031
-    CAM_Z_MIN =  0.765
-    if ((CAM_X_MIN + e < X) & (X < CAM_X_MAX - e)).any() and ((CAM_Y_MIN + e < Y) & (Y < CAM_Y_MAX - e)).any() and (CAM_Z_MIN + e > Z).any():
-        print("camera")
-        return True
-    # Are we bumping into the screen?
-    e = 0.01
-    SCR_X_MAX = -0.182
-    SCR_Y_MAX = -0.520
-    SCR_Z_MIN =  0.375
-    if (X < SCR_X_MAX + e).any() and (Y < SCR_Y_MAX + e).any() and (Z < SCR_Z_MIN + e).any():
-        print("screen")
+    points = np.array([X[2:], Y[2:], Z[2:]]).T  # We don't need all the positions
+    obstacle = pointCollision(points, SCENE)
+    if obstacle is not None:
+        print(obstacle.Name)
         return True
     return False
 
@@ -190,40 +167,36 @@ def RPY2RotVecRodr(roll, pitch, yaw):
 
     RotMat = yawMatrix.dot(pitchMatrix.dot(rollMatrix))
 
-    rot = np.zeros((3, 1))
-    cv2.Rodrigues(RotMat, rot)
-
-    rx = rot[0, 0]
-    ry = rot[1, 0]
-    rz = rot[2, 0]
+    # The inverse of the Rodrigues formula, from the largest of the trace and the diagonal
+    trace = np.trace(RotMat)
+    largest = np.argmax([trace, RotMat[0, 0], RotMat[1, 1], RotMat[2, 2]])
+    if largest == 0:
+        quaternion = np.array([1 + trace, RotMat[2, 1] - RotMat[1, 2], RotMat[0, 2] - RotMat[2, 0], RotMat[1, 0] - RotMat[0, 1]])
+    else:
+        i = largest - 1
+        j, k = (i + 1) % 3, (i + 2) % 3
+        quaternion = np.zeros(4)
+        quaternion[0] = RotMat[k, j] - RotMat[j, k]
+        quaternion[1 + i] = 1 + 2*RotMat[i, i] - trace
+        quaternion[1 + j] = RotMat[j, i] + RotMat[i, j]
+        quaternion[1 + k] = RotMat[k, i] + RotMat[i, k]
+    if quaternion[0] < 0:
+        quaternion = -quaternion
+    norm = np.linalg.norm(quaternion[1:])
+    if norm < 1e-12:
+        return 0.0, 0.0, 0.0
+    rx, ry, rz = quaternion[1:] * 2 * np.arctan2(norm, quaternion[0]) / norm
     return rx, ry, rz
 
 
-def RPY2RotVec(gamma, beta, alpha):
-    # See https://forum.universal-robots.com/t/pose-rotation-order/223/2
-    ca = np.cos(alpha)
-    cb = np.cos(beta)
-    cg = np.cos(gamma)
-    sa = np.sin(alpha)
-    sb = np.sin(beta)
-    sg = np.sin(gamma)
-
-    r11 = ca * cb
-    r12 = ca * sb * sg - sa * cg
-    r13 = ca * sb * cg + sa * sg
-    r21 = sa * cb
-    r22 = sa * sb * sg + ca * cg
-    r23 = sa * sb * cg - ca * sg
-    r31 = -sb
-    r32 = cb * sg
-    r33 = cb * cg
-
-    theta = np.arccos((r11 + r22 + r33 - 1) / 2)
-    sth = np.sin(theta)
-    kx = (r32 - r23) / (2 * sth)
-    ky = (r13 - r31) / (2 * sth)
-    kz = (r21 - r12) / (2 * sth)
-    return theta * kx, theta * ky, theta * kz
+def RPY2RotVec(roll, pitch, yaw):
+    """
+    Convert roll, pitch, yaw angles to a rotation vector, like the other
+    backends. The formula of the forum divides by the sine of the angle,
+    which loses the axis for rotations close to pi, such as a tool pointing
+    down, so the conversion goes through RPY2RotVecRodr().
+    """
+    return RPY2RotVecRodr(roll, pitch, yaw)
 
 
 def RotVec2RPY(rx, ry, rz):
@@ -1,11 +1,19 @@
-from libc.math cimport sin, cos, sqrt, fabs
-from libc.stdio cimport printf
-from libc.stdlib cimport calloc, free
+cimport cython
+from cython.parallel cimport prange, parallel
+from libc.math cimport sin, cos, sqrt, fabs, floor, atan2, acos, NAN, M_PI
+from libc.stdlib cimport calloc, malloc, free
 
-cdef extern from "forwardkinematics.h":
-    double *T_c(double, double, double, double)
+import os
+import numpy as np
+
+from KinematicsModule.Scene import readScene, SCENE_PATH
+
+cdef extern from "forwardkinematics.h" nogil:
     void dot_c(double*, double*)
     double d_angle(double, double)
+    void forwardkinematics_c(const double*, double*, double*)
+    void forwardkinematics_frames(const double*, double*, double*, double*)
+    double UR5_D1, UR5_D4, UR5_D5, UR5_D6, UR5_D7, UR5_A1, UR5_A2, UR5_A4
 
 
 cdef double *T(double theta, double d, double r, double alpha):
@@ -89,53 +97,6 @@ cdef void dot(double *A, double *B):
     free(result)
 
 
-cdef void printarray(double* array):
-    """
-    Print the contents of 1 x 16 array for inspection.
-    """
-    cdef int i
-    printf("Array = \n[")
-    for i in range(4):
-        if i != 0:
-            printf(" ")
-        printf("[")
-
-        for j in range(4):
-            printf("%10.3lf", array[i*4 + j])
-            if j < 3:
-                printf(" ")
-
-        printf("]")
-        if i != 3:
-            printf("\n")
-    printf("]\n")
-
-
-cdef void test():
-    """
-    Test whether matrix multiplication in dot() is correct.
-    """
-    cdef double * test1 = < double * > calloc(16, sizeof(double))
-    test1[0] = -2.1
-    test1[5] = -2.1
-    test1[10] = -2.1
-    test1[15] = -2.1
-
-    cdef double *test2 = <double*> calloc(16, sizeof(double))
-    cdef int i
-    for i in range(16):
-        test2[i] = i+1
-
-    printarray(test2)
-    dot(test1, test2)
-    printarray(test2)
-    # Result should be:
-    # array([[ -2.1,  -4.2,  -6.3,  -8.4],
-    #        [-10.5, -12.6, -14.7, -16.8],
-    #        [-18.9, -21. , -23.1, -25.2],
-    #        [-27.3, -29.4, -31.5, -33.6]])
-
-
 cdef forwardkinematics(joint_angles, tool_position=None):
     """
     Compute the forward kinematics of the UR5 robot arm according to the
@@ -203,8 +164,8 @@ cdef forwardkinematics(joint_angles, tool_position=None):
 cdef forwardkinematics_fromc(joint_angles, tool_position=None):
     """
     Compute the forward kinematics of the UR5 robot arm according to the
-    Denavit-Hartenberg convention. This requires a matrix per joint.
-    Fast C implementation.
+    Denavit-Hartenberg convention. Fast C implementation: the fused kernel in
+    forwardkinematics.h writes all positions into a buffer on the stack.
 
     Parameters:
     ----------
@@ -220,40 +181,16 @@ cdef forwardkinematics_fromc(joint_angles, tool_position=None):
         The lists containing all x-, y- and z-positions of all joints.
     """
 
-    cdef double pihalf = 1.57079632679
-    cdef double a, b, c, d, e, f, x, y, z
-    a, b, c, d, e, f = joint_angles
-
-    # The joint parameters a, d and alpha can be found here:
-    # https://www.universal-robots.com/articles/ur-articles/parameters-for-calculations-of-kinematics-and-dynamics/
-    cdef double *base     = <double*> T_c(a,  0.089159, -0.134,    pihalf)
-    cdef double *shoulder = <double*> T_c(b,  0,        -0.425,    0)
-    cdef double *elbow    = <double*> T_c(c, -0.119,     0,        0)
-    cdef double *elbowend = <double*> T_c(0,  0,        -0.39225,  0)
-    cdef double *wrist1   = <double*> T_c(d,  0.09475,   0,        pihalf)
-    cdef double *wrist2   = <double*> T_c(e,  0.09475,   0,       -pihalf)
-    cdef double *wrist3   = <double*> T_c(f,  0.0815,    0,        0)
-
-    base[3], base[7] = -base[7], base[3]
-    dot_c(base, shoulder)
-    dot_c(shoulder, elbow)
-    dot_c(elbow, elbowend)
-    dot_c(elbowend, wrist1)
-    dot_c(wrist1, wrist2)
-    dot_c(wrist2, wrist3)
+    cdef double angles[6]
+    cdef double positions[27]
+    cdef double x, y, z
+    angles[0], angles[1], angles[2], angles[3], angles[4], angles[5] = joint_angles
+    forwardkinematics_c(angles, positions, NULL)
 
     cdef list X, Y, Z
-    X = [0, 0, base[3], shoulder[3], elbow[3], elbowend[3], wrist1[3], wrist2[3], wrist3[3]]
-    Y = [0, 0, base[7], shoulder[7], elbow[7], elbowend[7], wrist1[7], wrist2[7], wrist3[7]]
-    Z = [0, base[11], base[11], shoulder[11], elbow[11], elbowend[11], wrist1[11], wrist2[11], wrist3[11]]
-
-    free(base)
-    free(shoulder)
-    free(elbow)
-    free(elbowend)
-    free(wrist1)
-    free(wrist2)
-    free(wrist3)
+    X = [positions[i] for i in range(0, 27, 3)]
+    Y = [positions[i] for i in range(1, 27, 3)]
+    Z = [positions[i] for i in range(2, 27, 3)]
 
     if tool_position is not None:
         x, y, z = tool_position
@@ -271,12 +208,1108 @@ cpdef ForwardKinematics(joint_angles, tool_position=None):
     return forwardkinematics_fromc(joint_angles, tool_position=tool_position)
 
 
+cpdef ForwardKinematicsCython(joint_angles, tool_position=None):
+    """
+    Call the Cython implementation with a matrix per joint, which is kept to
+    compare the C implementation against in KinematicsModule/Benchmarks.py.
+    """
+    return forwardkinematics(joint_angles, tool_position=tool_position)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef ForwardKinematicsBatch(double[:, ::1] joint_angles, double[:, :, ::1] positions=None, double[:, ::1] tool_positions=None, int num_threads=1):
+    """
+    Compute the forward kinematics of many configurations at once. The loop
+    runs without the GIL, and in parallel over num_threads threads when the
+    module was compiled with OpenMP (see setup.py).
+
+    Parameters:
+    ----------
+    joint_angles : np.array
+        The N x 6 C-contiguous float64 array of joint angles.
+    positions : np.array
+        The preallocated N x 10 x 3 float64 output array. Allocated when None.
+    tool_positions : np.array
+        The N x 6 measured tool positions, whose x, y and z fill the last row.
+        Optional, the last row repeats the end of the last wrist otherwise.
+    num_threads : int
+        The number of OpenMP threads.
+
+    Returns:
+    ----------
+    positions : np.array
+        The N x 10 x 3 array with the x-, y- and z-position of all joints and
+        the tool, in the same order as ForwardKinematics().
+    """
+
+    cdef Py_ssize_t n = joint_angles.shape[0]
+    if joint_angles.shape[1] != 6:
+        raise ValueError("joint_angles should have shape (N, 6), not {}.".format((joint_angles.shape[0], joint_angles.shape[1])))
+    if positions is None:
+        positions = np.empty((n, 10, 3), np.float64)
+    elif positions.shape[0] != n or positions.shape[1] != 10 or positions.shape[2] != 3:
+        raise ValueError("positions should have shape ({}, 10, 3).".format(n))
+    if tool_positions is not None and (tool_positions.shape[0] != n or tool_positions.shape[1] < 3):
+        raise ValueError("tool_positions should have shape ({}, 6).".format(n))
+
+    cdef bint has_tool = tool_positions is not None
+    cdef int threads = max(num_threads, 1)
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=threads, schedule='static'):
+        forwardkinematics_c(&joint_angles[i, 0], &positions[i, 0, 0], NULL)
+        if has_tool:
+            positions[i, 9, 0] = tool_positions[i, 0]
+            positions[i, 9, 1] = tool_positions[i, 1]
+            positions[i, 9, 2] = tool_positions[i, 2]
+        else:
+            positions[i, 9, 0] = positions[i, 8, 0]
+            positions[i, 9, 1] = positions[i, 8, 1]
+            positions[i, 9, 2] = positions[i, 8, 2]
+    return np.asarray(positions)
+
+
+cdef void dh_matrix(double theta, double d, double a, double cos_a, double sin_a, double *T) noexcept nogil:
+    """
+    Fill T with the 4 x 4 Denavit-Hartenberg matrix of one joint, like T(),
+    but without allocating.
+    """
+    cdef double cos_t = cos(theta)
+    cdef double sin_t = sin(theta)
+    T[0], T[1], T[2], T[3] = cos_t, -sin_t*cos_a,  sin_t*sin_a, a*cos_t
+    T[4], T[5], T[6], T[7] = sin_t,  cos_t*cos_a, -cos_t*sin_a, a*sin_t
+    T[8], T[9], T[10], T[11] = 0, sin_a, cos_a, d
+    T[12], T[13], T[14], T[15] = 0, 0, 0, 1
+
+
+cdef void invert_rigid(const double *T, double *result) noexcept nogil:
+    """
+    Invert a 4 x 4 rotation and translation matrix: the transposed rotation
+    and the translation rotated back.
+    """
+    cdef int i, j
+    for i in range(3):
+        for j in range(3):
+            result[4*i + j] = T[4*j + i]
+        result[4*i + 3] = -(T[i]*T[3] + T[4 + i]*T[7] + T[8 + i]*T[11])
+    result[12], result[13], result[14], result[15] = 0, 0, 0, 1
+
+
+# The representations of a rotation that convertRotations() converts between:
+# roll, pitch and yaw angles, rotation vectors like the tool positions of the
+# robot, quaternions w, x, y, z and rotation matrices
+cdef enum:
+    ROTATION_RPY, ROTATION_VECTOR, ROTATION_QUATERNION, ROTATION_MATRIX
+ROTATIONS = {'rpy': (ROTATION_RPY, (3,)), 'rotvec': (ROTATION_VECTOR, (3,)),
+             'quaternion': (ROTATION_QUATERNION, (4,)), 'matrix': (ROTATION_MATRIX, (3, 3))}
+
+
+cdef void rpy_to_matrix(const double *rpy, double *R, int stride) noexcept nogil:
+    """
+    Fill the rotation matrix R of the roll, pitch and yaw angles, which rotate
+    around the fixed x, y and z axes in that order: R = Rz(yaw) Ry(pitch) Rx(roll).
+    Rows of R are stride values apart, 3 for a rotation and 4 for a 4 x 4 matrix.
+    """
+    cdef double cr = cos(rpy[0]), sr = sin(rpy[0])
+    cdef double cp = cos(rpy[1]), sp = sin(rpy[1])
+    cdef double cy = cos(rpy[2]), sy = sin(rpy[2])
+    R[0], R[1], R[2] = cy*cp, cy*sp*sr - sy*cr, cy*sp*cr + sy*sr
+    R[stride], R[stride + 1], R[stride + 2] = sy*cp, sy*sp*sr + cy*cr, sy*sp*cr - cy*sr
+    R[2*stride], R[2*stride + 1], R[2*stride + 2] = -sp, cp*sr, cp*cr
+
+
+cdef void matrix_to_rpy(const double *R, double *rpy, int stride) noexcept nogil:
+    """
+    Compute the roll, pitch and yaw angles of a rotation matrix. At a pitch of
+    plus or minus pi/2 only the sum or difference of roll and yaw is defined,
+    and the yaw is chosen 0.
+    """
+    cdef double cp = sqrt(R[0]*R[0] + R[stride]*R[stride])
+    rpy[1] = atan2(-R[2*stride], cp)
+    if cp > 1e-9:
+        rpy[0] = atan2(R[2*stride + 1], R[2*stride + 2])
+        rpy[2] = atan2(R[stride], R[0])
+    else:
+        rpy[0] = atan2(-R[stride + 2], R[stride + 1])
+        rpy[2] = 0
+
+
+cdef void rotvec_to_matrix(const double *v, double *R, int stride) noexcept nogil:
+    """
+    Fill the rotation matrix R of a rotation vector, through the Rodrigues formula.
+    """
+    cdef double angle = sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2])
+    cdef double x = 0, y = 0, z = 0, c = cos(angle), s = sin(angle), t = 1 - cos(angle)
+    if angle > 1e-12:
+        x, y, z = v[0]/angle, v[1]/angle, v[2]/angle
+    R[0], R[1], R[2] = t*x*x + c, t*x*y - s*z, t*x*z + s*y
+    R[stride], R[stride + 1], R[stride + 2] = t*x*y + s*z, t*y*y + c, t*y*z - s*x
+    R[2*stride], R[2*stride + 1], R[2*stride + 2] = t*x*z - s*y, t*y*z + s*x, t*z*z + c
+
+
+cdef void quaternion_to_matrix(const double *q, double *R, int stride) noexcept nogil:
+    """
+    Fill the rotation matrix R of a quaternion, which does not need to be normalised.
+    """
+    cdef double w = q[0], x = q[1], y = q[2], z = q[3]
+    cdef double n = w*w + x*x + y*y + z*z
+    cdef double f = 2/n if n > 1e-24 else 0
+    R[0], R[1], R[2] = 1 - f*(y*y + z*z), f*(x*y - w*z), f*(x*z + w*y)
+    R[stride], R[stride + 1], R[stride + 2] = f*(x*y + w*z), 1 - f*(x*x + z*z), f*(y*z - w*x)
+    R[2*stride], R[2*stride + 1], R[2*stride + 2] = f*(x*z - w*y), f*(y*z + w*x), 1 - f*(x*x + y*y)
+
+
+cdef void matrix_to_quaternion(const double *R, double *q, int stride) noexcept nogil:
+    """
+    Compute the unit quaternion of a rotation matrix, from the largest of the
+    diagonal and the trace to stay accurate at all angles. The w component is
+    made positive, so the rotation angle lies within [0, pi].
+    """
+    cdef double r00 = R[0], r11 = R[stride + 1], r22 = R[2*stride + 2]
+    cdef double trace = r00 + r11 + r22, f
+    if trace > r00 and trace > r11 and trace > r22:
+        f = 0.5/sqrt(1 + trace)
+        q[0], q[1], q[2], q[3] = 0.25/f, (R[2*stride + 1] - R[stride + 2])*f, (R[2] - R[2*stride])*f, (R[stride] - R[1])*f
+    elif r00 > r11 and r00 > r22:
+        f = 0.5/sqrt(1 + r00 - r11 - r22)
+        q[0], q[1], q[2], q[3] = (R[2*stride + 1] - R[stride + 2])*f, 0.25/f, (R[1] + R[stride])*f, (R[2] + R[2*stride])*f
+    elif r11 > r22:
+        f = 0.5/sqrt(1 + r11 - r00 - r22)
+        q[0], q[1], q[2], q[3] = (R[2] - R[2*stride])*f, (R[1] + R[stride])*f, 0.25/f, (R[stride + 2] + R[2*stride + 1])*f
+    else:
+        f = 0.5/sqrt(1 + r22 - r00 - r11)
+        q[0], q[1], q[2], q[3] = (R[stride] - R[1])*f, (R[2] + R[2*stride])*f, (R[stride + 2] + R[2*stride + 1])*f, 0.25/f
+    if q[0] < 0:
+        q[0], q[1], q[2], q[3] = -q[0], -q[1], -q[2], -q[3]
+
+
+cdef void rotvec_to_quaternion(const double *v, double *q) noexcept nogil:
+    """
+    Compute the unit quaternion of a rotation vector.
+    """
+    cdef double angle = sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2])
+    cdef double f = sin(angle/2)/angle if angle > 1e-12 else 0.5
+    q[0], q[1], q[2], q[3] = cos(angle/2), f*v[0], f*v[1], f*v[2]
+
+
+cdef void quaternion_to_rotvec(const double *q, double *v) noexcept nogil:
+    """
+    Compute the rotation vector of a quaternion, with an angle within [0, pi].
+    """
+    cdef double w = q[0], x = q[1], y = q[2], z = q[3]
+    if w < 0:
+        w, x, y, z = -w, -x, -y, -z
+    cdef double n = sqrt(x*x + y*y + z*z)
+    cdef double f = 2*atan2(n, w)/n if n > 1e-12 else (2/w if w > 0 else 0)
+    v[0], v[1], v[2] = f*x, f*y, f*z
+
+
+cdef void matrix_to_rotvec(const double *R, double *v, int stride) noexcept nogil:
+    """
+    Compute the rotation vector of a rotation matrix, with an angle within [0, pi].
+    """
+    cdef double q[4]
+    matrix_to_quaternion(R, q, stride)
+    quaternion_to_rotvec(q, v)
+
+
+cdef void convert_rotation(int source, int target, const double *rotation, double *result) noexcept nogil:
+    """
+    Convert one rotation between two representations, through the rotation
+    matrix unless there is a direct conversion.
+    """
+    cdef double R[9]
+    cdef int i
+    if source == target:
+        for i in range(9 if source == ROTATION_MATRIX else 4 if source == ROTATION_QUATERNION else 3):
+            result[i] = rotation[i]
+        return
+    if source == ROTATION_VECTOR and target == ROTATION_QUATERNION:
+        rotvec_to_quaternion(rotation, result)
+        return
+    if source == ROTATION_QUATERNION and target == ROTATION_VECTOR:
+        quaternion_to_rotvec(rotation, result)
+        return
+
+    if source == ROTATION_RPY:
+        rpy_to_matrix(rotation, R, 3)
+    elif source == ROTATION_VECTOR:
+        rotvec_to_matrix(rotation, R, 3)
+    elif source == ROTATION_QUATERNION:
+        quaternion_to_matrix(rotation, R, 3)
+    else:
+        for i in range(9):
+            R[i] = rotation[i]
+
+    if target == ROTATION_RPY:
+        matrix_to_rpy(R, result, 3)
+    elif target == ROTATION_VECTOR:
+        matrix_to_rotvec(R, result, 3)
+    elif target == ROTATION_QUATERNION:
+        matrix_to_quaternion(R, result, 3)
+    else:
+        for i in range(9):
+            result[i] = R[i]
+
+
+cdef void pose_matrix(const double *pose, double *T) noexcept nogil:
+    """
+    Fill T with the 4 x 4 matrix of a tool pose x, y, z, rx, ry, rz, where the
+    rotation is a rotation vector, through the Rodrigues formula.
+    """
+    rotvec_to_matrix(pose + 3, T, 4)
+    T[3], T[7], T[11] = pose[0], pose[1], pose[2]
+    T[12], T[13], T[14], T[15] = 0, 0, 0, 1
+
+
+cdef void matrix_pose(const double *T, double *pose) noexcept nogil:
+    """
+    Compute the tool pose x, y, z, rx, ry, rz of a 4 x 4 matrix.
+    """
+    pose[0], pose[1], pose[2] = T[3], T[7], T[11]
+    matrix_to_rotvec(T, pose + 3, 4)
+
+
+cdef inline double wrap_angle(double angle) noexcept nogil:
+    """
+    Wrap an angle to the interval (-pi, pi].
+    """
+    while angle > M_PI:
+        angle -= 2*M_PI
+    while angle <= -M_PI:
+        angle += 2*M_PI
+    return angle
+
+
+cdef int inversekinematics_c(const double *pose, double *solutions) noexcept nogil:
+    """
+    Compute all 8 configurations for a tool position with a rotation vector,
+    see inversekinematics_matrix_c().
+    """
+    cdef double T06[16]
+    pose_matrix(pose, T06)
+    return inversekinematics_matrix_c(T06, solutions)
+
+
+cdef int inversekinematics_matrix_c(const double *T06, double *solutions) noexcept nogil:
+    """
+    Compute all 8 joint configurations of the UR5 that put the end of the last
+    wrist at the given pose, in closed form. The chain of forwardkinematics_c()
+    is the standard UR DH chain with the offsets of the base, the elbow and the
+    first wrist summed into d4. Solutions that do not exist are filled with NaN.
+    The order is shoulder left/right, then wrist up/down, then elbow up/down.
+    Test the returned bits instead of the NaN: -ffast-math optimises isnan() away.
+
+    Parameters:
+    ----------
+    T06 : c double array pointer
+        The 4 x 4 rotation and translation of the wrist end, in the base frame.
+    solutions : c double array pointer
+        The caller supplied buffer of 8 x 6 doubles.
+
+    Returns:
+    ----------
+    valid : int
+        The bit mask of the solutions that exist, bit k for solution k.
+    """
+
+    cdef double d1 = UR5_D1, a2 = UR5_A2, a3 = UR5_A4
+    cdef double d4 = -UR5_A1 + UR5_D4 + UR5_D5, d5 = UR5_D6, d6 = UR5_D7
+    cdef double T06_copy[16]  # dot_c() takes no const pointers
+    cdef double T01[16]
+    cdef double T10[16]
+    cdef double T45[16]
+    cdef double T54[16]
+    cdef double T56[16]
+    cdef double T65[16]
+    cdef double T14[16]
+    cdef double T12[16]
+    cdef double T23[16]
+    cdef double T13[16]
+    cdef double T31[16]
+    cdef double T34[16]
+    cdef double px, py, rho, psi, phi, theta1, cos5, theta5, sin5, theta6, x, y, length2, cos3, theta3, theta2, theta4
+    cdef int i1, i5, i3, k, index, valid = 0
+
+    for k in range(48):
+        solutions[k] = NAN
+
+    # The position of the wrist center, one d6 back along the tool axis
+    px = T06[3] - d6*T06[2]
+    py = T06[7] - d6*T06[6]
+    rho = sqrt(px*px + py*py)
+    if rho < fabs(d4):
+        return valid  # The wrist is too close to the base axis
+    psi = atan2(py, px)
+    phi = acos(d4/rho)
+    for i1 in range(2):
+        theta1 = wrap_angle(psi + (phi if i1 == 0 else -phi) + M_PI/2)
+        cos5 = (T06[3]*sin(theta1) - T06[7]*cos(theta1) - d4)/d6
+        if fabs(cos5) > 1:
+            if fabs(cos5) > 1 + 1e-9:
+                continue
+            cos5 = 1 if cos5 > 0 else -1
+        for i5 in range(2):
+            theta5 = acos(cos5) if i5 == 0 else -acos(cos5)
+            sin5 = sin(theta5)
+            if fabs(sin5) < 1e-9:
+                theta6 = 0  # Singular wrist: joint 4 and 6 are aligned, any theta6 works
+            else:
+                theta6 = atan2((-T06[1]*sin(theta1) + T06[5]*cos(theta1))/sin5,
+                               (T06[0]*sin(theta1) - T06[4]*cos(theta1))/sin5)
+
+            # Remove the first and the last two joints to find the planar arm
+            dh_matrix(theta1, d1, 0, 0, 1, T01)
+            dh_matrix(theta5, d5, 0, 0, -1, T45)
+            dh_matrix(theta6, d6, 0, 1, 0, T56)
+            invert_rigid(T01, T10)
+            invert_rigid(T45, T54)
+            invert_rigid(T56, T65)
+            for k in range(16):
+                T06_copy[k] = T06[k]
+            dot_c(T06_copy, T65)  # dot_c() stores the product in its second argument: T05
+            dot_c(T65, T54)  # T04
+            for k in range(16):
+                T14[k] = T54[k]
+            dot_c(T10, T14)
+
+            # Joint 2 and 3 move the wrist in the x-y plane of the first frame
+            x, y = T14[3], T14[7]
+            length2 = x*x + y*y
+            cos3 = (length2 - a2*a2 - a3*a3)/(2*a2*a3)
+            if fabs(cos3) > 1:
+                if fabs(cos3) > 1 + 1e-9:
+                    continue
+                cos3 = 1 if cos3 > 0 else -1
+            for i3 in range(2):
+                theta3 = acos(cos3) if i3 == 0 else -acos(cos3)
+                theta2 = atan2(y, x) - atan2(a3*sin(theta3), a2 + a3*cos(theta3))
+                dh_matrix(theta2, 0, a2, 1, 0, T12)
+                dh_matrix(theta3, 0, a3, 1, 0, T23)
+                for k in range(16):
+                    T13[k] = T23[k]
+                dot_c(T12, T13)
+                invert_rigid(T13, T31)
+                for k in range(16):
+                    T34[k] = T14[k]
+                dot_c(T31, T34)
+                theta4 = atan2(T34[4], T34[0])
+
+                valid |= 1 << (4*i1 + 2*i5 + i3)
+                index = 6*(4*i1 + 2*i5 + i3)
+                solutions[index] = theta1
+                solutions[index + 1] = wrap_angle(theta2)
+                solutions[index + 2] = wrap_angle(theta3)
+                solutions[index + 3] = wrap_angle(theta4)
+                solutions[index + 4] = wrap_angle(theta5)
+                solutions[index + 5] = wrap_angle(theta6)
+    return valid
+
+
+cpdef InverseKinematics(tool_position):
+    """
+    Compute all 8 joint configurations that reach a tool position, in closed
+    form. Configurations that do not exist are rows of NaN.
+
+    Parameters:
+    ----------
+    tool_position : list
+        The x, y, z and rotation vector rx, ry, rz of the end of the last wrist.
+
+    Returns:
+    ----------
+    solutions : np.array
+        The 8 x 6 array of joint angles, in (-pi, pi].
+    """
+    cdef double pose[6]
+    pose[0], pose[1], pose[2], pose[3], pose[4], pose[5] = tool_position
+    solutions = np.empty((8, 6), np.float64)
+    cdef double[:, ::1] view = solutions
+    inversekinematics_c(pose, &view[0, 0])
+    return solutions
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef InverseKinematicsBatch(double[:, ::1] tool_positions, double[:, :, ::1] solutions=None, int num_threads=1):
+    """
+    Compute the inverse kinematics of many tool positions at once, without the
+    GIL, like ForwardKinematicsBatch().
+
+    Parameters:
+    ----------
+    tool_positions : np.array
+        The N x 6 C-contiguous float64 array of tool positions.
+    solutions : np.array
+        The preallocated N x 8 x 6 float64 output array. Allocated when None.
+    num_threads : int
+        The number of OpenMP threads.
+
+    Returns:
+    ----------
+    solutions : np.array
+        The N x 8 x 6 array of joint angles, NaN where no solution exists.
+    """
+
+    cdef Py_ssize_t n = tool_positions.shape[0]
+    if tool_positions.shape[1] != 6:
+        raise ValueError("tool_positions should have shape (N, 6), not {}.".format((tool_positions.shape[0], tool_positions.shape[1])))
+    if solutions is None:
+        solutions = np.empty((n, 8, 6), np.float64)
+    elif solutions.shape[0] != n or solutions.shape[1] != 8 or solutions.shape[2] != 6:
+        raise ValueError("solutions should have shape ({}, 8, 6).".format(n))
+
+    cdef int threads = max(num_threads, 1)
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=threads, schedule='static'):
+        inversekinematics_c(&tool_positions[i, 0], &solutions[i, 0, 0])
+    return np.asarray(solutions)
+
+
+cpdef nearestSolution(solutions, current_angles):
+    """
+    Select the configuration that is nearest to the current joint angles, so
+    the robot does not flip its shoulder, elbow or wrist. Every joint of the
+    UR5 turns from -2pi to 2pi, so each angle is shifted by a full turn when
+    that brings it closer to the current angle.
+
+    Parameters:
+    ----------
+    solutions : np.array
+        The 8 x 6 array returned by InverseKinematics().
+    current_angles : list
+        The current joint angles, for instance from getJointAngles().
+
+    Returns:
+    ----------
+    joint_angles : np.array
+        The 6 joint angles of the nearest configuration, or None when the tool
+        position cannot be reached.
+    """
+    solutions = np.asarray(solutions, np.float64)
+    current = np.asarray(current_angles, np.float64)
+    valid = solutions[~np.isnan(solutions).any(axis=1)]
+    if len(valid) == 0:
+        return None
+    turns = np.round((current - valid) / (2*M_PI))
+    shifted = valid + 2*M_PI*turns
+    shifted = np.where(np.abs(shifted) > 2*M_PI, valid, shifted)
+    return shifted[np.argmin(np.abs(shifted - current).sum(axis=1))]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef convertRotations(rotations, str source, str target, int num_threads=1):
+    """
+    Convert rotations between roll, pitch and yaw angles ('rpy'), rotation
+    vectors ('rotvec'), quaternions w, x, y, z ('quaternion') and rotation
+    matrices ('matrix'), without the GIL. The roll, pitch and yaw rotate around
+    the fixed x, y and z axes, in that order. Rotation vectors and quaternions
+    are returned with an angle within [0, pi].
+
+    Parameters:
+    ----------
+    rotations : np.array
+        One or more rotations, with the shape of one rotation last: (..., 3),
+        (..., 4) or (..., 3, 3).
+    source, target : str
+        The representation of the rotations and the one to convert to.
+    num_threads : int
+        The number of OpenMP threads.
+
+    Returns:
+    ----------
+    result : np.array
+        The converted rotations, with the same leading shape.
+    """
+    if source not in ROTATIONS or target not in ROTATIONS:
+        raise ValueError("Rotations are one of {}, not {} and {}.".format(', '.join(ROTATIONS), source, target))
+    cdef int source_code = ROTATIONS[source][0], target_code = ROTATIONS[target][0]
+    source_shape, target_shape = ROTATIONS[source][1], ROTATIONS[target][1]
+    values = np.ascontiguousarray(rotations, np.float64)
+    if values.ndim < len(source_shape) or values.shape[values.ndim - len(source_shape):] != source_shape:
+        raise ValueError("{} rotations should have shape (..., {}), not {}.".format(source, ', '.join(map(str, source_shape)), values.shape))
+    leading = values.shape[:values.ndim - len(source_shape)]
+    cdef Py_ssize_t n = int(np.prod(leading))
+    cdef double[:, ::1] flat = values.reshape(n, int(np.prod(source_shape)))
+    result = np.empty(leading + target_shape, np.float64)
+    cdef double[:, ::1] view = result.reshape(n, int(np.prod(target_shape)))
+    if n == 0:
+        return result
+
+    cdef int threads = max(num_threads, 1)
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=threads, schedule='static'):
+        convert_rotation(source_code, target_code, &flat[i, 0], &view[i, 0])
+    return result
+
+
+cpdef RPY2RotVec(double roll, double pitch, double yaw):
+    """
+    Convert roll, pitch and yaw angles to the rotation vector of a tool
+    position. Replaces the slow Python implementations, also at an angle of pi.
+
+    Returns:
+    ----------
+    rx, ry, rz : float
+        The rotation vector.
+    """
+    cdef double rpy[3]
+    cdef double rotation_vector[3]
+    rpy[0], rpy[1], rpy[2] = roll, pitch, yaw
+    convert_rotation(ROTATION_RPY, ROTATION_VECTOR, rpy, rotation_vector)
+    return rotation_vector[0], rotation_vector[1], rotation_vector[2]
+
+
+cpdef RotVec2RPY(double rx, double ry, double rz):
+    """
+    Convert the rotation vector of a tool position to roll, pitch and yaw angles.
+
+    Returns:
+    ----------
+    roll, pitch, yaw : float
+        The rotations around the x, y and z axis.
+    """
+    cdef double rotation_vector[3]
+    cdef double rpy[3]
+    rotation_vector[0], rotation_vector[1], rotation_vector[2] = rx, ry, rz
+    convert_rotation(ROTATION_VECTOR, ROTATION_RPY, rotation_vector, rpy)
+    return rpy[0], rpy[1], rpy[2]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef composePoses(first_pose, second_pose):
+    """
+    Compose tool poses x, y, z, rx, ry, rz like pose_trans() in URScript: the
+    second pose is given in the frame of the first one. The poses broadcast
+    against each other.
+
+    Returns:
+    ----------
+    poses : np.array
+        The composed poses, with shape (..., 6).
+    """
+    first, second = np.broadcast_arrays(np.asarray(first_pose, np.float64), np.asarray(second_pose, np.float64))
+    if first.ndim == 0 or first.shape[first.ndim - 1] != 6:
+        raise ValueError("Poses should have shape (..., 6), not {}.".format(first.shape))
+    cdef double[:, ::1] a = np.ascontiguousarray(first).reshape(-1, 6)
+    cdef double[:, ::1] b = np.ascontiguousarray(second).reshape(-1, 6)
+    result = np.empty(first.shape, np.float64)
+    cdef double[:, ::1] view = result.reshape(-1, 6)
+    cdef double A[16]
+    cdef double B[16]
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(a.shape[0]):
+            pose_matrix(&a[i, 0], A)
+            pose_matrix(&b[i, 0], B)
+            dot_c(A, B)
+            matrix_pose(B, &view[i, 0])
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef invertPose(poses):
+    """
+    Invert tool poses x, y, z, rx, ry, rz like pose_inv() in URScript.
+
+    Returns:
+    ----------
+    inverses : np.array
+        The inverted poses, with shape (..., 6).
+    """
+    values = np.ascontiguousarray(poses, np.float64)
+    if values.ndim == 0 or values.shape[values.ndim - 1] != 6:
+        raise ValueError("Poses should have shape (..., 6), not {}.".format(values.shape))
+    cdef double[:, ::1] flat = values.reshape(-1, 6)
+    result = np.empty(values.shape, np.float64)
+    cdef double[:, ::1] view = result.reshape(-1, 6)
+    cdef double T[16]
+    cdef double inverse[16]
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(flat.shape[0]):
+            pose_matrix(&flat[i, 0], T)
+            invert_rigid(T, inverse)
+            matrix_pose(inverse, &view[i, 0])
+    return result
+
+
+cpdef applyPose(pose, points):
+    """
+    Transform points from the frame of a tool pose x, y, z, rx, ry, rz to the
+    base frame: rotate them by the rotation vector and add the position.
+
+    Parameters:
+    ----------
+    pose : list
+        One tool pose.
+    points : np.array
+        The points, with shape (..., 3).
+
+    Returns:
+    ----------
+    points : np.array
+        The transformed points, with the same shape.
+    """
+    cdef double values[6]
+    values[0], values[1], values[2], values[3], values[4], values[5] = pose
+    transform = np.empty((4, 4), np.float64)
+    cdef double[:, ::1] view = transform
+    pose_matrix(values, &view[0, 0])
+    return np.asarray(points, np.float64).dot(transform[:3, :3].T) + transform[:3, 3]
+
+
+cdef enum:
+    MAX_OBSTACLES = 128
+    MAX_NODES = 256
+    MAX_LINKS = 8
+
+# Beyond this distance the clearance is only a lower bound, so the bounding
+# volume hierarchy can skip the obstacles that are far away.
+cdef double CLEARANCE_RANGE = 0.5
+
+cdef struct Scene:
+    # Obstacles are oriented boxes: the center, the half extents and the
+    # rotation row by row, with the margin per axis for the joint positions
+    int count
+    double boxes[MAX_OBSTACLES][15]
+    double margins[MAX_OBSTACLES][3]
+    double bounds[MAX_OBSTACLES][6]
+    # The arm has to stay inside of these obstacles, like the box it stands in
+    int contained_count
+    int contained[MAX_OBSTACLES]
+    # The bounding volume hierarchy over all other obstacles. Every node has an
+    # axis aligned min and max corner, and two children. A leaf has no second
+    # child and holds the obstacle index i as -1 - i.
+    int node_count
+    double node_bounds[MAX_NODES][6]
+    int node_children[MAX_NODES][2]
+
+# Two scenes, so a reload fills the one that is not in use and then swaps the
+# pointer. Kernels take the pointer once per call.
+cdef Scene SCENES[2]
+cdef Scene *SCENE = &SCENES[0]
+OBSTACLE_NAMES = []
+SCENE_FILE = None
+SCENE_MODIFIED = None
+
+# The radius of the capsule around every link, from joint position i + 1 to
+# i + 2 of ForwardKinematics(): the shoulder, the upper arm, the elbow, the
+# forearm, the three wrists and the tool.
+cdef double LINK_RADII[MAX_LINKS]
+LINK_RADII[:] = [0.060, 0.060, 0.060, 0.045, 0.045, 0.045, 0.045, 0.030]
+
+
+cdef int build_hierarchy(Scene *scene, list indices):
+    """
+    Add a node over the obstacles with the given indices to the hierarchy,
+    splitting them in two halves along the longest axis of their centers.
+
+    Returns:
+    ----------
+    int
+        The index of the new node.
+    """
+    cdef int node = scene.node_count
+    cdef int i, j, axis = 0
+    cdef double spread, largest = -1
+    scene.node_count += 1
+    for j in range(3):
+        scene.node_bounds[node][j] = 1e9
+        scene.node_bounds[node][3 + j] = -1e9
+        for i in indices:
+            scene.node_bounds[node][j] = min(scene.node_bounds[node][j], scene.bounds[i][j])
+            scene.node_bounds[node][3 + j] = max(scene.node_bounds[node][3 + j], scene.bounds[i][3 + j])
+    if len(indices) == 1:
+        scene.node_children[node][0] = -1 - <int> indices[0]
+        scene.node_children[node][1] = 0
+        return node
+
+    for j in range(3):
+        centers = [scene.boxes[i][j] for i in indices]
+        spread = max(centers) - min(centers)
+        if spread > largest:
+            largest, axis = spread, j
+    centers = [scene.boxes[i][axis] for i in indices]
+    indices = [index for _, index in sorted(zip(centers, indices))]
+    half = len(indices) // 2
+    scene.node_children[node][0] = build_hierarchy(scene, indices[:half])
+    scene.node_children[node][1] = build_hierarchy(scene, indices[half:])
+    return node
+
+
+cpdef setObstacles(obstacles):
+    """
+    Compile the obstacles into the scene that is not in use, build its
+    bounding volume hierarchy and make it the active scene.
+
+    Parameters:
+    ----------
+    obstacles : list of Obstacle
+        Every obstacle is (name, center, half_extents, rotation_vector, contains,
+        margin), see KinematicsModule/Scene.py.
+    """
+    global SCENE, OBSTACLE_NAMES
+    if len(obstacles) > MAX_OBSTACLES:
+        raise ValueError("At most {} obstacles are supported, got {}.".format(MAX_OBSTACLES, len(obstacles)))
+    cdef Scene *scene = &SCENES[1] if SCENE == &SCENES[0] else &SCENES[0]
+    cdef double pose[6]
+    cdef double T[16]
+    cdef double extent
+    cdef int i, j, k
+    scene.count = len(obstacles)
+    scene.contained_count = 0
+    scene.node_count = 0
+    names = []
+    others = []
+    for i, (name, center, half_extents, rotation_vector, contains, margin) in enumerate(obstacles):
+        pose[0], pose[1], pose[2] = center
+        pose[3], pose[4], pose[5] = rotation_vector
+        pose_matrix(pose, T)
+        for j in range(3):
+            scene.boxes[i][j] = T[4*j + 3]
+            scene.boxes[i][3 + j] = half_extents[j]
+            scene.boxes[i][6 + 3*j], scene.boxes[i][7 + 3*j], scene.boxes[i][8 + 3*j] = T[4*j], T[4*j + 1], T[4*j + 2]
+            scene.margins[i][j] = margin[j]
+        for j in range(3):
+            # The axis aligned bounds of the box, grown by a positive margin
+            extent = 0
+            for k in range(3):
+                extent += fabs(T[4*j + k])*(half_extents[k] + max(margin[k], 0))
+            scene.bounds[i][j] = T[4*j + 3] - extent
+            scene.bounds[i][3 + j] = T[4*j + 3] + extent
+        if contains:
+            scene.contained[scene.contained_count] = i
+            scene.contained_count += 1
+        else:
+            others.append(i)
+        names.append(name)
+    if others:
+        build_hierarchy(scene, others)
+    SCENE = scene
+    OBSTACLE_NAMES = names
+
+
+cpdef loadScene(path=None):
+    """
+    Load the obstacles from a scene description file and make them the active
+    scene. The default is KinematicsModule/scene.json.
+    """
+    global SCENE_FILE, SCENE_MODIFIED
+    path = SCENE_PATH if path is None else path
+    modified = os.path.getmtime(path)
+    setObstacles(readScene(path))
+    SCENE_FILE, SCENE_MODIFIED = path, modified
+
+
+cpdef bint reloadScene():
+    """
+    Load the scene file again when it changed since it was loaded, so a change
+    of the layout does not need a rebuild. Cheap enough to call before every
+    move. An invalid file is reported and the active scene is kept.
+
+    Returns:
+    ----------
+    bool
+        Whether the scene was reloaded.
+    """
+    if SCENE_FILE is None:
+        return False
+    try:
+        if os.path.getmtime(SCENE_FILE) == SCENE_MODIFIED:
+            return False
+        loadScene(SCENE_FILE)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print("Kinematics.pyx: keeping the current scene, {} could not be loaded: {}".format(SCENE_FILE, e))
+        return False
+    return True
+
+
+loadScene()
+
+
+cdef int query_hierarchy(const Scene *scene, const double *low, const double *high, int *found) noexcept nogil:
+    """
+    Find the obstacles whose bounds overlap with the axis aligned box from low
+    to high, by descending the bounding volume hierarchy.
+
+    Returns:
+    ----------
+    int
+        The number of obstacle indices written to found.
+    """
+    cdef int stack[64]
+    cdef int size = 0, count = 0, node, j
+    cdef bint overlap
+    if scene.node_count > 0:
+        stack[0] = 0
+        size = 1
+    while size > 0:
+        size -= 1
+        node = stack[size]
+        overlap = True
+        for j in range(3):
+            if scene.node_bounds[node][j] > high[j] or scene.node_bounds[node][3 + j] < low[j]:
+                overlap = False
+        if not overlap:
+            continue
+        if scene.node_children[node][0] < 0:
+            found[count] = -1 - scene.node_children[node][0]
+            count += 1
+        else:
+            stack[size] = scene.node_children[node][0]
+            stack[size + 1] = scene.node_children[node][1]
+            size += 2
+    return count
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void tool_point(double *positions, const double *rotation, double[:, ::1] tool_transform) noexcept nogil:
+    """
+    Append the tool position to the 9 positions of forwardkinematics_c().
+    """
+    cdef int j, k
+    for j in range(3):
+        positions[27 + j] = positions[24 + j]
+        for k in range(3):
+            positions[27 + j] += rotation[3*j + k]*tool_transform[k, 3]
+
+
+cdef inline double box_distance(const double *box, double x, double y, double z) noexcept nogil:
+    """
+    The signed distance from a point to an oriented box: positive outside,
+    negative inside.
+    """
+    cdef double px = x - box[0], py = y - box[1], pz = z - box[2]
+    # Rotate into the frame of the box with the transposed rotation
+    cdef double dx = fabs(box[6]*px + box[9]*py + box[12]*pz) - box[3]
+    cdef double dy = fabs(box[7]*px + box[10]*py + box[13]*pz) - box[4]
+    cdef double dz = fabs(box[8]*px + box[11]*py + box[14]*pz) - box[5]
+    cdef double ox = dx if dx > 0 else 0
+    cdef double oy = dy if dy > 0 else 0
+    cdef double oz = dz if dz > 0 else 0
+    cdef double inside = dx if dx > dy else dy
+    inside = inside if inside > dz else dz
+    return sqrt(ox*ox + oy*oy + oz*oz) + (inside if inside < 0 else 0)
+
+
+cdef double segment_distance(const double *box, const double *a, const double *b) noexcept nogil:
+    """
+    The smallest signed distance from the segment a-b to an oriented box. The
+    signed distance of a box is convex, so it is convex along the segment too
+    and a golden section search finds the minimum.
+    """
+    cdef double ratio = 0.6180339887498949
+    cdef double low = 0, high = 1
+    cdef double t1 = high - ratio*(high - low), t2 = low + ratio*(high - low)
+    cdef double f1 = box_distance(box, a[0] + t1*(b[0] - a[0]), a[1] + t1*(b[1] - a[1]), a[2] + t1*(b[2] - a[2]))
+    cdef double f2 = box_distance(box, a[0] + t2*(b[0] - a[0]), a[1] + t2*(b[1] - a[1]), a[2] + t2*(b[2] - a[2]))
+    cdef int i
+    for i in range(40):
+        if f1 < f2:
+            high, t2, f2 = t2, t1, f1
+            t1 = high - ratio*(high - low)
+            f1 = box_distance(box, a[0] + t1*(b[0] - a[0]), a[1] + t1*(b[1] - a[1]), a[2] + t1*(b[2] - a[2]))
+        else:
+            low, t1, f1 = t1, t2, f2
+            t2 = low + ratio*(high - low)
+            f2 = box_distance(box, a[0] + t2*(b[0] - a[0]), a[1] + t2*(b[1] - a[1]), a[2] + t2*(b[2] - a[2]))
+    cdef double result = f1 if f1 < f2 else f2
+    # The minimum can be at the ends of the segment
+    f1 = box_distance(box, a[0], a[1], a[2])
+    f2 = box_distance(box, b[0], b[1], b[2])
+    result = result if result < f1 else f1
+    return result if result < f2 else f2
+
+
+cdef void clearance_c(const Scene *scene, const double *positions, int count, double *clearances) noexcept nogil:
+    """
+    Compute the smallest clearance between the capsules around the links and
+    every obstacle, without the GIL. The clearance is negative when a link
+    penetrates an obstacle, or leaves the obstacle that contains it. The tool
+    picks objects off the floor of the obstacle that contains the arm, so only
+    its axis has to stay inside of it, not its capsule. It is exact up to
+    CLEARANCE_RANGE and a lower bound of at least CLEARANCE_RANGE beyond.
+
+    Parameters:
+    ----------
+    scene : Scene pointer
+        The scene to test against.
+    positions : c double array pointer
+        The x, y, z of count joint positions, from ForwardKinematics(). The first
+        position is the base, which is not part of a link.
+    count : int
+        The number of positions, 9 without and 10 with the tool.
+    clearances : c double array pointer
+        The caller supplied buffer of one double per obstacle.
+    """
+    cdef int i, j, k, n, found_count
+    cdef int found[MAX_OBSTACLES]
+    cdef const double *a
+    cdef const double *b
+    cdef double low[3]
+    cdef double high[3]
+    cdef double arm[6]
+    cdef double distance, inside_a, inside_b, gap, bound, radius
+    for k in range(scene.count):
+        clearances[k] = 1e9
+
+    for i in range(count - 2):
+        a = positions + 3*(i + 1)
+        b = positions + 3*(i + 2)
+        radius = 0 if i == MAX_LINKS - 1 else LINK_RADII[i]  # The tool is the last link
+        for n in range(scene.contained_count):
+            # Minus the signed distance is concave, so its minimum is at an end
+            k = scene.contained[n]
+            inside_a = -box_distance(scene.boxes[k], a[0], a[1], a[2])
+            inside_b = -box_distance(scene.boxes[k], b[0], b[1], b[2])
+            distance = (inside_a if inside_a < inside_b else inside_b) - radius
+            if distance < clearances[k]:
+                clearances[k] = distance
+        for j in range(3):
+            low[j] = (a[j] if a[j] < b[j] else b[j]) - LINK_RADII[i] - CLEARANCE_RANGE
+            high[j] = (a[j] if a[j] > b[j] else b[j]) + LINK_RADII[i] + CLEARANCE_RANGE
+        found_count = query_hierarchy(scene, low, high, found)
+        for n in range(found_count):
+            k = found[n]
+            distance = segment_distance(scene.boxes[k], a, b) - LINK_RADII[i]
+            if distance < clearances[k]:
+                clearances[k] = distance
+
+    # Obstacles out of range get the distance between the bounds of the arm and their bounds
+    for j in range(3):
+        arm[j], arm[3 + j] = 1e9, -1e9
+    for i in range(1, count):
+        for j in range(3):
+            arm[j] = arm[j] if arm[j] < positions[3*i + j] else positions[3*i + j]
+            arm[3 + j] = arm[3 + j] if arm[3 + j] > positions[3*i + j] else positions[3*i + j]
+    for k in range(scene.count):
+        if clearances[k] <= CLEARANCE_RANGE:
+            continue
+        bound = 0
+        for j in range(3):
+            gap = scene.bounds[k][j] - arm[3 + j]
+            gap = gap if gap > arm[j] - scene.bounds[k][3 + j] else arm[j] - scene.bounds[k][3 + j]
+            if gap > 0:
+                bound += gap*gap
+        bound = sqrt(bound) - LINK_RADII[0]  # The largest radius
+        clearances[k] = bound if bound > CLEARANCE_RANGE else CLEARANCE_RANGE
+
+
+cpdef linkClearance(positions):
+    """
+    Compute the clearance between the links of the arm, modelled as capsules,
+    and every obstacle. Unlike detectCollision(), this also catches a link
+    that passes through an obstacle between two joints, and tells how close
+    the arm is, for instance to scale the velocity near obstacles.
+
+    Parameters:
+    ----------
+    positions : tuple of lists
+        The lists containing all x-, y- and z-positions of all joints, from
+        ForwardKinematics(), with or without the tool.
+
+    Returns:
+    ----------
+    clearances : np.array
+        The smallest signed clearance per obstacle in OBSTACLE_NAMES, in meter.
+    """
+    cdef list X, Y, Z
+    X, Y, Z = positions
+    cdef int count = len(X)
+    if not 3 <= count <= 10:
+        raise ValueError("Expected 3 to 10 positions, got {}.".format(count))
+    cdef double buffer[30]
+    cdef int i
+    for i in range(count):
+        buffer[3*i], buffer[3*i + 1], buffer[3*i + 2] = X[i], Y[i], Z[i]
+    cdef Scene *scene = SCENE
+    clearances = np.empty(scene.count, np.float64)
+    cdef double[::1] view = clearances
+    if scene.count > 0:
+        clearance_c(scene, buffer, count, &view[0])
+    return clearances
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef sweptPathClearance(double[:, ::1] joint_path, double[:, ::1] tool_transform=None):
+    """
+    Compute linkClearance() for every sample of a path, without the GIL.
+
+    Returns:
+    ----------
+    clearances : np.array
+        The N x len(OBSTACLE_NAMES) array of the smallest clearance per obstacle.
+    """
+    cdef Py_ssize_t n = joint_path.shape[0]
+    if joint_path.shape[1] != 6:
+        raise ValueError("joint_path should have shape (N, 6).")
+    cdef Scene *scene = SCENE
+    clearances = np.empty((n, scene.count), np.float64)
+    cdef double[:, ::1] view = clearances
+    cdef double positions[30]
+    cdef double rotation[9]
+    cdef bint has_transform = tool_transform is not None
+    cdef Py_ssize_t i
+    if scene.count == 0:
+        return clearances
+    with nogil:
+        for i in range(n):
+            forwardkinematics_c(&joint_path[i, 0], positions, rotation)
+            if has_transform:
+                tool_point(positions, rotation, tool_transform)
+            clearance_c(scene, positions, 10 if has_transform else 9, &view[i, 0])
+    return clearances
+
+
+cdef inline bint inside_box(const double *box, const double *margin, double sign, const double *point) noexcept nogil:
+    """
+    Test whether a point is inside of an oriented box that is grown by the
+    margin, or shrunk by it when sign is -1.
+    """
+    cdef double px = point[0] - box[0], py = point[1] - box[1], pz = point[2] - box[2]
+    return (fabs(box[6]*px + box[9]*py + box[12]*pz) < box[3] + sign*margin[0] and
+            fabs(box[7]*px + box[10]*py + box[13]*pz) < box[4] + sign*margin[1] and
+            fabs(box[8]*px + box[11]*py + box[14]*pz) < box[5] + sign*margin[2])
+
+
+cdef int collision_c(const Scene *scene, const double *positions, int count) noexcept nogil:
+    """
+    Test count x, y, z positions against the obstacles of the scene, with
+    their margins for security, without the GIL.
+
+    Returns:
+    ----------
+    int
+        0 without a collision, otherwise 1 + the index of the obstacle in
+        OBSTACLE_NAMES.
+    """
+    cdef int i, n, k, found_count
+    cdef int found[MAX_OBSTACLES]
+    for i in range(count):
+        for n in range(scene.contained_count):
+            k = scene.contained[n]
+            if not inside_box(scene.boxes[k], scene.margins[k], -1, positions + 3*i):
+                return k + 1
+        found_count = query_hierarchy(scene, positions + 3*i, positions + 3*i, found)
+        for n in range(found_count):
+            k = found[n]
+            if inside_box(scene.boxes[k], scene.margins[k], 1, positions + 3*i):
+                return k + 1
+    return 0
+
+
 cpdef detectCollision(positions):
     """
     Detect whether any of the spatial positions computed by the forward kinematics
     is out of bounds. This prevents the robot arm from bumping into the container,
-    or into the cameras or the screen. Add a margin e for security.
-    Fast Cython implementation.
+    or into the cameras or the screen, or any other obstacle in the scene. Fast
+    Cython implementation.
 
     Parameters:
     ----------
@@ -291,46 +1324,501 @@ cpdef detectCollision(positions):
 
     cdef list X, Y, Z
     X, Y, Z = positions
-    X = X[2:]  # We don't need all the positions
-    Y = Y[2:]
-    Z = Z[2:]
-    cdef size_t items = len(X)
-
-    # Are we inside of the box?
-    cdef double e = 0.05
-    cdef double BOX_X_MIN = -0.832
-    cdef double BOX_X_MAX = 0.490
-    cdef double BOX_Y_MIN = -0.713
-    cdef double BOX_Y_MAX = 0.265
-    cdef double BOX_Z_MIN = 0
-
-    cdef int i = 0
-    for i in range(items):
-      if not (((BOX_X_MIN + e < X[i]) & (X[i] < BOX_X_MAX - e)) and ((BOX_Y_MIN + e < Y[i]) & (Y[i] < BOX_Y_MAX - e)) and (BOX_Z_MIN < Z[i])):
-        print("Kinematics.pyx: you are about to hit the box")
-        return True
-    # Are we bumping into the camera and the light?
-    CAM_X_MIN = -0.568
-    CAM_X_MAX = -0.364
-    CAM_Y_MIN = -0.266
-    CAM_Y_MAX = 0.031
-    CAM_Z_MIN = 0.790
+    cdef size_t items = len(X) - 2  # We don't need the first two positions
+    if items > 8:
+        raise ValueError("Expected at most 10 positions, got {}.".format(items + 2))
+    cdef double buffer[24]
+    cdef size_t i
     for i in range(items):
-      if ((CAM_X_MIN + e < X[i]) & (X[i] < CAM_X_MAX - e)) and ((CAM_Y_MIN + e < Y[i]) & (Y[i] < CAM_Y_MAX - e)) and (CAM_Z_MIN + e < Z[i]):
-        print("Kinematics.pyx: you are about to hit the camera")
-        return True
-    # Are we bumping into the screen?
-    e = 0.01
-    SCR_X_MAX = -0.258
-    SCR_Y_MAX = -0.525
-    SCR_Z_MIN = 0.400
-    for i in range(items):
-      if (X[i] < SCR_X_MAX + e) and (Y[i] < SCR_Y_MAX + e) and (Z[i] < SCR_Z_MIN + e):
-        print("Kinematics.pyx: you are about to hit the screen")
+        buffer[3*i], buffer[3*i + 1], buffer[3*i + 2] = X[i + 2], Y[i + 2], Z[i + 2]
+
+    cdef Scene *scene = SCENE
+    cdef int obstacle = collision_c(scene, buffer, items)
+    if obstacle:
+        print("Kinematics.pyx: you are about to hit the {}".format(OBSTACLE_NAMES[obstacle - 1]))
         return True
     return False
 
 
+cpdef bint detectPointCollision(double x, double y, double z):
+    """
+    Test a single position, like the tool position, against the obstacles of
+    the scene. Does not print.
+    """
+    cdef double point[3]
+    point[0], point[1], point[2] = x, y, z
+    return collision_c(SCENE, point, 1) != 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef collisionBatch(double[:, ::1] joint_angles, double[:, ::1] tool_transform=None, int num_threads=1):
+    """
+    Run the test of detectCollision() on the forward kinematics of many
+    configurations at once, without the GIL.
+
+    Parameters:
+    ----------
+    joint_angles : np.array
+        The N x 6 C-contiguous float64 array of joint angles.
+    tool_transform : np.array
+        The 4 x 4 matrix from toolTransform(), to test the tool position too.
+    num_threads : int
+        The number of OpenMP threads.
+
+    Returns:
+    ----------
+    obstacles : np.array
+        The N uint8 codes: 0 without a collision, otherwise 1 + the index of the
+        first obstacle in OBSTACLE_NAMES that is hit.
+    """
+    cdef Py_ssize_t n = joint_angles.shape[0]
+    if joint_angles.shape[1] != 6:
+        raise ValueError("joint_angles should have shape (N, 6).")
+    obstacles = np.empty(n, np.uint8)
+    cdef unsigned char[::1] view = obstacles
+    cdef Scene *scene = SCENE
+    cdef bint has_transform = tool_transform is not None
+    cdef int threads = max(num_threads, 1)
+    cdef double *positions  # 30 positions and 9 rotations per thread
+    cdef Py_ssize_t i
+    with nogil, parallel(num_threads=threads):
+        positions = <double*> malloc(39*sizeof(double))
+        for i in prange(n, schedule='static'):
+            forwardkinematics_c(&joint_angles[i, 0], positions, positions + 30)
+            if has_transform:
+                tool_point(positions, positions + 30, tool_transform)
+            # We don't need the first two positions
+            view[i] = collision_c(scene, positions + 6, 8 if has_transform else 7)
+        free(positions)
+    return obstacles
+
+
+cdef class PackedCells:
+    """
+    The packed 2 bit codes of a grid of cells over the first joints, from
+    KinematicsModule/CollisionTable.py. Keeps the grid in C, so that looking up
+    a configuration takes no more than indexing a list.
+    """
+    cdef double lows[MAX_LINKS]
+    cdef double steps[MAX_LINKS]
+    cdef Py_ssize_t shape[MAX_LINKS]
+    cdef Py_ssize_t strides[MAX_LINKS]
+    cdef int joints
+    cdef const unsigned char[::1] bits
+
+    def __init__(self, lows, steps, shape, const unsigned char[::1] bits):
+        cdef int j
+        self.joints = len(shape)
+        if self.joints > MAX_LINKS or len(lows) != self.joints or len(steps) != self.joints:
+            raise ValueError("The grid should have the same number of lows, steps and cells, at most {}.".format(MAX_LINKS))
+        cdef Py_ssize_t stride = 1
+        for j in range(self.joints - 1, -1, -1):
+            self.lows[j], self.steps[j], self.shape[j] = lows[j], steps[j], shape[j]
+            self.strides[j] = stride
+            stride *= self.shape[j]
+        if bits.shape[0] * 4 < stride:
+            raise ValueError("{} cells do not fit in {} bytes.".format(stride, bits.shape[0]))
+        self.bits = bits
+
+    cpdef int code(self, joint_angles, int outside=2):
+        """
+        Return the code of the cell that contains the joint angles, or outside if
+        they are not in the grid.
+        """
+        cdef Py_ssize_t index = 0, cell
+        cdef double angle
+        cdef int j
+        for j in range(self.joints):
+            angle = joint_angles[j]
+            cell = <Py_ssize_t> floor((angle - self.lows[j]) / self.steps[j])
+            if cell < 0 or cell >= self.shape[j]:
+                return outside
+            index += cell * self.strides[j]
+        return (self.bits[index >> 2] >> ((index & 3) << 1)) & 3
+
+
+cpdef toolTransform(joint_angles, tool_position):
+    """
+    Compute the transformation from the end of the last wrist to the tool
+    position the robot reports, which includes the tool center point offset of
+    the gripper. Measured once from a single RobotState, it converts tool
+    positions to wrist positions for InverseKinematics() and back.
+
+    Returns:
+    ----------
+    transform : np.array
+        The 4 x 4 rotation and translation of the tool in the wrist frame.
+    """
+
+    cdef double angles[6]
+    cdef double positions[27]
+    cdef double rotation[9]
+    cdef double pose[6]
+    cdef double wrist[16]
+    cdef double wrist_inverse[16]
+    cdef int i
+    angles[0], angles[1], angles[2], angles[3], angles[4], angles[5] = joint_angles
+    pose[0], pose[1], pose[2], pose[3], pose[4], pose[5] = tool_position
+    forwardkinematics_c(angles, positions, rotation)
+    for i in range(3):
+        wrist[4*i], wrist[4*i + 1], wrist[4*i + 2] = rotation[3*i], rotation[3*i + 1], rotation[3*i + 2]
+        wrist[4*i + 3] = positions[24 + i]
+    wrist[12], wrist[13], wrist[14], wrist[15] = 0, 0, 0, 1
+    invert_rigid(wrist, wrist_inverse)
+
+    transform = np.empty((4, 4), np.float64)
+    cdef double[:, ::1] view = transform
+    pose_matrix(pose, &view[0, 0])
+    dot_c(wrist_inverse, &view[0, 0])
+    return transform
+
+
+# The number of joints that move each of the 10 positions of ForwardKinematicsBatch(),
+# and the position on the axis of every joint
+cdef int POINT_JOINTS[10]
+POINT_JOINTS[:] = [0, 0, 1, 2, 3, 3, 4, 5, 6, 6]
+cdef int JOINT_ORIGINS[6]
+JOINT_ORIGINS[:] = [0, 2, 3, 5, 6, 7]
+
+
+cdef void jacobian_c(const double *joint_angles, double *positions, double *axes, double *linear,
+                     bint has_transform, double[:, ::1] tool_transform) noexcept nogil:
+    """
+    Fill the 30 positions like ForwardKinematicsBatch(), the 18 values of the
+    joint axes and the 10 linear Jacobians of 3 x 6 of the positions: column j
+    of a Jacobian is the velocity of the position when joint j turns at 1 rad/s,
+    the cross product of the joint axis with the arm from the joint to the position.
+    """
+    cdef double rotation[9]
+    cdef double dx, dy, dz
+    cdef const double *axis
+    cdef const double *origin
+    cdef double *J
+    cdef int k, j
+    forwardkinematics_frames(joint_angles, positions, rotation, axes)
+    if has_transform:
+        tool_point(positions, rotation, tool_transform)
+    else:
+        positions[27], positions[28], positions[29] = positions[24], positions[25], positions[26]
+    for k in range(10):
+        J = linear + 18*k
+        for j in range(6):
+            if j < POINT_JOINTS[k]:
+                axis, origin = axes + 3*j, positions + 3*JOINT_ORIGINS[j]
+                dx = positions[3*k] - origin[0]
+                dy = positions[3*k + 1] - origin[1]
+                dz = positions[3*k + 2] - origin[2]
+                J[j], J[6 + j], J[12 + j] = axis[1]*dz - axis[2]*dy, axis[2]*dx - axis[0]*dz, axis[0]*dy - axis[1]*dx
+            else:
+                J[j], J[6 + j], J[12 + j] = 0, 0, 0
+
+
+cpdef Jacobian(joint_angles, double[:, ::1] tool_transform=None):
+    """
+    Compute the geometric Jacobian of the tool, or of the end of the last wrist
+    without a tool transform.
+
+    Parameters:
+    ----------
+    joint_angles : list
+        The 6 joint angles.
+    tool_transform : np.array
+        The 4 x 4 matrix from toolTransform().
+
+    Returns:
+    ----------
+    jacobian : np.array
+        The 6 x 6 matrix that turns joint velocities into the linear velocity
+        (rows 0 to 2) and the angular velocity (rows 3 to 5) of the tool.
+    """
+    cdef double angles[6]
+    cdef double positions[30]
+    cdef double axes[18]
+    cdef double linear[180]
+    cdef int i, j
+    angles[0], angles[1], angles[2], angles[3], angles[4], angles[5] = joint_angles
+    jacobian_c(angles, positions, axes, linear, tool_transform is not None, tool_transform)
+    jacobian = np.empty((6, 6), np.float64)
+    cdef double[:, ::1] view = jacobian
+    for i in range(3):
+        for j in range(6):
+            view[i, j] = linear[162 + 6*i + j]
+            view[3 + i, j] = axes[3*j + i]
+    return jacobian
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef JacobianBatch(double[:, ::1] joint_angles, double[:, ::1] tool_transform=None, double[:, :, :, ::1] jacobians=None, int num_threads=1):
+    """
+    Compute the linear Jacobians of all positions of many configurations at
+    once, without the GIL.
+
+    Parameters:
+    ----------
+    joint_angles : np.array
+        The N x 6 C-contiguous float64 array of joint angles.
+    tool_transform : np.array
+        The 4 x 4 matrix from toolTransform(). Without it, the last position is
+        the end of the last wrist, like in ForwardKinematicsBatch().
+    jacobians : np.array
+        Optional preallocated N x 10 x 3 x 6 output array.
+    num_threads : int
+        The number of OpenMP threads.
+
+    Returns:
+    ----------
+    jacobians : np.array
+        The N x 10 x 3 x 6 Jacobians that turn joint velocities into the linear
+        velocities of the 10 positions.
+    """
+    cdef Py_ssize_t n = joint_angles.shape[0]
+    if joint_angles.shape[1] != 6:
+        raise ValueError("joint_angles should have shape (N, 6).")
+    if jacobians is None:
+        jacobians = np.empty((n, 10, 3, 6), np.float64)
+    elif jacobians.shape[0] != n or jacobians.shape[1] != 10 or jacobians.shape[2] != 3 or jacobians.shape[3] != 6:
+        raise ValueError("jacobians should have shape ({}, 10, 3, 6).".format(n))
+
+    cdef bint has_transform = tool_transform is not None
+    cdef int threads = max(num_threads, 1)
+    cdef double *buffer  # 30 positions and 18 axes per thread
+    cdef Py_ssize_t i
+    with nogil, parallel(num_threads=threads):
+        buffer = <double*> malloc(48*sizeof(double))
+        for i in prange(n, schedule='static'):
+            jacobian_c(&joint_angles[i, 0], buffer, buffer + 30, &jacobians[i, 0, 0, 0], has_transform, tool_transform)
+        free(buffer)
+    return np.asarray(jacobians)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef predictPositions(joint_angles, joint_velocities, double dt, double[:, ::1] tool_transform=None, int num_threads=1):
+    """
+    Predict the positions of the arm dt seconds ahead, to the first order: the
+    positions of ForwardKinematicsBatch() plus their velocities from the
+    Jacobians. For one controller cycle of 8 ms the error stays below 2 mm,
+    even with all joints at 3 rad/s, so collision monitoring can look ahead at
+    little more than the cost of one forward kinematics pass.
+
+    Parameters:
+    ----------
+    joint_angles, joint_velocities : np.array
+        The joint angles and velocities, with shape (6,) or (N, 6), for
+        instance from the JointVelocities of a RealTimeState.
+    dt : float
+        The time to look ahead, in seconds.
+    tool_transform : np.array
+        The 4 x 4 matrix from toolTransform(), to predict the tool position too.
+    num_threads : int
+        The number of OpenMP threads.
+
+    Returns:
+    ----------
+    positions : np.array
+        The predicted positions, with shape (10, 3) or (N, 10, 3).
+    """
+    angles = np.ascontiguousarray(joint_angles, np.float64)
+    velocities = np.ascontiguousarray(joint_velocities, np.float64)
+    if angles.shape[angles.ndim - 1:] != (6,) or velocities.shape != angles.shape:
+        raise ValueError("joint_angles and joint_velocities should both have shape (6,) or (N, 6).")
+    cdef double[:, ::1] q = angles.reshape(-1, 6)
+    cdef double[:, ::1] qd = velocities.reshape(-1, 6)
+    cdef Py_ssize_t n = q.shape[0]
+    predicted = np.empty((n, 10, 3), np.float64)
+    cdef double[:, :, ::1] view = predicted
+
+    cdef bint has_transform = tool_transform is not None
+    cdef int threads = max(num_threads, 1)
+    cdef double *buffer  # 30 positions, 18 axes and 180 Jacobian values per thread
+    cdef double velocity
+    cdef Py_ssize_t i
+    cdef int k, r, j
+    with nogil, parallel(num_threads=threads):
+        buffer = <double*> malloc(228*sizeof(double))
+        for i in prange(n, schedule='static'):
+            jacobian_c(&q[i, 0], buffer, buffer + 30, buffer + 48, has_transform, tool_transform)
+            for k in range(10):
+                for r in range(3):
+                    velocity = 0
+                    for j in range(6):
+                        velocity = velocity + buffer[48 + 18*k + 6*r + j]*qd[i, j]
+                    view[i, k, r] = buffer[3*k + r] + velocity*dt
+        free(buffer)
+    return predicted if angles.ndim > 1 else predicted[0]
+
+
+def interpolateToolPath(start_position, target_position, samples):
+    """
+    Sample the straight line a movel follows between two tool positions: the
+    position is interpolated linearly and the rotation with a slerp.
+
+    Returns:
+    ----------
+    tool_positions : np.array
+        The samples x 6 array of tool positions, including both ends.
+    """
+    start = np.asarray(start_position, np.float64)
+    target = np.asarray(target_position, np.float64)
+    fractions = np.linspace(0, 1, samples)[:, None]
+
+    q0, q1 = convertRotations(start[3:], 'rotvec', 'quaternion'), convertRotations(target[3:], 'rotvec', 'quaternion')
+    dot = np.dot(q0, q1)
+    if dot < 0:  # Take the short way around
+        q1, dot = -q1, -dot
+    angle = acos(min(dot, 1.0))
+    if angle < 1e-9:
+        quaternions = q0 + fractions*(q1 - q0)
+    else:
+        quaternions = (np.sin((1 - fractions)*angle)*q0 + np.sin(fractions*angle)*q1)/sin(angle)
+
+    tool_positions = np.empty((samples, 6), np.float64)
+    tool_positions[:, :3] = start[:3] + fractions*(target[:3] - start[:3])
+    tool_positions[:, 3:] = convertRotations(quaternions, 'quaternion', 'rotvec')
+    return tool_positions
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef toolPathToJointPath(double[:, ::1] tool_positions, start_angles, double[:, ::1] tool_transform=None, double max_step=0.5):
+    """
+    Convert a path of tool positions to joint angles, choosing at every sample
+    the configuration nearest to the previous one, like nearestSolution().
+    Raises a ValueError when a sample cannot be reached, or when the nearest
+    configuration jumps more than max_step in a joint, which means the path
+    runs through a singularity.
+
+    Parameters:
+    ----------
+    tool_positions : np.array
+        The N x 6 C-contiguous array of tool positions.
+    start_angles : list
+        The joint angles the path starts from.
+    tool_transform : np.array
+        The 4 x 4 matrix from toolTransform(). The tool positions are wrist
+        positions when None.
+    max_step : float
+        The largest change of a joint angle between two samples, in radians.
+
+    Returns:
+    ----------
+    joint_angles : np.array
+        The N x 6 array of joint angles.
+    """
+
+    cdef Py_ssize_t n = tool_positions.shape[0]
+    joint_path = np.empty((n, 6), np.float64)
+    cdef double[:, ::1] path = joint_path
+    cdef double previous[6]
+    previous[0], previous[1], previous[2], previous[3], previous[4], previous[5] = start_angles
+    cdef double transform_inverse[16]
+    cdef double T[16]
+    cdef double wrist[16]
+    cdef double solutions[48]
+    cdef double shifted[6]
+    cdef double best[6]
+    cdef double distance, best_distance, angle, turns, step
+    cdef int valid
+    cdef bint has_transform = tool_transform is not None
+    cdef Py_ssize_t i, failed = -1
+    cdef int k, j
+    if has_transform:
+        invert_rigid(&tool_transform[0, 0], transform_inverse)
+
+    with nogil:
+        for i in range(n):
+            pose_matrix(&tool_positions[i, 0], T)
+            if has_transform:
+                for k in range(16):
+                    wrist[k] = transform_inverse[k]
+                dot_c(T, wrist)  # The wrist position
+                valid = inversekinematics_matrix_c(wrist, solutions)
+            else:
+                valid = inversekinematics_matrix_c(T, solutions)
+
+            best_distance = -1
+            for k in range(8):
+                if not valid & (1 << k):
+                    continue
+                distance = 0
+                for j in range(6):
+                    angle = solutions[6*k + j]
+                    turns = floor((previous[j] - angle)/(2*M_PI) + 0.5)
+                    if fabs(angle + 2*M_PI*turns) <= 2*M_PI:
+                        angle = angle + 2*M_PI*turns
+                    shifted[j] = angle
+                    distance = distance + fabs(angle - previous[j])
+                if best_distance < 0 or distance < best_distance:
+                    best_distance = distance
+                    for j in range(6):
+                        best[j] = shifted[j]
+            if best_distance < 0:
+                failed = i
+                break
+            step = 0
+            for j in range(6):
+                step = max(step, fabs(best[j] - previous[j]))
+                previous[j] = best[j]
+                path[i, j] = best[j]
+            if i > 0 and step > max_step:
+                failed = i
+                break
+
+    if failed >= 0:
+        raise ValueError("Tool position {} on the path cannot be reached without a jump.".format(np.round(np.asarray(tool_positions[failed]), 4).tolist()))
+    return joint_path
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef int sweptPathCollision(double[:, ::1] joint_path, double[:, ::1] tool_transform=None):
+    """
+    Compute the forward kinematics of every sample of a path and test it for
+    collisions, in one call without the GIL. A sample collides when a joint
+    hits an obstacle, like in detectCollision(), or when the capsule around
+    a link does, like in linkClearance(). Stops at the first collision.
+
+    Parameters:
+    ----------
+    joint_path : np.array
+        The N x 6 C-contiguous array of joint angles along the path.
+    tool_transform : np.array
+        The 4 x 4 matrix from toolTransform(), to test the tool position too.
+
+    Returns:
+    ----------
+    index : int
+        The index of the first sample that collides, or -1.
+    """
+
+    cdef Py_ssize_t n = joint_path.shape[0]
+    if joint_path.shape[1] != 6:
+        raise ValueError("joint_path should have shape (N, 6).")
+    cdef double positions[30]
+    cdef double rotation[9]
+    cdef double clearances[MAX_OBSTACLES]
+    cdef bint has_transform = tool_transform is not None
+    cdef int count = 10 if has_transform else 9
+    cdef Scene *scene = SCENE
+    cdef Py_ssize_t i
+    cdef int k
+    with nogil:
+        for i in range(n):
+            forwardkinematics_c(&joint_path[i, 0], positions, rotation)
+            if has_transform:
+                tool_point(positions, rotation, tool_transform)
+            # We don't need the first two positions
+            if collision_c(scene, positions + 6, count - 2):
+                return i
+            clearance_c(scene, positions, count, clearances)
+            for k in range(scene.count):
+                if clearances[k] < 0:
+                    return i
+    return -1
+
+
 cpdef toolPositionDifference(current_position, target_position):
     cdef double x1, y1, z1, xr1, yr1, zr1, x2, y2, z2, xr2, yr2, zr2;
     x1, y1, z1, xr1, yr1, zr1 = current_position;
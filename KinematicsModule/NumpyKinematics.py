@@ -0,0 +1,323 @@
+import os
+import numpy as np
+
+from KinematicsModule.Scene import readScene, rotationMatrix, SCENE_PATH
+
+
+# The DH constants of the UR5, as in forwardkinematics.h
+UR5_D1 = 0.089159
+UR5_D4 = -0.119
+UR5_D5 = 0.09475
+UR5_D6 = 0.09475
+UR5_D7 = 0.0815
+UR5_A1 = -0.134
+UR5_A2 = -0.425
+UR5_A4 = -0.39225
+
+# The arrays of the active scene, filled by loadScene()
+OBSTACLE_NAMES = list()
+SCENE_FILE = None
+SCENE_MODIFIED = None
+CENTERS = ROTATIONS = HALF_EXTENTS = MARGINS = CONTAINS = None
+
+
+def loadScene(path=None):
+    r"""
+    Load the obstacles from a scene description file and make them the active
+    scene. The default is KinematicsModule/scene.json.
+    """
+    global OBSTACLE_NAMES, SCENE_FILE, SCENE_MODIFIED, CENTERS, ROTATIONS, HALF_EXTENTS, MARGINS, CONTAINS
+    path = SCENE_PATH if path is None else path
+    modified = os.path.getmtime(path)
+    obstacles = readScene(path)
+    CENTERS = np.array([obstacle.Center for obstacle in obstacles], np.float64).reshape(-1, 3)
+    ROTATIONS = np.array([rotationMatrix(obstacle.RotationVector) for obstacle in obstacles], np.float64).reshape(-1, 3, 3)
+    HALF_EXTENTS = np.array([obstacle.HalfExtents for obstacle in obstacles], np.float64).reshape(-1, 3)
+    MARGINS = np.array([obstacle.Margin for obstacle in obstacles], np.float64).reshape(-1, 3)
+    CONTAINS = np.array([obstacle.Contains for obstacle in obstacles], np.bool_)
+    OBSTACLE_NAMES = [obstacle.Name for obstacle in obstacles]
+    SCENE_FILE, SCENE_MODIFIED = path, modified
+
+
+def reloadScene():
+    r"""
+    Load the scene file again if it was modified since it was loaded. An
+    invalid file keeps the current scene.
+
+    Returns:
+    ----------
+    bool
+        Whether a new scene was loaded.
+    """
+    if SCENE_FILE is None:
+        return False
+    try:
+        if os.path.getmtime(SCENE_FILE) == SCENE_MODIFIED:
+            return False
+        loadScene(SCENE_FILE)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print("NumpyKinematics.py: keeping the current scene, {} could not be loaded: {}".format(SCENE_FILE, e))
+        return False
+    return True
+
+
+loadScene()
+
+
+def dhStep(M, theta, d, r, cos_a, sin_a):
+    r"""
+    Multiply the N x 3 x 4 rigid transformations M in place with the
+    Denavit-Hartenberg matrices of one joint, like dh_step() in forwardkinematics.h.
+    """
+    cos_t, sin_t = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    m0, m1, m2 = M[:, :, 0].copy(), M[:, :, 1].copy(), M[:, :, 2].copy()
+    M[:, :, 0] = m0*cos_t + m1*sin_t
+    M[:, :, 1] = -m0*sin_t*cos_a + m1*cos_t*cos_a + m2*sin_a
+    M[:, :, 2] = m0*sin_t*sin_a - m1*cos_t*sin_a + m2*cos_a
+    M[:, :, 3] += r*M[:, :, 0] + m2*d
+
+
+def forwardKinematicsFrames(joint_angles):
+    r"""
+    Compute the 9 joint positions and the frame of the last wrist of many
+    configurations at once, with the fused chain of forwardkinematics_c().
+
+    Returns:
+    ----------
+    positions, frames : np.array, np.array
+        The N x 9 x 3 positions and the N x 3 x 4 rotations and translations.
+    """
+    q = np.asarray(joint_angles, np.float64).reshape(-1, 6)
+    n = len(q)
+    positions = np.zeros((n, 9, 3), np.float64)
+    cos_t, sin_t = np.cos(q[:, 0]), np.sin(q[:, 0])
+    M = np.zeros((n, 3, 4), np.float64)
+    M[:, 0, 0], M[:, 0, 2], M[:, 0, 3] = cos_t, sin_t, -UR5_A1*sin_t
+    M[:, 1, 0], M[:, 1, 2], M[:, 1, 3] = sin_t, -cos_t, UR5_A1*cos_t
+    M[:, 2, 1], M[:, 2, 3] = 1, UR5_D1
+
+    positions[:, 1, 2] = UR5_D1
+    positions[:, 2] = M[:, :, 3]
+    dhStep(M, q[:, 1], 0, UR5_A2, 1, 0)        # shoulder
+    positions[:, 3] = M[:, :, 3]
+    dhStep(M, q[:, 2], UR5_D4, 0, 1, 0)        # elbow
+    positions[:, 4] = M[:, :, 3]
+    M[:, :, 3] += UR5_A4*M[:, :, 0]            # elbowend
+    positions[:, 5] = M[:, :, 3]
+    dhStep(M, q[:, 3], UR5_D5, 0, 0, 1)        # wrist1, alpha = pi/2
+    positions[:, 6] = M[:, :, 3]
+    dhStep(M, q[:, 4], UR5_D6, 0, 0, -1)       # wrist2, alpha = -pi/2
+    positions[:, 7] = M[:, :, 3]
+    dhStep(M, q[:, 5], UR5_D7, 0, 1, 0)        # wrist3
+    positions[:, 8] = M[:, :, 3]
+    return positions, M
+
+
+def ForwardKinematics(joint_angles, tool_position=None):
+    r"""
+    Compute the positions of all joints, like the compiled ForwardKinematics().
+
+    Returns:
+    ----------
+    X, Y, Z : list, list, list
+        The lists containing all x-, y- and z-positions of all joints.
+    """
+    positions, _ = forwardKinematicsFrames(joint_angles)
+    X, Y, Z = positions[0].T.tolist()
+    if tool_position is not None:
+        x, y, z = tool_position
+        X.append(x)
+        Y.append(y)
+        Z.append(z)
+    return X, Y, Z
+
+
+def ForwardKinematicsBatch(joint_angles, positions=None, tool_positions=None, num_threads=1):
+    r"""
+    Compute the forward kinematics of many configurations at once, like the
+    compiled ForwardKinematicsBatch(). The num_threads are ignored.
+
+    Returns:
+    ----------
+    positions : np.array
+        The N x 10 x 3 positions. The last one is the tool position if given,
+        otherwise the end of the last wrist.
+    """
+    joints, _ = forwardKinematicsFrames(joint_angles)
+    if positions is None:
+        positions = np.empty((len(joints), 10, 3), np.float64)
+    positions[:, :9] = joints
+    positions[:, 9] = joints[:, 8] if tool_positions is None else np.asarray(tool_positions, np.float64)[:, :3]
+    return positions
+
+
+def collisionCodes(points):
+    r"""
+    Test the N x P x 3 positions of N configurations against the obstacles of
+    the scene, with their margins.
+
+    Returns:
+    ----------
+    obstacles : np.array
+        The N uint8 codes: 0 without a collision, otherwise 1 + the index of an
+        obstacle in OBSTACLE_NAMES that is hit.
+    """
+    points = np.asarray(points, np.float64)
+    codes = np.zeros(points.shape[0], np.uint8)
+    for k in range(len(OBSTACLE_NAMES) - 1, -1, -1):  # The first obstacle in the scene wins
+        local = np.abs((points - CENTERS[k]).dot(ROTATIONS[k]))
+        if CONTAINS[k]:
+            hit = ~(local < HALF_EXTENTS[k] - MARGINS[k]).all(axis=-1).all(axis=-1)
+        else:
+            hit = (local < HALF_EXTENTS[k] + MARGINS[k]).all(axis=-1).any(axis=-1)
+        codes[hit] = k + 1
+    return codes
+
+
+def detectCollision(positions):
+    r"""
+    Detect whether any of the spatial positions computed by the forward kinematics
+    hits an obstacle of the scene, like the compiled detectCollision().
+    """
+    X, Y, Z = positions
+    points = np.stack((X, Y, Z), axis=-1)[2:]  # We don't need the first two positions
+    obstacle = collisionCodes(points[None])[0]
+    if obstacle:
+        print("NumpyKinematics.py: you are about to hit the {}".format(OBSTACLE_NAMES[obstacle - 1]))
+        return True
+    return False
+
+
+def detectPointCollision(x, y, z):
+    r"""
+    Test a single position, like the tool position, against the obstacles of
+    the scene. Does not print.
+    """
+    return bool(collisionCodes(np.array([[[x, y, z]]], np.float64))[0])
+
+
+def collisionBatch(joint_angles, tool_transform=None, num_threads=1):
+    r"""
+    Run the test of detectCollision() on the forward kinematics of many
+    configurations at once, like the compiled collisionBatch().
+    """
+    positions, frames = forwardKinematicsFrames(joint_angles)
+    points = positions[:, 2:]
+    if tool_transform is not None:
+        tool = positions[:, 8] + frames[:, :, :3].dot(np.asarray(tool_transform, np.float64)[:3, 3])
+        points = np.concatenate((points, tool[:, None]), axis=1)
+    return collisionCodes(points)
+
+
+def angleDifference(a, b):
+    return np.pi - np.abs(np.abs(np.subtract(a, b)) - np.pi)
+
+
+def toolPositionDifference(current_position, target_position):
+    current, target = np.asarray(current_position, np.float64), np.asarray(target_position, np.float64)
+    return tuple(np.abs(current[:3] - target[:3]).tolist() + angleDifference(current[3:], target[3:]).tolist())
+
+
+def jointAngleDifference(current_position, target_position):
+    return tuple(angleDifference(current_position, target_position).tolist())
+
+
+def spatialDifference(current_position, target_position):
+    r"""
+    Compute the L2 spatial distance between two tool positions.
+    """
+    return float(np.linalg.norm(np.subtract(target_position[:3], current_position[:3])))
+
+
+def rpyToMatrix(rpy):
+    roll, pitch, yaw = np.moveaxis(rpy, -1, 0)
+    cr, sr, cp, sp, cy, sy = np.cos(roll), np.sin(roll), np.cos(pitch), np.sin(pitch), np.cos(yaw), np.sin(yaw)
+    return np.stack((cy*cp, cy*sp*sr - sy*cr, cy*sp*cr + sy*sr,
+                     sy*cp, sy*sp*sr + cy*cr, sy*sp*cr - cy*sr,
+                     -sp, cp*sr, cp*cr), axis=-1).reshape(rpy.shape[:-1] + (3, 3))
+
+
+def matrixToRPY(R):
+    cp = np.hypot(R[..., 0, 0], R[..., 1, 0])
+    regular = cp > 1e-9
+    roll = np.where(regular, np.arctan2(R[..., 2, 1], R[..., 2, 2]), np.arctan2(-R[..., 1, 2], R[..., 1, 1]))
+    yaw = np.where(regular, np.arctan2(R[..., 1, 0], R[..., 0, 0]), 0.0)
+    return np.stack((roll, np.arctan2(-R[..., 2, 0], cp), yaw), axis=-1)
+
+
+def rotvecToQuaternion(v):
+    angle = np.linalg.norm(v, axis=-1)
+    scale = np.where(angle > 1e-12, np.sin(angle/2)/np.where(angle > 1e-12, angle, 1), 0.5)
+    return np.concatenate((np.cos(angle/2)[..., None], scale[..., None]*v), axis=-1)
+
+
+def quaternionToRotvec(q):
+    q = np.where(q[..., :1] < 0, -q, q)
+    n = np.linalg.norm(q[..., 1:], axis=-1)
+    safe = np.where(n > 1e-12, n, 1)
+    scale = np.where(n > 1e-12, 2*np.arctan2(n, q[..., 0])/safe, 2/np.where(q[..., 0] > 0, q[..., 0], np.inf))
+    return scale[..., None]*q[..., 1:]
+
+
+def quaternionToMatrix(q):
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    n = w*w + x*x + y*y + z*z
+    f = np.where(n > 1e-24, 2/np.where(n > 1e-24, n, 1), 0)
+    return np.stack((1 - f*(y*y + z*z), f*(x*y - w*z), f*(x*z + w*y),
+                     f*(x*y + w*z), 1 - f*(x*x + z*z), f*(y*z - w*x),
+                     f*(x*z - w*y), f*(y*z + w*x), 1 - f*(x*x + y*y)), axis=-1).reshape(q.shape[:-1] + (3, 3))
+
+
+def matrixToQuaternion(R):
+    r"""
+    Compute the unit quaternions of rotation matrices from the largest of the
+    trace and the diagonal, with a positive w, like matrix_to_quaternion().
+    """
+    r00, r11, r22 = R[..., 0, 0], R[..., 1, 1], R[..., 2, 2]
+    candidates = np.stack((r00 + r11 + r22, r00, r11, r22), axis=-1)
+    case = np.argmax(candidates, axis=-1)
+    denominators = np.stack((1 + r00 + r11 + r22, 1 + r00 - r11 - r22, 1 + r11 - r00 - r22, 1 + r22 - r00 - r11), axis=-1)
+    f = 0.5/np.sqrt(np.maximum(np.take_along_axis(denominators, case[..., None], -1)[..., 0], 1e-300))
+    zy, xz, yx = R[..., 2, 1] - R[..., 1, 2], R[..., 0, 2] - R[..., 2, 0], R[..., 1, 0] - R[..., 0, 1]
+    xy, xz_, yz = R[..., 0, 1] + R[..., 1, 0], R[..., 0, 2] + R[..., 2, 0], R[..., 1, 2] + R[..., 2, 1]
+    q = np.stack((
+        np.choose(case, (0.25/f, zy*f, xz*f, yx*f)),
+        np.choose(case, (zy*f, 0.25/f, xy*f, xz_*f)),
+        np.choose(case, (xz*f, xy*f, 0.25/f, yz*f)),
+        np.choose(case, (yx*f, xz_*f, yz*f, 0.25/f))), axis=-1)
+    return np.where(q[..., :1] < 0, -q, q)
+
+
+ROTATION_SHAPES = {'rpy': (3,), 'rotvec': (3,), 'quaternion': (4,), 'matrix': (3, 3)}
+TO_MATRIX = {'rpy': rpyToMatrix, 'rotvec': lambda v: quaternionToMatrix(rotvecToQuaternion(v)),
+             'quaternion': quaternionToMatrix, 'matrix': lambda R: R}
+FROM_MATRIX = {'rpy': matrixToRPY, 'rotvec': lambda R: quaternionToRotvec(matrixToQuaternion(R)),
+               'quaternion': matrixToQuaternion, 'matrix': lambda R: R}
+
+
+def convertRotations(rotations, source, target, num_threads=1):
+    r"""
+    Convert rotations between 'rpy', 'rotvec', 'quaternion' and 'matrix', like
+    the compiled convertRotations(). The num_threads are ignored.
+    """
+    if source not in ROTATION_SHAPES or target not in ROTATION_SHAPES:
+        raise ValueError("Rotations are one of {}, not {} and {}.".format(', '.join(ROTATION_SHAPES), source, target))
+    values = np.array(rotations, np.float64)
+    shape = ROTATION_SHAPES[source]
+    if values.ndim < len(shape) or values.shape[values.ndim - len(shape):] != shape:
+        raise ValueError("{} rotations should have shape (..., {}), not {}.".format(source, ', '.join(map(str, shape)), values.shape))
+    if source == target:
+        return values
+    if source == 'rotvec' and target == 'quaternion':
+        return rotvecToQuaternion(values)
+    if source == 'quaternion' and target == 'rotvec':
+        return quaternionToRotvec(values)
+    return FROM_MATRIX[target](TO_MATRIX[source](values))
+
+
+def RPY2RotVec(roll, pitch, yaw):
+    return tuple(convertRotations([roll, pitch, yaw], 'rpy', 'rotvec').tolist())
+
+
+def RotVec2RPY(rx, ry, rz):
+    return tuple(convertRotations([rx, ry, rz], 'rotvec', 'rpy').tolist())
@@ -0,0 +1,90 @@
+import os
+import json
+import numpy as np
+from collections import namedtuple
+
+
+# The scene both kinematics implementations load their obstacles from
+SCENE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scene.json")
+
+Obstacle = namedtuple('Obstacle', ['Name', 'Center', 'HalfExtents', 'RotationVector', 'Contains', 'Margin'])
+
+
+def readScene(path=SCENE_PATH):
+    r"""
+    Read the obstacles from a scene description file. Every obstacle is an
+    oriented box, given by its min and max corner or by a center, half extents
+    and a rotation vector. Raises a ValueError for an invalid obstacle.
+
+    Parameters:
+    ----------
+    path : str
+        The path to the json file.
+
+    Returns:
+    ----------
+    obstacles : list of Obstacle
+        The obstacles in the order of the file.
+    """
+    with open(path) as file:
+        description = json.load(file)
+
+    obstacles = list()
+    for number, item in enumerate(description.get("obstacles", [])):
+        name = item.get("name", "obstacle {}".format(number))
+        if "min" in item and "max" in item:
+            low, high = np.array(item["min"], np.float64), np.array(item["max"], np.float64)
+            center, half_extents = (low + high) / 2, (high - low) / 2
+        elif "center" in item and "half_extents" in item:
+            center, half_extents = np.array(item["center"], np.float64), np.array(item["half_extents"], np.float64)
+        else:
+            raise ValueError("Obstacle {} in {} needs a min and max, or a center and half_extents.".format(name, path))
+        rotation_vector = np.array(item.get("rotation_vector", (0.0, 0.0, 0.0)), np.float64)
+        margin = np.broadcast_to(np.array(item.get("margin", 0.0), np.float64), (3,))
+        if center.shape != (3,) or half_extents.shape != (3,) or rotation_vector.shape != (3,) or (half_extents <= 0).any():
+            raise ValueError("Obstacle {} in {} is not a valid box.".format(name, path))
+        obstacles.append(Obstacle(name, tuple(center.tolist()), tuple(half_extents.tolist()), tuple(rotation_vector.tolist()),
+                                  bool(item.get("contains", False)), tuple(margin.tolist())))
+    return obstacles
+
+
+def rotationMatrix(rotation_vector):
+    r"""
+    Convert a rotation vector to a rotation matrix with the Rodrigues formula.
+    """
+    rotation_vector = np.asarray(rotation_vector, np.float64)
+    angle = np.linalg.norm(rotation_vector)
+    if angle < 1e-12:
+        return np.eye(3)
+    x, y, z = rotation_vector / angle
+    K = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    return np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * K.dot(K)
+
+
+def pointCollision(points, obstacles):
+    r"""
+    Test points against the obstacles, with the margins of the scene. Slow
+    Python version of the test in the Cython detectCollision().
+
+    Parameters:
+    ----------
+    points : np.array
+        The N x 3 positions.
+    obstacles : list of Obstacle
+        The obstacles from readScene().
+
+    Returns:
+    ----------
+    obstacle : Obstacle
+        The first obstacle that is hit, or None.
+    """
+    points = np.asarray(points, np.float64)
+    for obstacle in obstacles:
+        local = np.abs((points - obstacle.Center).dot(rotationMatrix(obstacle.RotationVector)))
+        margin = np.array(obstacle.Margin)
+        if obstacle.Contains:
+            if not (local < np.array(obstacle.HalfExtents) - margin).all():
+                return obstacle
+        elif (local < np.array(obstacle.HalfExtents) + margin).all(axis=1).any():
+            return obstacle
+    return None
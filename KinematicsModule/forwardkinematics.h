@@ -4,52 +4,16 @@
 
 #define PI 3.14159265359
 
-
-double *T_c(double theta, double d, double r, double alpha){
-    /*
-    Make a rotation and translation matrix according to the
-    Denavit-Hartenberg convention. Fast C implementation.
-
-    Parameters:
-    ----------
-    theta : float
-        The angle at which the joint is rotated with respect to the previous arm.
-    d : float
-        The distance between the previous x-axis and the current x-axis, along
-        the previous z-axis.
-    r : float
-        The length of the common normal, which is the distance between the
-        previous z-axis and the current z-axis.
-    alpha : float
-        The angle around the common normal to between the previous z-axis and
-        the current z-axis.
-
-    Returns:
-    ----------
-    result : c double array pointer
-        1 x 16 matrix containing the rotation and translation.
-    */
-
-    double cos_t = cos(theta);
-    double sin_t = sin(theta);
-    double cos_a = cos(alpha);
-    double sin_a = sin(alpha);
-    double *result = (double*) calloc(16, sizeof(double));
-
-    result[0] = cos_t;
-    result[1] = -sin_t*cos_a;
-    result[2] = sin_t*sin_a;
-    result[3] = r*cos_t;
-    result[4] = sin_t;
-    result[5] = cos_t*cos_a;
-    result[6] = -cos_t*sin_a;
-    result[7] = r*sin_t;
-    result[9] = sin_a;
-    result[10] = cos_a;
-    result[11] = d;
-    result[15] = 1;
-    return result;
-}
+/* The Denavit-Hartenberg parameters of the UR5, see
+https://www.universal-robots.com/articles/ur-articles/parameters-for-calculations-of-kinematics-and-dynamics/ */
+#define UR5_D1  0.089159
+#define UR5_D4 -0.119
+#define UR5_D5  0.09475
+#define UR5_D6  0.09475
+#define UR5_D7  0.0815
+#define UR5_A1 -0.134
+#define UR5_A2 -0.425
+#define UR5_A4 -0.39225
 
 
 void dot_c(double *A, double *B){
@@ -68,7 +32,7 @@ void dot_c(double *A, double *B){
         1 x 16 matrix containing matrix multiplication.
     */
 
-    double *result = (double*) malloc(sizeof(double)*16);
+    double result[16];
     result[0]  = A[0]*B[0] + A[1]*B[4] + A[2]*B[8] + A[3]*B[12];
     result[1]  = A[0]*B[1] + A[1]*B[5] + A[2]*B[9] + A[3]*B[13];
     result[2]  = A[0]*B[2] + A[1]*B[6] + A[2]*B[10] + A[3]*B[14];
@@ -90,10 +54,126 @@ void dot_c(double *A, double *B){
     result[15] = A[12]*B[3] + A[13]*B[7] + A[14]*B[11] + A[15]*B[15];
     short i;
     for (i = 0; i < 16; i++) B[i] = result[i];
-    free(result);
 }
 
 
 double d_angle(double a, double b){
     return PI - fabs(fabs(a - b) - PI);
-}
\ No newline at end of file
+}
+
+
+static inline void dh_step(double *M, double theta, double d, double r, double cos_a, double sin_a){
+    /*
+    Multiply the 3 x 4 rigid transformation M in place with the
+    Denavit-Hartenberg matrix of one joint. The bottom row of both matrices is
+    always [0, 0, 0, 1], so it is neither stored nor multiplied.
+
+    Parameters:
+    ----------
+    M : c double array pointer
+        1 x 12 rows of the rotation and translation, updated in place.
+    theta, d, r : float
+        The joint angle and the DH distances, as in T() in Kinematics.pyx.
+    cos_a, sin_a : float
+        The precomputed cosine and sine of the fixed DH angle alpha.
+    */
+
+    double cos_t = cos(theta);
+    double sin_t = sin(theta);
+    double b1 = -sin_t*cos_a, b2 = sin_t*sin_a;
+    double b5 =  cos_t*cos_a, b6 = -cos_t*sin_a;
+    double m0, m1, m2;
+    short row;
+    for (row = 0; row < 12; row += 4){
+        m0 = M[row]; m1 = M[row + 1]; m2 = M[row + 2];
+        M[row]     = m0*cos_t + m1*sin_t;
+        M[row + 1] = m0*b1 + m1*b5 + m2*sin_a;
+        M[row + 2] = m0*b2 + m1*b6 + m2*cos_a;
+        M[row + 3] = M[row + 3] + r*(m0*cos_t + m1*sin_t) + m2*d;
+    }
+}
+
+
+static inline void store_position(const double *M, double *position){
+    position[0] = M[3];
+    position[1] = M[7];
+    position[2] = M[11];
+}
+
+
+static inline void store_axis(const double *M, double *axis){
+    axis[0] = M[2];
+    axis[1] = M[6];
+    axis[2] = M[10];
+}
+
+
+static inline void forwardkinematics_frames(const double *joint_angles, double *positions, double *rotation, double *axes){
+    /*
+    Compute the forward kinematics of the UR5 robot arm in one fused pass, with
+    the DH constants and the sines and cosines of alpha known at compile time.
+    All intermediates live on the stack and nothing is allocated. The constant
+    elbowend frame is only a translation along the current x-axis, so it is
+    added instead of multiplied. Gives the same chain as forwardkinematics().
+
+    Parameters:
+    ----------
+    joint_angles : c double array pointer
+        The 6 joint angles of the UR5 robot.
+    positions : c double array pointer
+        The caller supplied buffer of at least 27 doubles, filled with the
+        x, y and z of the 9 joint positions.
+    rotation : c double array pointer
+        The caller supplied buffer of 9 doubles, filled with the rotation of the
+        last wrist row by row. Skipped when NULL.
+    axes : c double array pointer
+        The caller supplied buffer of 18 doubles, filled with the unit rotation
+        axes of the 6 joints. Every axis is the z-axis of the frame before the
+        DH step of its joint. Skipped when NULL.
+    */
+
+    double cos_t = cos(joint_angles[0]);
+    double sin_t = sin(joint_angles[0]);
+    /* The base frame, with alpha = pi/2 and the translation rotated a quarter turn */
+    double M[12] = {cos_t, 0, sin_t, -UR5_A1*sin_t,
+                    sin_t, 0, -cos_t, UR5_A1*cos_t,
+                    0, 1, 0, UR5_D1};
+
+    positions[0] = 0; positions[1] = 0; positions[2] = 0;
+    positions[3] = 0; positions[4] = 0; positions[5] = UR5_D1;
+    store_position(M, positions + 6);
+    if (axes != NULL){
+        axes[0] = 0; axes[1] = 0; axes[2] = 1;
+        store_axis(M, axes + 3);
+    }
+    dh_step(M, joint_angles[1], 0, UR5_A2, 1, 0);        /* shoulder */
+    store_position(M, positions + 9);
+    if (axes != NULL) store_axis(M, axes + 6);
+    dh_step(M, joint_angles[2], UR5_D4, 0, 1, 0);        /* elbow */
+    store_position(M, positions + 12);
+    M[3] += UR5_A4*M[0]; M[7] += UR5_A4*M[4]; M[11] += UR5_A4*M[8];  /* elbowend */
+    store_position(M, positions + 15);
+    if (axes != NULL) store_axis(M, axes + 9);
+    dh_step(M, joint_angles[3], UR5_D5, 0, 0, 1);        /* wrist1, alpha = pi/2 */
+    store_position(M, positions + 18);
+    if (axes != NULL) store_axis(M, axes + 12);
+    dh_step(M, joint_angles[4], UR5_D6, 0, 0, -1);       /* wrist2, alpha = -pi/2 */
+    store_position(M, positions + 21);
+    if (axes != NULL) store_axis(M, axes + 15);
+    dh_step(M, joint_angles[5], UR5_D7, 0, 1, 0);        /* wrist3 */
+    store_position(M, positions + 24);
+    if (rotation != NULL){
+        rotation[0] = M[0]; rotation[1] = M[1]; rotation[2] = M[2];
+        rotation[3] = M[4]; rotation[4] = M[5]; rotation[5] = M[6];
+        rotation[6] = M[8]; rotation[7] = M[9]; rotation[8] = M[10];
+    }
+}
+
+
+void forwardkinematics_c(const double *joint_angles, double *positions, double *rotation){
+    /*
+    Compute the 9 joint positions and the rotation of the last wrist, see
+    forwardkinematics_frames().
+    */
+    forwardkinematics_frames(joint_angles, positions, rotation, NULL);
+}
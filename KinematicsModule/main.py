@@ -3,7 +3,8 @@ import numpy as np
 
 import os, sys
 sys.path.append(os.getcwd())  # Append the current path tp PYTHONPATH to include parent directories
-from KinematicsLib.KinematicsModule import ForwardKinematics, detectCollision
+from KinematicsLib.cKinematics import ForwardKinematics, ForwardKinematicsBatch, InverseKinematicsBatch, detectCollision
+from KinematicsLib.cKinematics import RPY2RotVec, convertRotations, JacobianBatch, predictPositions
 
 
 def SpeedOfCurrentKinematics():
@@ -16,6 +17,26 @@ def SpeedOfCurrentKinematics():
     print(n/interval, "iterations per second")
 
 
+def SpeedOfBatchedKinematics(num_threads=1):
+    n = 1000000
+    joint_angles = np.random.uniform(-np.pi, np.pi, (n, 6))
+    positions = np.empty((n, 10, 3))
+    start = time.time()
+    ForwardKinematicsBatch(joint_angles, positions, num_threads=num_threads)
+    interval = time.time() - start
+    print(n/interval, "iterations per second")
+
+
+def SpeedOfInverseKinematics(num_threads=1):
+    n = 1000000
+    tool_positions = np.random.uniform(-0.5, 0.5, (n, 6))
+    solutions = np.empty((n, 8, 6))
+    start = time.time()
+    InverseKinematicsBatch(tool_positions, solutions, num_threads=num_threads)
+    interval = time.time() - start
+    print(n/interval, "iterations per second")
+
+
 def SpeedOfCollisionDetection():
     start = time.time()
     X = [0.1]*9
@@ -30,12 +51,62 @@ def SpeedOfCollisionDetection():
     print(n/interval, "iterations per second")
 
 
+def SpeedOfRotations(num_threads=1):
+    n = 100000
+    start = time.time()
+    for _ in range(n):
+        RPY2RotVec(0.0, 3.141509, -2.4934075403510954)
+    interval = time.time() - start
+    print(n/interval, "iterations per second")
+
+    n = 1000000
+    rpy = np.random.uniform(-np.pi, np.pi, (n, 3))
+    start = time.time()
+    convertRotations(rpy, 'rpy', 'rotvec', num_threads=num_threads)
+    interval = time.time() - start
+    print(n/interval, "iterations per second")
+
+
+def SpeedOfJacobian(num_threads=1):
+    n = 1000000
+    joint_angles = np.random.uniform(-np.pi, np.pi, (n, 6))
+    joint_velocities = np.random.uniform(-np.pi, np.pi, (n, 6))
+    jacobians = np.empty((n, 10, 3, 6))
+    start = time.time()
+    JacobianBatch(joint_angles, jacobians=jacobians, num_threads=num_threads)
+    interval = time.time() - start
+    print(n/interval, "iterations per second")
+
+    start = time.time()
+    predictPositions(joint_angles, joint_velocities, 0.008, num_threads=num_threads)
+    interval = time.time() - start
+    print(n/interval, "iterations per second")
+
+
 if __name__ == '__main__':
+    # Benchmarks.py runs all of these at several batch sizes and compares them to a baseline
     # SpeedOfCurrentKinematics()
     #  14195 iterations per second by using just a function (benchmark)
     # 400227 iterations per second by using cython
     # 499907 iterations per second by using cython with c functions
     # 547236 iterations per second by using smaller buffers in matmul
+    # 674280 iterations per second by using the fused kernel without allocations (608838 before, same machine)
+
+    # SpeedOfBatchedKinematics()
+    # 2095402 iterations per second by running the batch without the GIL
+    # 4453658 iterations per second by using the fused kernel without allocations
+
+    # SpeedOfInverseKinematics()
+    # 298050 iterations per second for all 8 closed form solutions
 
     SpeedOfCollisionDetection()
     # 723004 iterations per second for the simple Cython implementation
+
+    # SpeedOfRotations()
+    #   20000 iterations per second for RPY2RotVecRodr() with cv2.Rodrigues (benchmark)
+    # 3513405 iterations per second for RPY2RotVec() in cython
+    # 6421753 iterations per second by converting a batch without the GIL
+
+    # SpeedOfJacobian()
+    # 1439570 iterations per second for the Jacobians of all 10 positions
+    # 3078388 iterations per second for predicting the positions one cycle ahead
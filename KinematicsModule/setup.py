@@ -1,13 +1,25 @@
+import os
 from distutils.core import setup
 from distutils.extension import Extension
 from Cython.Build import cythonize
 
 
+# Compile with OpenMP to run ForwardKinematicsBatch on several threads: KINEMATICS_OPENMP=1 make
+OPENMP = os.environ.get("KINEMATICS_OPENMP", "0") == "1"
+
+
 def compile_cython():
+    compile_args = ["-march=native", "-ffast-math", "-O3"]
+    link_args = []
+    if OPENMP:
+        compile_args.append("-fopenmp")
+        link_args.append("-fopenmp")
+
     extensions = cythonize([Extension(
             "cKinematics",
             sources=["Kinematics.pyx"],
-            extra_compile_args=["-march=native", "-ffast-math", "-O3"])],
+            extra_compile_args=compile_args,
+            extra_link_args=link_args)],
             compiler_directives={'language_level': "3"})
 
     setup(
@@ -0,0 +1,198 @@
+import time
+import struct
+
+from Readers import StateReader, RealTimeState, ROBOT_IP
+
+
+# The header of every RTDE package: the package size, including the header, and the package type
+RTDE_HEADER = struct.Struct('>HB')
+RTDE_PROTOCOL_VERSION = 2
+
+RTDE_REQUEST_PROTOCOL_VERSION = ord('V')
+RTDE_GET_URCONTROL_VERSION = ord('v')
+RTDE_TEXT_MESSAGE = ord('M')
+RTDE_DATA_PACKAGE = ord('U')
+RTDE_CONTROL_PACKAGE_SETUP_OUTPUTS = ord('O')
+RTDE_CONTROL_PACKAGE_START = ord('S')
+RTDE_CONTROL_PACKAGE_PAUSE = ord('P')
+
+# The struct format of every RTDE data type
+RTDE_TYPES = {'BOOL': '?', 'UINT8': 'B', 'UINT32': 'I', 'UINT64': 'Q', 'INT32': 'i', 'DOUBLE': 'd',
+              'VECTOR3D': '3d', 'VECTOR6D': '6d', 'VECTOR6INT32': '6i', 'VECTOR6UINT32': '6I'}
+
+
+def packRTDE(package_type, payload=b''):
+    r"""
+    Prepend the RTDE header to the payload of a package.
+    """
+    return RTDE_HEADER.pack(RTDE_HEADER.size + len(payload), package_type) + payload
+
+
+class RTDERecipe(object):
+    r"""
+    Class used to represent an output recipe that was negotiated with the
+    controller: the variables it sends in every data package and how to unpack
+    them.
+
+    Attributes:
+    -------
+    ID : int
+        The recipe id the controller assigned, repeated in every data package.
+    Names : list of str
+        The names of the variables in the recipe.
+    Types : list of str
+        The RTDE data types of the variables.
+    Format : Struct
+        The compiled format that unpacks all variables at once.
+    Sizes : list of int
+        The number of values every variable unpacks to.
+    """
+
+    __slots__ = ('ID', 'Names', 'Types', 'Format', 'Sizes')
+
+    def __init__(self, recipe_id, names, types):
+        missing = [name for name, data_type in zip(names, types) if data_type not in RTDE_TYPES]
+        if missing:
+            raise ValueError("The controller does not know the RTDE variables {}.".format(missing))
+        self.ID = recipe_id
+        self.Names = names
+        self.Types = types
+        self.Format = struct.Struct('>' + ''.join(RTDE_TYPES[data_type] for data_type in types))
+        self.Sizes = [int(RTDE_TYPES[data_type][:-1] or 1) for data_type in types]
+
+    def __repr__(self):
+        return "RTDERecipe {}: {}".format(self.ID, ', '.join(self.Names))
+
+    def unpack(self, data, offset=0):
+        r"""
+        Unpack a data package into a dictionary of values. Vectors are tuples.
+        """
+        values = self.Format.unpack_from(data, offset)
+        result = dict()
+        index = 0
+        for name, size in zip(self.Names, self.Sizes):
+            result[name] = values[index] if size == 1 else values[index:index + size]
+            index += size
+        return result
+
+
+class RTDEReader(StateReader):
+    r"""
+    Class used to receive the robot state through the Real-Time Data Exchange
+    interface on port 30004. After connecting, an output recipe is negotiated and
+    the controller pushes a data package at a fixed frequency, without a request
+    per sample. Every package is published as a RealTimeState, so the reader
+    can replace the ModBusReader: Robot(state_reader=RTDEReader).
+
+    Attributes:
+    -------
+    Variables : list of str
+        The output variables that are requested from the controller.
+    Frequency : float
+        The frequency at which the controller sends data packages. At most 125 Hz
+        on a CB3 controller.
+    Recipe : RTDERecipe
+        The recipe the controller accepted.
+    PackageCount : int
+        The number of data packages received so far.
+    """
+
+    Variables = ['timestamp', 'actual_q', 'actual_qd', 'actual_current', 'actual_TCP_pose', 'actual_digital_output_bits', 'robot_mode']
+    GRIPPER_BIT = 8
+
+    def __init__(self, ip=ROBOT_IP, port=30004, frequency=125.0, history_length=4096):
+        self.Frequency = frequency
+        self.Recipe = None
+        self.PackageCount = 0
+        super(RTDEReader, self).__init__(ip, port, history_length)
+
+    def connectSafely(self):
+        r"""
+        Connect to the socket and negotiate the output recipe, also when the
+        reader thread reconnects after an error.
+        """
+        super(RTDEReader, self).connectSafely()
+        self.negotiate()
+
+    def sendPackage(self, package_type, payload=b''):
+        self.sendall(packRTDE(package_type, payload))
+
+    def receivePackage(self):
+        r"""
+        Receive one complete package into the ReceiveBuffer. The buffer grows
+        once if the controller sends longer packages than BufferLength.
+
+        Returns:
+        ----------
+        package_type, payload : int, memoryview
+            The type of the package and its payload, without the header.
+        """
+        header = self.receiveExactly(RTDE_HEADER.size)
+        if len(header) != RTDE_HEADER.size:
+            raise ConnectionError('{} closed the connection.'.format(self.Address))
+        size, package_type = RTDE_HEADER.unpack_from(header)
+        if size > len(self.ReceiveBuffer):
+            self.ReceiveBuffer = bytearray(size)
+            self.ReceiveView = memoryview(self.ReceiveBuffer)
+        payload = self.receiveExactly(size - RTDE_HEADER.size, offset=RTDE_HEADER.size)
+        if len(payload) != size - RTDE_HEADER.size:
+            raise ConnectionError('{} closed the connection.'.format(self.Address))
+        return package_type, payload
+
+    def request(self, package_type, payload=b''):
+        r"""
+        Send a control package and wait for the reply of the same type. Data and
+        text packages that arrive in the meantime are skipped.
+        """
+        self.sendPackage(package_type, payload)
+        while True:
+            reply_type, reply = self.receivePackage()
+            if reply_type == package_type:
+                return bytes(reply)
+
+    def negotiate(self):
+        r"""
+        Agree on the protocol version, set up the output recipe and start the
+        data synchronisation. Raises a ConnectionError if the controller refuses.
+        """
+        if not self.request(RTDE_REQUEST_PROTOCOL_VERSION, struct.pack('>H', RTDE_PROTOCOL_VERSION))[0]:
+            raise ConnectionError('{} does not accept RTDE protocol version {}.'.format(self.Address, RTDE_PROTOCOL_VERSION))
+        reply = self.request(RTDE_CONTROL_PACKAGE_SETUP_OUTPUTS, struct.pack('>d', self.Frequency) + ','.join(self.Variables).encode())
+        self.Recipe = RTDERecipe(reply[0], self.Variables, reply[1:].decode().split(','))
+        if not self.request(RTDE_CONTROL_PACKAGE_START)[0]:
+            raise ConnectionError('{} did not start the RTDE synchronisation.'.format(self.Address))
+
+    def decodePackage(self, payload):
+        r"""
+        Convert a data package to a RealTimeState. The tool current is not in the
+        recipe, so the tool bit is always settled.
+        """
+        values = self.Recipe.unpack(payload, 1)  # Skip the recipe id
+        digital_outputs = values['actual_digital_output_bits']
+        return RealTimeState(time.monotonic(), values['actual_q'], values['actual_TCP_pose'],
+                             (digital_outputs >> self.GRIPPER_BIT) & 1, True, -1,
+                             values['timestamp'], values['actual_qd'], values['actual_current'],
+                             values['robot_mode'], digital_outputs)
+
+    def read(self, communicating_started_event):
+        r"""
+        Receive the next package the controller pushes and publish it if it is a
+        data package of our recipe.
+        """
+        package_type, payload = self.receivePackage()
+        if package_type != RTDE_DATA_PACKAGE or payload[0] != self.Recipe.ID:
+            return
+        self.PackageCount += 1
+        self.publish(self.decodePackage(payload))
+        communicating_started_event.set()
+
+    def shutdownSafely(self, verbose=True):
+        r"""
+        Pause the data synchronisation before closing the connection.
+        """
+        if self.Recipe is not None and not self.isClosed():
+            try:
+                self.sendPackage(RTDE_CONTROL_PACKAGE_PAUSE)
+            except OSError:
+                pass
+        super(RTDEReader, self).shutdownSafely(verbose)
@@ -1,9 +1,27 @@
+import time
 import socket
+import struct
 import errno
 
 from weakref import ref
-from threading import Thread, Event
+from collections import namedtuple
+from threading import Thread, Event, Condition
 from Functionalities import communicateError
+from StateHistory import StateHistory
+
+# The modbus application header: transaction id, protocol id, length and unit id
+MBAP_HEADER = struct.Struct('>HHHB')
+
+# The address of the robot controller the readers connect to by default
+ROBOT_IP = "192.168.1.17"
+
+# An immutable snapshot of all values read in one cycle. Readers replace their
+# State attribute by a new snapshot once per cycle, which is a single atomic
+# reference assignment, so consumers never see values of two different cycles.
+RobotState = namedtuple('RobotState', ['Time', 'JointAngles', 'ToolPosition', 'ToolBit', 'ToolBitSettled', 'ToolCurrent'])
+# The real-time interface sends more than the modbus. The extra fields come last,
+# so a RealTimeState can be used wherever a RobotState is expected.
+RealTimeState = namedtuple('RealTimeState', RobotState._fields + ('ControllerTime', 'JointVelocities', 'JointCurrents', 'RobotMode', 'DigitalOutputs'))
 
 
 class ParameterInfo(object):
@@ -73,6 +91,98 @@ class ParameterInfo(object):
             cls.Instances.remove(item)
 
 
+class RegisterBlock(object):
+    r"""
+    Class used to represent a contiguous range of modbus registers that can be
+    requested in a single function code 3 message, together with the
+    ParameterInfo instances that are decoded from the reply.
+
+    Attributes:
+    -------
+    Start : int
+        The decimal address of the first register in the block.
+    Count : int
+        The number of registers in the block.
+    Parameters : list of tuples
+        The (offset, ParameterInfo) pairs in the block, where the offset is the
+        register position with respect to Start. Registers in between that are
+        read but not needed have no entry.
+    Request : bytes
+        The request for this block without the two byte transaction identifier,
+        so it is not rebuilt every cycle.
+    ReplyLength : int
+        The number of bytes the modbus replies with: a 9 byte header followed
+        by two bytes per register.
+    Format : Struct
+        The compiled format that unpacks all registers in the block at once as
+        big-endian signed 16 bit integers.
+
+    Example:
+    -------
+    -> RegisterBlock(270, 6, [(0, BaseAngle), (1, ShoulderAngle), ..., (5, Wrist3Angle)])
+    Reads registers 270 up to and including 275 in one round trip.
+    """
+
+    __slots__ = ('Start', 'Count', 'Parameters', 'Request', 'ReplyLength', 'Format')
+
+    def __init__(self, start, count, parameters):
+        self.Start = start
+        self.Count = count
+        self.Parameters = parameters
+        self.Request = b'\x00\x00\x00\x06\x00\x03' + start.to_bytes(2, 'big') + self.Count.to_bytes(2, 'big')
+        self.ReplyLength = 9 + 2 * self.Count
+        self.Format = struct.Struct('>{}h'.format(self.Count))
+
+    def __repr__(self):
+        return "RegisterBlock {}-{}".format(self.Start, self.Start + self.Count - 1)
+
+    @staticmethod
+    def plan(parameters, max_gap=0, max_count=125):
+        r"""
+        Group the given parameters into the fewest contiguous register blocks.
+        Parameters whose registers are at most max_gap registers apart end up in
+        the same block, the unused registers in between are read and discarded.
+
+        Parameters:
+        ----------
+        parameters : iterable of ParameterInfo
+            The parameters we wish to read from the modbus.
+        max_gap : int
+            The number of unused registers we accept to read to save a request.
+        max_count : int
+            The maximum number of registers in one request. The modbus protocol
+            allows 125 registers per read.
+
+        Returns:
+        ----------
+        blocks : list of RegisterBlock
+            The blocks sorted by their start address.
+        """
+        blocks = list()
+        current = list()
+        for parameter in sorted(parameters, key=lambda x: x.Decimal):
+            if current:
+                start = current[0].Decimal
+                end = current[-1].Decimal
+                if parameter.Decimal - end - 1 <= max_gap and parameter.Decimal - start < max_count:
+                    current.append(parameter)
+                    continue
+                blocks.append(RegisterBlock.fromParameters(current))
+            current = [parameter]
+        if current:
+            blocks.append(RegisterBlock.fromParameters(current))
+        return blocks
+
+    @classmethod
+    def fromParameters(cls, parameters):
+        r"""
+        Make a block that spans the given parameters, sorted by their address.
+        """
+        start = parameters[0].Decimal
+        count = parameters[-1].Decimal - start + 1
+        return cls(start, count, [(parameter.Decimal - start, parameter) for parameter in parameters])
+
+
 class Reader(socket.socket):
     r"""
     Class used to extend the python socket with custom methods and attributes.
@@ -83,6 +193,11 @@ class Reader(socket.socket):
         The IP address and port we wich to connect to.
     BufferLength : int
         The length of the buffer when receiving messages from the socket.
+    ReceiveBuffer : bytearray
+        The buffer that is reused for every message, so receiving does not
+        allocate a new bytes object per message.
+    ReceiveView : memoryview
+        The view on the ReceiveBuffer that messages are received into.
     ThreadLock : Lock
         The threadlock used for atomic access of queues of the child classes.
     """
@@ -93,6 +208,8 @@ class Reader(socket.socket):
         self.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.settimeout(1)  # Timeout after one second
         self.Address = (ip, port)
+        self.ReceiveBuffer = bytearray(self.BufferLength)
+        self.ReceiveView = memoryview(self.ReceiveBuffer)
 
         self.tryConnect()
 
@@ -107,15 +224,21 @@ class Reader(socket.socket):
         except OSError as e:
             if e.errno != errno.ENOTCONN:  # Catch OSError 57: socket not connected
                 raise
+            # On Linux a shutdown of an unconnected socket still breaks every later send
+            self.renewSocket()
         finally:
             self.connectSafely()
 
     def renewSocket(self):
         r"""
         Renew connection to the socket by calling the parent __init__ function
-        again through super(). This resets the socket entirely.
+        again through super(). This resets the socket entirely, so the old file
+        descriptor is closed first and the socket options are set again.
         """
+        self.close()
         super(Reader, self).__init__(socket.AF_INET, socket.SOCK_STREAM)
+        self.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.settimeout(1)  # Timeout after one second
 
     def connectSafely(self):
         r"""
@@ -129,6 +252,31 @@ class Reader(socket.socket):
         except socket.timeout:
             raise ConnectionError('{} connection timed out.'.format(self.Address)) from None
 
+    def receiveExactly(self, length, offset=0):
+        r"""
+        Receive exactly length bytes from the socket into the ReceiveBuffer,
+        starting at offset. A single recv() may return a reply in pieces, which
+        would otherwise be decoded as a short message. The returned view is only
+        valid until the next message is received into the same part of the buffer.
+        A length that does not fit in the buffer can only come from a corrupt
+        header, so it raises a ConnectionError and the reader reconnects.
+
+        Returns:
+        ----------
+        view : memoryview
+            The received bytes, or an empty view when the other side closed the socket.
+        """
+        if length < 0 or offset + length > len(self.ReceiveBuffer):
+            raise ConnectionError('{} sent a message of {} bytes, which does not fit in the buffer.'.format(self.Address, length))
+        view = self.ReceiveView[offset:offset + length]
+        received = 0
+        while received < length:
+            chunk = self.recv_into(view[received:], length - received)
+            if chunk == 0:
+                return view[:0]
+            received += chunk
+        return view
+
     def isClosed(self):
         r""" Use private methods from the socket to test if it's alive."""
         return self._closed
@@ -138,7 +286,165 @@ class Reader(socket.socket):
         raise NotImplementedError("shutdownSafely() method not implemented")
 
 
-class ModBusReader(Reader):
+class StateReader(Reader):
+    r"""
+    Class used to represent a source of robot states that is read continuously
+    in its own thread. Every cycle the reader publishes an immutable RobotState
+    and records it in the History, so all consumers share the same readings
+    without polling the robot themselves. Child classes implement read().
+
+    Attributes:
+    -------
+    EmptyState : RobotState
+        The state before the first cycle is completed.
+    History : StateHistory
+        The ring buffer to which the reader thread writes every cycle, with a
+        timestamp, for history queries without polling the getters.
+    State : RobotState
+        The snapshot of the last complete cycle, replaced as a whole every cycle.
+    NewState : Condition
+        The condition that is notified every time a new State is published.
+    StopCommunicating: Event
+        The event that signals that communication with the robot should halt.
+    CommunicationThread : Thread
+        The thread that reads and publishes the robot states.
+    """
+
+    EmptyState = RobotState(-1, (-1,)*6, (-1,)*6, -1, False, -1)
+
+    def __init__(self, ip, port, history_length=4096):
+        self.History = StateHistory(history_length)
+        self.State = self.EmptyState
+        self.NewState = Condition()
+
+        CommunicatingStarted = Event()
+        self.StopCommunicating = Event()
+        self.CommunicationThread = Thread(target=self.readContinuously, args=[CommunicatingStarted, self.StopCommunicating], daemon=True, name='{}Thread'.format(type(self).__name__))
+
+        # Startup parent after creation of all attributes:
+        super(StateReader, self).__init__(ip, port)
+        # At this moment the stop event is set due to unknown reasons. Clear the event.
+        self.StopCommunicating.clear()
+        self.CommunicationThread.start()
+        # Wait for the first value to be read:
+        CommunicatingStarted.wait()
+
+    def readContinuously(self, communicating_started_event, stop_communicating_event):
+        r"""
+        Continuously communicate with the robot through a loop that is only
+        halted if the StopCommunicating is raised. Catch errors here to
+        ensure the CommunicationThread keeps communicating.
+        """
+        while not stop_communicating_event.is_set():
+            try:
+                self.read(communicating_started_event)
+            except socket.timeout as e:
+                # The connection is kept, late replies are discarded by the reader
+                communicateError(e, "Reply timed out.")
+            except OSError as e:
+                communicateError(e, "Reading error.")
+                self.renewSocket()
+                try:
+                    self.connectSafely()
+                except OSError as e:
+                    communicateError(e, "Reconnecting failed.")
+                    stop_communicating_event.wait(1.0)
+
+    def isConnected(self):
+        r"""
+        Test whether the socket is communicating or not. This is better than the
+        fileno() or _closed approaches, as those only measure if the socket is
+        closed or not.
+        """
+        return not self.StopCommunicating.isSet()
+
+    def read(self, communicating_started_event):
+        r""" Class method to override by any instance. """
+        raise NotImplementedError("read() method not implemented")
+
+    def publish(self, state):
+        r"""
+        Publish a new RobotState by replacing the State attribute, which is a
+        single atomic assignment, then record it in the History and wake up
+        every thread that waits for a new state.
+        """
+        self.State = state
+        self.History.write(state.Time, state.JointAngles, state.ToolPosition, state.ToolCurrent, state.ToolBit)
+        with self.NewState:
+            self.NewState.notify_all()
+
+    def waitUntil(self, predicate, timeout=None, stop_event=None):
+        r"""
+        Block until the predicate is true for a published state. The predicate
+        is evaluated exactly once for every new state, outside of the lock, and
+        the calling thread sleeps in between. Errors raised by the predicate are
+        passed on to the caller.
+
+        Parameters:
+        ----------
+        predicate : callable
+            Function that takes a RobotState and returns a boolean.
+        timeout : float
+            The maximum number of seconds to wait, or None to wait forever.
+        stop_event : Event
+            Raises an InterruptedError when the event is set while waiting.
+
+        Returns:
+        ----------
+        state : RobotState
+            The first state for which the predicate was true, or None when the
+            timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        last_state = None
+        while True:
+            with self.NewState:
+                while self.State is last_state:
+                    if stop_event is not None and stop_event.is_set():
+                        raise InterruptedError("Stop event has been raised.")
+                    remaining = 0.1 if deadline is None else deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    # Wake up regularly to notice the stop event, also when no states arrive
+                    self.NewState.wait(min(remaining, 0.1))
+                last_state = self.State
+            if predicate(last_state):
+                return last_state
+
+    def getState(self):
+        r"""
+        Return the RobotState of the last complete cycle. All values in it were
+        read in the same cycle. This takes no lock and never blocks.
+        """
+        return self.State
+
+    def getToolBitInfo(self):
+        state = self.State
+        return state.ToolBit, state.ToolBitSettled
+
+    def getToolPosition(self):
+        return list(self.State.ToolPosition)
+
+    def getJointAngles(self):
+        return list(self.State.JointAngles)
+
+    def shutdownSafely(self, verbose=True):
+        r"""
+        Shutdown the socket and the running processes one by one.
+        """
+        if verbose:
+            print(self.Address, "shutting down safely.")
+        if not self.StopCommunicating.isSet():
+            self.StopCommunicating.set()
+        if self.CommunicationThread.is_alive():
+            self.CommunicationThread.join()
+            self.StopCommunicating.clear()
+        if not self.isClosed():
+            self.shutdown(socket.SHUT_RDWR)
+            self.close()
+
+
+class ModBusReader(StateReader):
     r"""
     Class used to communicate with the UR modbus in real-time. This is safer and
     more robust than listening to the robot parameters through URscript, which
@@ -188,16 +494,26 @@ class ModBusReader(Reader):
     toolRZ : ParameterInfo(float)
         The angle at which the tool is rotated about the z-axis.
 
-    StopCommunicating: Event
-        The event that signals that communication with the modbus should halt.
-    CommunicationThread : Thread
-        The thread that updates all ParameterInfo instances.
+    ReadPlan : list of RegisterBlock
+        The contiguous register blocks that are requested every cycle, so all
+        ParameterInfo instances are read in as few round trips as possible.
+    Pipelined : bool
+        Send all requests of a cycle back to back and match the replies by
+        their transaction identifier, instead of waiting for every reply.
+    TransactionID : int
+        The identifier of the last sent request, incremented for every request.
+    RequestsInFlight : int
+        The largest number of requests that awaited a reply during the last cycle.
+    TransactionLatencies : dict
+        The time in seconds between sending a request and receiving its reply,
+        for every RegisterBlock of the last cycle.
     """
 
-    def __init__(self):
-        IP = "192.168.1.17"
-        PORT = 502
-
+    def __init__(self, ip=ROBOT_IP, port=502, pipelined=False, history_length=4096):
+        self.Pipelined = pipelined
+        self.TransactionID = 0
+        self.RequestsInFlight = 0
+        self.TransactionLatencies = dict()
         self.ToolBitChanged = False
         self.SpikeOccurred = False
         self.ListOfCurrents = [0]*60
@@ -218,60 +534,32 @@ class ModBusReader(Reader):
         self.toolRX        = ParameterInfo(403, b'\x01\x93', "Cartesian Tool Orientation RX (milli rad in base frame).", self.extractAngle)
         self.toolRY        = ParameterInfo(404, b'\x01\x94', "Cartesian Tool Orientation RY (milli rad in base frame).", self.extractAngle)
         self.toolRZ        = ParameterInfo(405, b'\x01\x95', "Cartesian Tool Orientation RZ (milli rad in base frame).", self.extractAngle)
-
-        CommunicatingStarted = Event()
-        self.StopCommunicating = Event()
-        self.CommunicationThread = Thread(target=self.readContinuously, args=[CommunicatingStarted, self.StopCommunicating], daemon=True, name='ModBusReaderThread')
+        # Group the registers: 1, 270-275, 400-405 and 770 are read in four requests. Only
+        # the parameters of this reader, the instances of other readers belong to other robots
+        self.ReadPlan = RegisterBlock.plan([value for value in vars(self).values() if isinstance(value, ParameterInfo)])
 
         # Startup parent after creation of all attributes:
-        super(ModBusReader, self).__init__(IP, PORT)
-        # At this moment the stop event is set due to unknown reasons. Clear the event.
-        self.StopCommunicating.clear()
-        self.CommunicationThread.start()
-        # Wait for the first value to be read:
-        CommunicatingStarted.wait()
-
-    def readContinuously(self, communicating_started_event, stop_communicating_event):
-        r"""
-        Continuously communicate with the modbus through a loop that is only
-        halted if the StopCommunicating is raised. Catch errors here to
-        ensure the CommunicationThread keeps communicating.
-        """
-        while not stop_communicating_event.is_set():
-            try:
-                self.read(communicating_started_event)
-            except OSError as e:
-                communicateError(e, "Reading error.")
-                self.renewSocket()
+        super(ModBusReader, self).__init__(ip, port, history_length)
 
-    def isConnected(self):
+    def extractToolBit(self, value):
         r"""
-        Test whether the socket is communicating or not. This is better than the
-        fileno() or _closed approaches, as those only measure if the socket is
-        closed or not.
+        Read the bit that corresponds to the gripper state (bit 8) from the
+        register of output bits and see if it differs from the ToolBit value, to
+        check if the state has changed so we can look for a spike.
         """
-        return not self.StopCommunicating.isSet()
-
-    def extractToolBit(self, data):
-        r"""
-        Convert the hexadecimal data to a list of bits. Read the bit that
-        corresponds to the gripper state (bit 8) and see if it differs from the
-        ToolBit value, to check if the state has changed so we can look for a spike.
-        """
-        allBits = [int(x) for x in bin(int(data))[2:]][:9:-1]
-        gripperBit = 8
-        ToolBitValue = allBits[gripperBit]
+        GRIPPER_BIT = 8
+        ToolBitValue = (value >> GRIPPER_BIT) & 1
         if self.ToolBit.Value != ToolBitValue:
             self.ToolBitChanged = True
         return ToolBitValue
 
-    def extractToolCurrent(self, data):
+    def extractToolCurrent(self, value):
         r"""
-        The last two digits of the hexadecimal data contain the value of the
-        electrical current. Check if a spike occurred and signal that to other methods.
+        The lower byte of the register contains the value of the electrical
+        current. Check if a spike occurred and signal that to other methods.
         """
         StabilisedCurrent = False
-        Current = int(data[-2:], 16)
+        Current = value & 0xFF
         self.ListOfCurrents.append(Current)
         self.ListOfCurrents.pop(0)
         DifferenceInCurrent = 0
@@ -291,77 +579,249 @@ class ModBusReader(Reader):
         return Current
 
     @staticmethod
-    def extractAngle(data):
+    def extractAngle(value):
         r"""
-        Convert the hexadecimal data of a joint angle to a floating point value.
-        Check for negative values by using 2's complement.
+        Convert the signed register value of a joint angle in milli rad to a
+        floating point value in rad.
         """
-        value = int(data[-4:], 16)
-        if value > 6284:  # If integer value > 6284 we need to take the complement
-            value = -(65535 + 1 - value)
         return value * 1.0e-3
 
     @staticmethod
-    def extractToolInfo(data):
+    def extractToolInfo(value):
         r"""
-        Convert the hexadecimal data of a tool position to a floating point value.
-        Check for negative values by using 2's complement.
+        Convert the signed register value of a tool position in tenths of a mm
+        to a floating point value in m.
         """
-        value = int(data[-4:], 16)
-        if value > 32768:  # If integer value > 32767 we need to take the complement
-            value = -(65535 + 1 - value)
         return value * 1.0e-4
 
+    def nextTransactionID(self):
+        r"""
+        Increment the transaction identifier, which wraps around at two bytes.
+        """
+        self.TransactionID = (self.TransactionID + 1) & 0xFFFF
+        return self.TransactionID
+
+    def receiveReply(self):
+        r"""
+        Receive one reply from the modbus. The header of seven bytes holds the
+        transaction identifier and the number of bytes that follow, so replies
+        are framed correctly even when they arrive in pieces or together.
+
+        Returns:
+        ----------
+        transaction_id, data : int, memoryview
+            The transaction identifier of the request this reply belongs to and
+            the remainder of the reply, starting at the function code.
+        """
+        header = self.receiveExactly(MBAP_HEADER.size)
+        if len(header) != MBAP_HEADER.size:
+            raise ConnectionError('{} closed the connection.'.format(self.Address))
+        transaction_id, _, length, _ = MBAP_HEADER.unpack_from(header)
+        length -= 1  # The unit identifier was in the header
+        data = self.receiveExactly(length, offset=MBAP_HEADER.size)
+        if len(data) != length:
+            raise ConnectionError('{} closed the connection.'.format(self.Address))
+        return transaction_id, data
+
+    def decodeBlock(self, block, data):
+        r"""
+        Unpack all registers of a RegisterBlock straight from the received bytes
+        as signed 16 bit integers and process the values of all its ParameterInfo
+        instances in one pass. Replies with the exception function code are skipped.
+        """
+        if len(data) != 2 + 2 * block.Count or data[0] != 3:
+            return
+        values = block.Format.unpack_from(data, 2)  # Skip the function code and the byte count
+        for offset, parameter in block.Parameters:
+            if callable(parameter.Method):  # Call custom methods
+                parameter.Value = parameter.Method(values[offset])
+
     def read(self, communicating_started_event):
         r"""
-        For every instance of ParameterInfo, send a request for more information
-        to the modbus given the hexadecimal address of the value we wich to
-        update. Process the values and store them in the appropriate queues for
-        concurrent access to the latest value.
+        For every RegisterBlock in the ReadPlan, send a request for all its
+        registers to the modbus given the address of the first register and the
+        number of registers. Every request carries its own transaction id, so
+        that the reply can be matched to the block it belongs to.
 
         The sent message is a bytes string. Example:
-        b'\x00\x04\x00\x00\x00\x06\x00\x03\x00\x81\x00\x01'
+        b'\x00\x04\x00\x00\x00\x06\x00\x03\x01\x0E\x00\x06'
         00 04 : the transaction identifier the Modbus TCP follows
         00 00 : a protocol indentifier
         00 06 : messagelength – 6 bytes will follow
         00    : unit identifier (or slave address)
         03    : the function code for 'reading'
-        00 81 : the data address of the first register requested (81hex = 129 dec).
-        00 01 : the total number of requested registers
+        01 0E : the data address of the first register requested (10E hex = 270 dec).
+        00 06 : the total number of requested registers
+
+        The reply repeats the first seven bytes, followed by the function code,
+        the number of data bytes and two bytes per register.
         """
-        parameters = list(ParameterInfo.getInstances())
-        for parameter in parameters:
-            self.send(b'\x00\x04\x00\x00\x00\x06\x00\x03' + parameter.Address + b'\x00\x01')
-            data = self.recv(self.BufferLength).hex()
-            if len(data) == 0:
-                continue
-            if callable(parameter.Method):  # Call custom methods
-                parameter.Value = parameter.Method(data)
+        if self.Pipelined:
+            self.readPipelined()
+        else:
+            self.readSequentially()
+        self.publishState()
         communicating_started_event.set()
 
-    def getToolBitInfo(self):
-        return self.ToolBit.Value, not self.ToolBitChanged
+    def readSequentially(self):
+        r"""
+        Send the request of every block and wait for its reply before sending the
+        next one. Replies to earlier requests that timed out are discarded.
+        """
+        self.RequestsInFlight = 1
+        for block in self.ReadPlan:
+            transaction_id = self.nextTransactionID()
+            sent_time = time.perf_counter()
+            self.send(transaction_id.to_bytes(2, 'big') + block.Request)
+            reply_id, data = self.receiveReply()
+            while reply_id != transaction_id:
+                reply_id, data = self.receiveReply()
+            self.TransactionLatencies[block] = time.perf_counter() - sent_time
+            self.decodeBlock(block, data)
+
+    def readPipelined(self):
+        r"""
+        Send the requests of all blocks back to back in one message and decode the
+        replies in the order in which they arrive, matched by transaction id.
+        A slow reply then only delays itself instead of every request after it.
+        """
+        pending = dict()
+        requests = list()
+        for block in self.ReadPlan:
+            transaction_id = self.nextTransactionID()
+            pending[transaction_id] = block
+            requests.append(transaction_id.to_bytes(2, 'big') + block.Request)
+        self.RequestsInFlight = len(pending)
+        sent_time = time.perf_counter()
+        self.sendall(b''.join(requests))
+        while pending:
+            reply_id, data = self.receiveReply()
+            block = pending.pop(reply_id, None)
+            if block is None:  # A late reply from an earlier cycle
+                continue
+            self.TransactionLatencies[block] = time.perf_counter() - sent_time
+            self.decodeBlock(block, data)
 
-    def getToolPosition(self):
-        return [self.toolX.Value, self.toolY.Value, self.toolZ.Value, self.toolRX.Value, self.toolRY.Value, self.toolRZ.Value]
+    def getTransactionStatistics(self):
+        r"""
+        Return the number of requests that were in flight during the last cycle,
+        and the latency in seconds per RegisterBlock.
+        """
+        return self.RequestsInFlight, self.TransactionLatencies.copy()
 
-    def getJointAngles(self):
-        return [self.BaseAngle.Value, self.ShoulderAngle.Value, self.ElbowAngle.Value, self.Wrist1Angle.Value, self.Wrist2Angle.Value, self.Wrist3Angle.Value]
+    def publishState(self):
+        r"""
+        Collect the values of this cycle in a new RobotState and publish it.
+        """
+        state = RobotState(time.monotonic(),
+                           (self.BaseAngle.Value, self.ShoulderAngle.Value, self.ElbowAngle.Value, self.Wrist1Angle.Value, self.Wrist2Angle.Value, self.Wrist3Angle.Value),
+                           (self.toolX.Value, self.toolY.Value, self.toolZ.Value, self.toolRX.Value, self.toolRY.Value, self.toolRZ.Value),
+                           self.ToolBit.Value, not self.ToolBitChanged, self.ToolCurrent.Value)
+        self.publish(state)
 
-    def shutdownSafely(self, verbose=True):
+
+class RealTimeReader(StateReader):
+    r"""
+    Class used to receive the robot state that the controller pushes at 125 Hz
+    over the real-time interface on port 30003. This is an alternative to the
+    ModBusReader: no requests are needed, and all values are float64 instead of
+    16 bit registers. Packets are framed by their message size and received
+    into the reusable ReceiveBuffer, from which the values are unpacked in place.
+
+    The byte offsets follow the RealTime 3.10 -> 3.13 sheet of the client
+    interface in the Documentation. Note that the deprecated RobotSocket read
+    the tool position at byte 588, which is the target and not the actual tool
+    vector.
+
+    Attributes:
+    -------
+    MESSAGE_SIZE : Struct
+        The integer that starts every packet with the total packet length.
+    DOUBLE, VECTOR6 : Struct, Struct
+        The formats of a single value and of six values.
+    MinimumLength : int
+        The length of the shortest packet that holds all values we decode.
+    PacketCount : int
+        The number of packets received so far.
+    """
+
+    MESSAGE_SIZE = struct.Struct('>i')
+    DOUBLE = struct.Struct('>d')
+    VECTOR6 = struct.Struct('>6d')
+
+    # Bytes preceding the values in the packet
+    TIME_OFFSET = 4
+    Q_ACTUAL_OFFSET = 252
+    QD_ACTUAL_OFFSET = 300
+    I_ACTUAL_OFFSET = 348
+    TOOL_VECTOR_ACTUAL_OFFSET = 444
+    ROBOT_MODE_OFFSET = 756
+    DIGITAL_OUTPUTS_OFFSET = 1044
+    GRIPPER_BIT = 8
+
+    MinimumLength = DIGITAL_OUTPUTS_OFFSET + 8
+
+    def __init__(self, ip=ROBOT_IP, port=30003, history_length=4096):
+        self.PacketCount = 0
+        super(RealTimeReader, self).__init__(ip, port, history_length)
+
+    def receivePacket(self):
         r"""
-        Shutdown the socket and the running processes one by one.
+        Receive one complete packet into the ReceiveBuffer. The buffer grows
+        once if the controller sends longer packets than BufferLength.
+
+        Returns:
+        ----------
+        packet : memoryview
+            The view on the complete packet, including the message size.
         """
-        if verbose:
-            print(self.Address, "shutting down safely.")
-        if not self.StopCommunicating.isSet():
-            self.StopCommunicating.set()
-        if self.CommunicationThread.is_alive():
-            self.CommunicationThread.join()
-            self.StopCommunicating.clear()
-        if not self.isClosed():
-            self.shutdown(socket.SHUT_RDWR)
-            self.close()
+        header = self.receiveExactly(self.MESSAGE_SIZE.size)
+        if len(header) != self.MESSAGE_SIZE.size:
+            raise ConnectionError('{} closed the connection.'.format(self.Address))
+        length = self.MESSAGE_SIZE.unpack_from(header)[0]
+        if length > len(self.ReceiveBuffer):
+            self.ReceiveBuffer = bytearray(length)
+            self.ReceiveView = memoryview(self.ReceiveBuffer)
+            self.ReceiveView[:self.MESSAGE_SIZE.size] = self.MESSAGE_SIZE.pack(length)
+        body = self.receiveExactly(length - self.MESSAGE_SIZE.size, offset=self.MESSAGE_SIZE.size)
+        if len(body) != length - self.MESSAGE_SIZE.size:
+            raise ConnectionError('{} closed the connection.'.format(self.Address))
+        return self.ReceiveView[:length]
+
+    def decodePacket(self, packet):
+        r"""
+        Unpack the values we need from a packet straight from the buffer.
+        The gripper bit is bit 8 of the digital outputs. The tool current is
+        not part of the real-time interface, so the tool bit is always settled.
+
+        Returns:
+        ----------
+        state : RealTimeState
+            The state of the robot, or None if the packet is too short.
+        """
+        if len(packet) < self.MinimumLength:
+            return None
+        digital_outputs = int(self.DOUBLE.unpack_from(packet, self.DIGITAL_OUTPUTS_OFFSET)[0])
+        return RealTimeState(time.monotonic(),
+                             self.VECTOR6.unpack_from(packet, self.Q_ACTUAL_OFFSET),
+                             self.VECTOR6.unpack_from(packet, self.TOOL_VECTOR_ACTUAL_OFFSET),
+                             (digital_outputs >> self.GRIPPER_BIT) & 1, True, -1,
+                             self.DOUBLE.unpack_from(packet, self.TIME_OFFSET)[0],
+                             self.VECTOR6.unpack_from(packet, self.QD_ACTUAL_OFFSET),
+                             self.VECTOR6.unpack_from(packet, self.I_ACTUAL_OFFSET),
+                             self.DOUBLE.unpack_from(packet, self.ROBOT_MODE_OFFSET)[0],
+                             digital_outputs)
+
+    def read(self, communicating_started_event):
+        r"""
+        Receive the next packet the controller pushes, decode it and publish it.
+        """
+        state = self.decodePacket(self.receivePacket())
+        if state is None:
+            return
+        self.PacketCount += 1
+        self.publish(state)
+        communicating_started_event.set()
 
 
 class RobotCCO(Reader):  # RobotChiefCommunicationOfficer
@@ -371,10 +831,8 @@ class RobotCCO(Reader):  # RobotChiefCommunicationOfficer
     gripper operations, while the listening is handled by the ModBusReader.
     """
 
-    def __init__(self):
-        IP = "192.168.1.17"
-        PORT = 30003
-        super(RobotCCO, self).__init__(IP, PORT)
+    def __init__(self, ip=ROBOT_IP, port=30003):
+        super(RobotCCO, self).__init__(ip, port)
 
     def shutdownSafely(self, verbose=True):
         if verbose:
@@ -1,32 +1,56 @@
 import time
-import winsound
+import numpy as np
 
-from queue import SimpleQueue, LifoQueue, Empty
+try:
+    import winsound  # Only on Windows, for beep()
+except ImportError:
+    winsound = None
+
+from queue import SimpleQueue
 from threading import Thread, Event
+from concurrent.futures import ThreadPoolExecutor
 
-from Readers import ModBusReader, RobotCCO
+from Readers import ModBusReader, RobotCCO, ROBOT_IP
+from TaskScheduler import TaskScheduler
+from URScript import URScriptProgram
 from Functionalities import sleep, communicateError, pi
 
-from KinematicsModule.Kinematics import RPY2RotVec, RPY2RotVecRodr, RotVec2RPY  # Slow Python implementation
-from KinematicsLib.cKinematics import ForwardKinematics, detectCollision  # Fast C and Cython implementation
-from KinematicsLib.cKinematics import toolPositionDifference, jointAngleDifference, spatialDifference
+from KinematicsModule import Backend as kinematics  # The compiled, NumPy or Python implementation, imported on first use
+from KinematicsModule.Backend import (ForwardKinematics, detectCollision, detectPointCollision, predictPositions,
+                                      toolPositionDifference, jointAngleDifference, spatialDifference, RPY2RotVec,
+                                      toolTransform, interpolateToolPath, toolPathToJointPath, sweptPathCollision,
+                                      linkClearance, reloadScene)
 
 
 class Robot:
     r"""
-    Class used to represent the UR5 robot, which consists of the ModBusReader to
+    Class used to represent the UR5 robot, which consists of a StateReader to
     listen to and aqcuire all the robot information, and the RobotCCO, to which
     we can send commands. This class implements the move commands as a blocking
     thread, so that we can wait for the target position to be reached while
     using full concurrency.
 
+    All connections, events and tasks belong to the instance, so one process
+    can drive several robots, see RobotPool.
+
     Attributes:
     -------
-    ModBusReader : ModBusReader
-        The instance of the ModBusReader class to listen to parameters like the
-        current joint angles or tool position.
+    Name : str
+        The name of the robot, used for its threads.
+    IP : str
+        The address of the robot controller.
+    StatePort : int
+        The port of the StateReader, or None for the default port of its class.
+    CommandPort : int
+        The port of the RobotCCO.
+    StateReader : StateReader
+        The instance of the ModBusReader, RealTimeReader or RTDEReader class to listen to
+        parameters like the current joint angles or tool position. The instance
+        is also available under the name of its class.
     RobotCCO : RobotCCO
         The instance of the RobotCCO class to send commands via URscript.
+    StopEvent : Event
+        Stops the robot from running.
 
     pidiv180 : float
         The value of pi/180 for conversion between angles in degrees to radians.
@@ -43,11 +67,19 @@ class Robot:
     ToolPositionLightBox : list of tool positions in mm and angles in radians
         The tool position of the tool positioned at the lower left corner of the
         light box, with the tool aligned vertically, facing down.
+    CollisionLookup : CollisionTable
+        The precomputed collision table of the arm in joint space, or None to
+        always compute the collisions. Built by KinematicsModule/CollisionTable.py.
+    Tasks : TaskScheduler
+        Runs the tasks given with giveTask() one at a time, by priority.
+    LookAheadTime : float
+        How far ahead detectCollision() predicts the arm from the joint
+        velocities, in seconds. One cycle of the controller by default.
+    BlendRadius : float
+        The blend radius of the waypoints the pick programs pass through
+        without stopping, in meters.
     """
 
-    ModBusReader = ModBusReader
-    RobotCCO = RobotCCO
-
     # Save some important positions as attributes:
     ToolHoverHeight = 0.06
     ToolPickUpHeight = 0.009
@@ -63,40 +95,51 @@ class Robot:
     # ToolPositionReadObject = [-0.46864, -0.10824, 0.74611, 0.0000, 0.000, pi/2.0]
     # ToolPositionTestCollision = [0.04860, -0.73475, 0.30999, 0.7750, 3.044, 0.002]
 
-    StopEvent = Event()  # Stop the robot class from running
-    StopTaskEvent = Event()  # Stop the current task from running
-    TaskFinishedEvent = Event()  # Signal the current task is finished
-    TaskQueue = LifoQueue()
-    TaskThread = Thread(args=[TaskQueue, StopTaskEvent, StopEvent, TaskFinishedEvent], daemon=True, name='Async Robot tasks')
+    CollisionLookup = None
+    LookAheadTime = 0.008
+    BlendRadius = 0.02
 
     def __repr__(self):
-        return "Robot"
+        return self.Name
 
-    def __init__(self):
+    def __init__(self, state_reader=ModBusReader, ip=ROBOT_IP, state_port=None, command_port=30003, name="Robot"):
         super(Robot, self).__init__()
-        self.tryConnect()
-        self.TaskThread._target = self.runTasks
+        self.Name = name
+        self.IP = ip
+        self.StatePort = state_port
+        self.CommandPort = command_port
+        self.StateReader = None
+        self.RobotCCO = None
+        self.StopEvent = Event()  # Stop the robot from running
+        self.Tasks = None
+        self.loadCollisionTable()
+        self.tryConnect(state_reader)
+        self.Tasks = TaskScheduler('Async {} tasks'.format(name))
         self.giveTask(self.initialise)
-        self.TaskThread.start()
+        self.Tasks.start()
 
-    def tryConnect(self):
+    def tryConnect(self, state_reader=ModBusReader):
         r"""
-        Try to connect to the ModBusReader and the RobotCCO asynchronously. This
+        Try to connect to the StateReader and the RobotCCO asynchronously. This
         is faster than starting sequentially. Any errors that were raised are
         caught, and the RobotClass is destructed before passing on the error.
+        The state_reader is the ModBusReader, the RealTimeReader or the RTDEReader.
         """
         ReturnErrorMessageQueue = SimpleQueue()
+        setattr(self, state_reader.__name__, None)
 
-        def startAsync(error_queue, constructor):
+        def startAsync(error_queue, constructor, port):
             try:
-                setattr(self, constructor.__name__, constructor())
+                setattr(self, constructor.__name__, constructor(self.IP) if port is None else constructor(self.IP, port))
             except Exception as e:
                 # Startup of this part has failed and we need to shutdown all parts
                 error_queue.put(e)
 
-        startThreads = [Thread(target=startAsync, args=[ReturnErrorMessageQueue, partname], name='{} startAsync'.format(partname)) for partname in [ModBusReader, RobotCCO]]
+        parts = [(state_reader, self.StatePort), (RobotCCO, self.CommandPort)]
+        startThreads = [Thread(target=startAsync, args=[ReturnErrorMessageQueue, partname, port], name='{} {} startAsync'.format(self, partname.__name__)) for partname, port in parts]
         [x.start() for x in startThreads]
         [x.join() for x in startThreads]
+        self.StateReader = getattr(self, state_reader.__name__)
 
         # Get first error, if any, and raise it to warn the instance and the parent
         if not ReturnErrorMessageQueue.empty():
@@ -115,27 +158,28 @@ class Robot:
 
     def halt(self):
         r"""
-        Stop the current concurrent command and stop the robot.
+        Stop the current concurrent command, cancel the pending ones and stop
+        the robot. Called from a task, like after a collision in moveTo(), the
+        task itself is not cancelled, so it can still move the robot away.
         """
         self.stop()
-        if not self.StopTaskEvent.isSet():
-            self.StopTaskEvent.set()
         self.clearTasks()
-        self.TaskFinishedEvent.wait()  # Wait for current task to finish before going home
+        if self.Tasks is not None and not self.Tasks.isWorkerThread():
+            self.Tasks.cancelCurrent()
+            self.Tasks.waitUntilIdle()  # Wait for current task to finish before going home
 
     def shutdownSafely(self):
         r"""
-        Safely shutdown the ModBusReader and the RobotCCO asynchronously. This is faster than
+        Safely shutdown the StateReader and the RobotCCO asynchronously. This is faster than
         starting sequentially. Only initialise again if we wish to reset the robot entirely.
-        The current Robot task will be halted with the StopTaskEvent, upon which
-        self.runTasks will signal that the task is finished and will clear StopTaskEvent.
+        The current Robot task is halted through its cancellation token, and the
+        robot is initialised once more before the task thread is stopped.
         """
-        self.halt()
-        self.giveTask(self.initialise)
-        self.TaskFinishedEvent.wait()
-        if self.TaskThread.is_alive():
+        if self.Tasks is not None:
+            self.halt()
+            self.giveTask(self.initialise).exception()  # Wait for it, errors were reported already
             self.StopEvent.set()
-            self.TaskThread.join()
+            self.Tasks.shutdown()
 
         def shutdownAsync(part):
             if part is None:
@@ -145,46 +189,39 @@ class Robot:
             except Exception as e:
                 raise SystemExit("Safe shutdown failed due to {}. Aborting".format(e))
 
-        shutdownThreads = [Thread(target=shutdownAsync, args=[part], name='{} shutdownSafely'.format(part)) for part in [self.ModBusReader, self.RobotCCO]]
+        shutdownThreads = [Thread(target=shutdownAsync, args=[part], name='{} shutdownSafely'.format(part)) for part in [self.StateReader, self.RobotCCO]]
         [x.start() for x in shutdownThreads]
         [x.join() for x in shutdownThreads]
 
-    @staticmethod
-    def runTasks(robot_task_queue, task_stop_event, robot_stop_event, robot_task_finished_event):
-        while not robot_stop_event.is_set():  # Continue for as long as the robot is running
-            try:  # See if there is a new task
-                task_handle = robot_task_queue.get(timeout=0.01)
-            except Empty as e:
-                # Yes, you know that emptying the queue raises an error
-                continue  # To the next iteration of the loop
-
-            try:  # See if we can execute the function
-                task_handle(task_stop_event)
-            except TypeError as e:
-                communicateError(e)
-            except Exception as e:
-                communicateError(e)
-            finally:  # Signal that the task was performed in some way
-                robot_task_finished_event.set()
-                if task_stop_event.isSet():
-                    # If the event was raised, clear it and signal that the task was stopped.
-                    # This yields the robot ready for the coming task.
-                    task_stop_event.clear()
-
     def clearTasks(self):
-        while True:
-            try:
-                self.TaskQueue.get_nowait()
-            except Empty:
-                break
+        if self.Tasks is not None:
+            self.Tasks.clear()
+
+    def giveTask(self, function_handle, priority=0, token=None):
+        r"""
+        Give the robot a task, which is called with its cancellation token as
+        the stop_event once the tasks before it are done.
 
-    def giveTask(self, function_handle):
-        # Signal that the given task is not finished yet
-        self.TaskFinishedEvent.clear()
-        self.TaskQueue.put(function_handle)
+        Parameters:
+        ----------
+        function_handle : callable
+            The task, which takes a stop_event as its only argument.
+        priority : int
+            Tasks with a higher priority run first, tasks with the same priority
+            in the order they were given.
+        token : CancellationToken
+            The token to cancel the task with, a new one when None.
+
+        Returns:
+        ----------
+        future : TaskFuture
+            Resolves to the return value of the task once it is done. Cancel the
+            task with future.cancel().
+        """
+        return self.Tasks.submit(function_handle, priority, token)
 
     def isConnected(self):
-        return self.ModBusReader.isConnected() and not (self.ModBusReader.isClosed() or self.RobotCCO.isClosed())
+        return self.StateReader.isConnected() and not (self.StateReader.isClosed() or self.RobotCCO.isClosed())
 
     def send(self, message):
         r"""
@@ -210,18 +247,27 @@ class Robot:
             communicateError(e, "Receiving through Robot failed.")
             return b''  # An empty bytes object
 
+    def getState(self):
+        return self.StateReader.getState()
+
     def getToolBitInfo(self):
-        return self.ModBusReader.getToolBitInfo()
+        return self.StateReader.getToolBitInfo()
 
     def getToolPosition(self):
-        return self.ModBusReader.getToolPosition()
+        return self.StateReader.getToolPosition()
 
     def getJointAngles(self):
-        return self.ModBusReader.getJointAngles()
+        return self.StateReader.getJointAngles()
 
-    def getJointPositions(self):
-        X, Y, Z, _, _, _ = self.getToolPosition()
-        return ForwardKinematics(tuple(self.getJointAngles()), (X, Y, Z))
+    def getJointPositions(self, state=None):
+        r"""
+        Compute the positions of all joints from one RobotState, so the joint
+        angles and the tool position belong to the same reading.
+        """
+        if state is None:
+            state = self.getState()
+        X, Y, Z, _, _, _ = state.ToolPosition
+        return ForwardKinematics(state.JointAngles, (X, Y, Z))
 
     def set_IO_PORT(self, port_number, on):
         r"""
@@ -304,8 +350,66 @@ class Robot:
             self.openGripper(self.StopEvent)
             self.closeGripper(self.StopEvent)
 
-    def detectCollision(self):
-        return detectCollision(self.getJointPositions())
+    def loadCollisionTable(self, path=None):
+        r"""
+        Use the collision table at path for detectCollision(), if it exists and
+        was built for the current scene. The table needs the compiled kinematics.
+        The default path is the one CollisionTable.py builds.
+        """
+        self.CollisionLookup = None
+        try:
+            from KinematicsModule.CollisionTable import CollisionTable, TABLE_PATH
+            path = TABLE_PATH if path is None else path
+            table = CollisionTable.load(path)
+        except ImportError as e:
+            print("No collision table is used, the compiled kinematics are not available: {}".format(e))
+            return False
+        except (OSError, ValueError, KeyError) as e:
+            print("No collision table is used, {} could not be loaded: {}".format(path, e))
+            return False
+        if not table.isCurrent():
+            print("No collision table is used, {} was built for another scene.".format(path))
+            return False
+        self.CollisionLookup = table
+        return True
+
+    def detectCollision(self, state=None):
+        r"""
+        Test one RobotState for a collision. When the arm is in a free cell of
+        the collision table only the tool position is tested, otherwise the
+        positions of all joints are computed and tested, now and LookAheadTime
+        ahead. The neighbours of a free cell are free too, which covers the
+        look ahead at the speeds of the robot.
+        """
+        if state is None:
+            state = self.getState()
+        table = self.CollisionLookup
+        if table is not None and table.isCurrent() and table.lookup(state.JointAngles) == table.FREE:
+            X, Y, Z, _, _, _ = state.ToolPosition
+            return detectPointCollision(X, Y, Z)
+        return detectCollision(self.getJointPositions(state)) or self.detectCollisionAhead(state)
+
+    def detectCollisionAhead(self, state):
+        r"""
+        Test where the arm will be LookAheadTime after a RobotState, from the
+        joint velocities of a RealTimeState. States without joint velocities,
+        like those of the ModBusReader, are not tested.
+        """
+        joint_velocities = getattr(state, 'JointVelocities', None)
+        if joint_velocities is None or self.LookAheadTime <= 0 or not any(joint_velocities):
+            return False
+        if not kinematics.providesOrWarn('predictPositions', "the arm is not tested {} s ahead".format(self.LookAheadTime)):
+            return False
+        tool_transform = toolTransform(state.JointAngles, state.ToolPosition)
+        predicted = predictPositions(state.JointAngles, joint_velocities, self.LookAheadTime, tool_transform)
+        return detectCollision(tuple(predicted.T.tolist()))
+
+    def getClearance(self, state=None):
+        r"""
+        Return the smallest distance between the links of the arm and every
+        obstacle, by name, from one RobotState. Negative means a collision.
+        """
+        return dict(zip(kinematics.OBSTACLE_NAMES, linkClearance(self.getJointPositions(state)).tolist()))
 
     def moveTo(self, stop_event, target_position, move, p=True, velocity=0, wait=True, check_collisions=True):
         r"""
@@ -331,11 +435,12 @@ class Robot:
         """
         if stop_event.isSet():
             return
-
-        if p:
-            current_position = self.getToolPosition
-        else:
-            current_position = self.getJointAngles
+        if check_collisions and kinematics.providesOrWarn('sweptPathCollision', "moves are not validated before they are sent"):
+            try:
+                self.validateMove(target_position, move, p)
+            except (ValueError, RuntimeError) as e:  # Do not send a move that is known to fail
+                communicateError(e)
+                return
 
         command = str.encode("{}({}{})".format(move, "p" if p is True else "", target_position))
         if velocity > 0:
@@ -343,10 +448,11 @@ class Robot:
             command = command[:-1] + str.encode(", v={})".format(velocity))
         self.send(command)
 
-        start_position = current_position()
+        start_state = self.getState()
+        start_position = list(start_state.ToolPosition if p else start_state.JointAngles)
         if wait:
             try:
-                self.waitUntilTargetReached(current_position, target_position, p, check_collisions, stop_event)
+                self.waitUntilTargetReached(target_position, p, check_collisions, stop_event)
             except TimeoutError as e:  # Time ran out to test for object position: do not print as error
                 print(str(e))
             except InterruptedError as e:  # StopEvent is raised
@@ -358,44 +464,221 @@ class Robot:
             finally:
                 sleep(0.1, stop_event)  # To let momentum fade away
 
-    def waitUntilTargetReached(self, current_position, target_position, p, check_collisions, stop_event):
+    def validateMove(self, target_position, move, p, state=None):
+        r"""
+        Sample the path of a move before it is sent and test every sample for
+        collisions in one call. A movej is linear in the joint angles, a movel
+        with a tool position is linear in space and is converted to joint angles
+        through the inverse kinematics. A movel to joint angles is checked along
+        the joint path. The tool is modelled from the offset between the last
+        wrist and the tool position of the state.
+
+        Parameters:
+        ----------
+        target_position : list
+            The target position, given by either joint angles or a tool position.
+        move: str
+            The motion: movej or movel.
+        p : bool
+            Whether the target is a tool position (p=True) or joint angles.
+        state : RobotState
+            The state the move starts from. The latest state when None.
+
+        Returns:
+        ----------
+        joint_path : np.array
+            The N x 6 joint angles of the sampled path. Raises a ValueError when
+            the path cannot be reached, and a RuntimeError when it collides.
+        """
+        JOINT_RESOLUTION = 0.01  # rad between samples
+        TOOL_RESOLUTION = 0.005  # m between samples
+        reloadScene()  # Pick up changes of the obstacles without a restart
+        if state is None:
+            state = self.getState()
+        start_angles = np.array(state.JointAngles, np.float64)
+        transform = toolTransform(state.JointAngles, state.ToolPosition)
+
+        if p and move == "movel":
+            start = np.array(state.ToolPosition, np.float64)
+            target = np.array(target_position, np.float64)
+            distance = max(np.linalg.norm(target[:3] - start[:3]) / TOOL_RESOLUTION,
+                           np.linalg.norm(target[3:] - start[3:]) / JOINT_RESOLUTION)
+            tool_path = interpolateToolPath(start, target, max(2, int(np.ceil(distance)) + 1))
+            joint_path = toolPathToJointPath(tool_path, start_angles, transform)
+        else:
+            if p:  # The controller picks the configuration nearest to the current one
+                target_angles = toolPathToJointPath(np.array([target_position], np.float64), start_angles, transform)[-1]
+            else:
+                target_angles = np.array(target_position, np.float64)
+            distance = np.abs(target_angles - start_angles).max() / JOINT_RESOLUTION
+            joint_path = np.linspace(start_angles, target_angles, max(2, int(np.ceil(distance)) + 1))
+
+        index = sweptPathCollision(joint_path, transform)
+        if index >= 0:
+            raise RuntimeError('The {} to {} would bump in to stuff after {} of {} samples.'.format(move, target_position, index, len(joint_path)))
+        return joint_path
+
+    def waitUntilTargetReached(self, target_position, p, check_collisions, stop_event):
         r"""
         Block the moveTo command until either the target position is reached or
-        until the stop event is set or until a collision is detected.
+        until the stop event is set or until a collision is detected. The checks
+        run once for every new RobotState the StateReader publishes, so the
+        collision check and the difference are computed from a pose the robot
+        was actually in, and the thread sleeps in between samples.
         """
-        difference = tuple(1000.0 for _ in target_position)
-        last_difference = difference
-        first_time_equal = False
-        start_time = time.time()
-        last_time_difference = start_time
         MAX_TIME = 15.0
         MAX_SAME_DIFF_TIME = 0.5
 
         RELATIVE_TOLERANCE = 1e-3  # Robot arm should be accurate up to 1mm
         ABSOLUTE_TOLERANCE = 9e-3  # Total difference should not exceed 6*tolerance for 6 joints
-        while sum(difference) > ABSOLUTE_TOLERANCE or all(d > RELATIVE_TOLERANCE for d in difference):
-            if stop_event.isSet() is True:
-                raise InterruptedError("Stop event has been raised.")
-            if check_collisions and self.detectCollision():
+        last_difference = None
+        last_time_difference = time.time()
+
+        def targetReached(state):
+            nonlocal last_difference, last_time_difference
+            if check_collisions and self.detectCollision(state):
                 raise RuntimeError('Bumping in to stuff!')
-            if time.time() - start_time > MAX_TIME:
-                raise TimeoutError('Movement took longer than {} s. Assuming robot is in position and continue.'.format(MAX_TIME))
 
             if p:
-                difference = toolPositionDifference(current_position(), target_position)
+                difference = toolPositionDifference(state.ToolPosition, target_position)
             else:
-                difference = jointAngleDifference(current_position(), target_position)
+                difference = jointAngleDifference(state.JointAngles, target_position)
+            if sum(difference) <= ABSOLUTE_TOLERANCE and not all(d > RELATIVE_TOLERANCE for d in difference):
+                return True
 
             if difference == last_difference:
-                if first_time_equal:
-                    last_time_difference = time.time()
-                    first_time_equal = False
                 if time.time() - last_time_difference > MAX_SAME_DIFF_TIME:
                     raise TimeoutError('No difference measured within {} s. Assuming robot is in position and continue.'.format(MAX_SAME_DIFF_TIME))
             else:
                 last_difference = difference
-                first_time_equal = True
-            # print([round(d, 3) for d in difference])
+                last_time_difference = time.time()
+            return False
+
+        if self.StateReader.waitUntil(targetReached, MAX_TIME, stop_event) is None:
+            raise TimeoutError('Movement took longer than {} s. Assuming robot is in position and continue.'.format(MAX_TIME))
+
+    def validateProgram(self, program, state=None):
+        r"""
+        Validate the moves of a program with validateMove(), every move from
+        where the previous one ends. Blends are ignored, they cut the corners
+        of the validated path by at most the blend radius. The tool pose after
+        a move to joint angles is not known, so the moves after one are only
+        checked while the program runs.
+        """
+        if state is None:
+            state = self.getState()
+        for waypoint in program.Waypoints:
+            if waypoint.Command not in ("movej", "movel"):
+                continue
+            joint_path = self.validateMove(list(waypoint.Target), waypoint.Command, waypoint.P, state)
+            if not waypoint.P:
+                break
+            state = state._replace(JointAngles=tuple(joint_path[-1]), ToolPosition=waypoint.Target)
+
+    def waypointReached(self, waypoint, state):
+        r"""
+        Test whether a state has reached one step of a program. A move with a
+        blend radius is passed once the tool or the wrist comes within the
+        radius, a move without one with the tolerances of waitUntilTargetReached().
+        Setting the gripper is done once the ToolBit reads the new value, the
+        other commands cannot be observed and are passed right away.
+        """
+        RELATIVE_TOLERANCE = 1e-3
+        ABSOLUTE_TOLERANCE = 9e-3
+        if waypoint.Command == "set_digital_out":
+            port_number, on = waypoint.Target
+            return port_number != 8 or state.ToolBit == int(on)
+        if waypoint.Command not in ("movej", "movel"):
+            return True
+        if waypoint.Radius > 0:
+            if waypoint.P:
+                distance = spatialDifference(state.ToolPosition, waypoint.Target)
+            else:
+                (X1, Y1, Z1), (X2, Y2, Z2) = [[axis[8] for axis in ForwardKinematics(angles)] for angles in (state.JointAngles, waypoint.Target)]
+                distance = ((X1 - X2)**2 + (Y1 - Y2)**2 + (Z1 - Z2)**2)**0.5
+            return distance <= waypoint.Radius + RELATIVE_TOLERANCE
+        if waypoint.P:
+            difference = self.toolPoseDifference(state.ToolPosition, waypoint.Target)
+        else:
+            difference = jointAngleDifference(state.JointAngles, waypoint.Target)
+        return sum(difference) <= ABSOLUTE_TOLERANCE and not all(d > RELATIVE_TOLERANCE for d in difference)
+
+    @staticmethod
+    def toolPoseDifference(tool_position, target_position):
+        r"""
+        The toolPositionDifference() to the target, or to the same pose with
+        the other rotation vector of its orientation, whichever is smaller.
+        Rotations of about pi, like a tool facing down, are reported with
+        either sign.
+        """
+        x, y, z, rx, ry, rz = target_position
+        difference = toolPositionDifference(tool_position, target_position)
+        angle = (rx**2 + ry**2 + rz**2)**0.5
+        if angle < 1e-6:
+            return difference
+        scale = 1 - 2*pi/angle  # Rotating 2*pi - angle about the opposite axis
+        other = toolPositionDifference(tool_position, (x, y, z, rx*scale, ry*scale, rz*scale))
+        return min(difference, other, key=sum)
+
+    def runProgram(self, stop_event, program, check_collisions=True, progress_callback=None):
+        r"""
+        Send a URScriptProgram to the controller at once and follow its
+        progress from the published states, while blocking the calling thread
+        until the last step is reached, the stop event is set or a collision
+        is detected. Unlike a sequence of moveTo() calls, the arm does not stop
+        and settle at every waypoint.
+
+        Parameters:
+        ----------
+        stop_event: Event
+            The threading event designed to halt the execution of a thread.
+        program : URScriptProgram
+            The program to run.
+        check_collisions: bool
+            Validate the moves before sending the program, and test every state
+            for collisions while it runs.
+        progress_callback : callable
+            Called with the index of every step that is reached and the state
+            it was reached in.
+
+        Returns:
+        ----------
+        steps : int
+            The number of steps that were reached.
+        """
+        MAX_TIME = 30.0
+        if stop_event.isSet():
+            return 0
+        if check_collisions and kinematics.providesOrWarn('sweptPathCollision', "moves are not validated before they are sent"):
+            try:
+                self.validateProgram(program)
+            except (ValueError, RuntimeError) as e:  # Do not send a program that is known to fail
+                communicateError(e)
+                return 0
+
+        steps = 0
+
+        def programFinished(state):
+            nonlocal steps
+            if check_collisions and self.detectCollision(state):
+                raise RuntimeError('Bumping in to stuff during step {} of {}!'.format(steps + 1, program.Name))
+            # Blended waypoints can be passed in between two states, so advance as far as this state has come
+            while steps < len(program) and self.waypointReached(program.Waypoints[steps], state):
+                if progress_callback is not None:
+                    progress_callback(steps, state)
+                steps += 1
+            return steps == len(program)
+
+        self.send(program.build())
+        try:
+            if self.StateReader.waitUntil(programFinished, MAX_TIME, stop_event) is None:
+                print('{} took longer than {} s after step {} of {}. Assuming robot is in position and continue.'.format(program.Name, MAX_TIME, steps, len(program)))
+        except InterruptedError as e:  # StopEvent is raised
+            communicateError(e)
+        except RuntimeError as e:  # Collision raises RuntimeError, the arm stops where it is
+            self.stop()
+            communicateError(e)
+        return steps
 
     def moveToolTo(self, stop_event, target_position, move, velocity=0, wait=True, check_collisions=True):
         r"""
@@ -430,7 +713,15 @@ class Robot:
     def pickUpObject(self, stop_event, object_position):
         r"""
         Sequence of moves that are required to pick up an object that was
-        detected by the topCamera.
+        detected by the topCamera. The arm goes down and back up in two
+        programs, and only lifts the object once the gripper has closed.
+
+        Returns:
+        ----------
+        object_info : tuple
+            The X, Y, w, h and angle of the object that was picked up, or None
+            when it was not picked up: the robot was stopped, a program did
+            not reach its last step or the gripper did not close.
         """
         if stop_event.isSet():
             return
@@ -449,19 +740,30 @@ class Robot:
         target_position[2] = self.ToolHoverHeight
         # Get right orientation from Rodrigues conversion
         REAL_ANGLE_ADJUST = pi / 180 * 6  # Offset 6 degrees to table to camera
-        a, b, c = RPY2RotVecRodr(0, pi, -angle - REAL_ANGLE_ADJUST)
+        a, b, c = RPY2RotVec(0, pi, -angle - REAL_ANGLE_ADJUST)
         target_position[3] = a
         target_position[4] = b
         target_position[5] = c
-        self.moveToolTo(stop_event, target_position, 'movel')
-        # Go down and pickup the object
-        target_position[2] = self.ToolPickUpHeight
-        self.moveToolTo(stop_event, target_position, 'movel')
-        self.closeGripper(stop_event)
-        # Go back up
-        target_position[2] = self.ToolHoverHeight
-        self.moveToolTo(stop_event, target_position, 'movel')
-        self.goHome(stop_event)
+        pickup_position = target_position.copy()
+        pickup_position[2] = self.ToolPickUpHeight
+
+        # Hover and go down as one program, and go back up and home as another:
+        # the arm blends through the hover position on both ways
+        descend = URScriptProgram("descend")
+        descend.movel(target_position, r=self.BlendRadius)
+        descend.movel(pickup_position)
+        if self.runProgram(stop_event, descend) != len(descend):
+            return None
+        self.closeGripper(stop_event)  # Waits for the gripper to settle before the object is lifted
+        gripped = not self.isGripperOpen()
+        if not gripped:
+            print("The gripper did not close on the object at {}, not picked up.".format(pickup_position))
+
+        lift = URScriptProgram("lift")
+        lift.movel(target_position, r=self.BlendRadius)
+        lift.movej(self.JointAngleInit.copy())
+        if self.runProgram(stop_event, lift) != len(lift) or not gripped:
+            return None
         return X, Y, w, h, angle
 
     def initialise(self, stop_event):
@@ -499,10 +801,106 @@ class Robot:
     @staticmethod
     def beep():
         r"""
-        Play a sound as confirmation.
+        Play a sound as confirmation, on Windows.
         """
+        if winsound is None:
+            return
         winsound.PlaySound("SystemHand", winsound.SND_NOSTOP)
 
 
+class RobotPool:
+    r"""
+    Class used to drive several robots, or cells, from one process. The robots
+    connect concurrently and each one runs its own tasks, while they share
+    the kinematics, which are loaded once per process, the memory-mapped
+    collision table and a pool of threads for image processing.
+
+    Attributes:
+    -------
+    Robots : dict of Robot
+        The robots by name.
+    ImagePool : ThreadPoolExecutor
+        The threads that process the images of all cells.
+    """
+
+    __slots__ = ('Robots', 'ImagePool')
+
+    def __init__(self, cells, image_workers=None, robot_class=Robot):
+        r"""
+        Connect to all robots. When one fails, the others are shut down and the
+        first error is raised.
+
+        Parameters:
+        ----------
+        cells : dict
+            The Robot arguments by name, like {'cell1': {'ip': '192.168.1.17'}}.
+        image_workers : int
+            The number of image processing threads, by default as many as
+            the ThreadPoolExecutor chooses.
+        """
+        self.Robots = dict()
+        ReturnErrorMessageQueue = SimpleQueue()
+
+        def startAsync(error_queue, name, arguments):
+            try:
+                self.Robots[name] = robot_class(name=name, **arguments)
+            except Exception as e:
+                error_queue.put(e)
+
+        startThreads = [Thread(target=startAsync, args=[ReturnErrorMessageQueue, name, arguments], name='{} startAsync'.format(name)) for name, arguments in cells.items()]
+        [x.start() for x in startThreads]
+        [x.join() for x in startThreads]
+        self.Robots = {name: self.Robots[name] for name in cells if name in self.Robots}  # In the given order
+        self.ImagePool = ThreadPoolExecutor(image_workers, thread_name_prefix='Image processing')
+
+        if not ReturnErrorMessageQueue.empty():
+            self.shutdownSafely()
+            raise ReturnErrorMessageQueue.get()
+
+    def __repr__(self):
+        return "RobotPool of {}".format(", ".join(self.Robots))
+
+    def __getitem__(self, name):
+        return self.Robots[name]
+
+    def __iter__(self):
+        return iter(self.Robots.values())
+
+    def __len__(self):
+        return len(self.Robots)
+
+    def giveTask(self, name, function_handle, priority=0, token=None):
+        return self.Robots[name].giveTask(function_handle, priority, token)
+
+    def giveTaskToAll(self, function_handle, priority=0):
+        r"""
+        Give every robot the same task, with a token per robot.
+
+        Returns:
+        ----------
+        futures : dict of TaskFuture
+            The futures by name.
+        """
+        return {name: robot.giveTask(function_handle, priority) for name, robot in self.Robots.items()}
+
+    def processImage(self, function_handle, *args, **kwargs):
+        r"""
+        Run an image processing function in the shared pool, and return its future.
+        """
+        return self.ImagePool.submit(function_handle, *args, **kwargs)
+
+    def forEach(self, method):
+        threads = [Thread(target=getattr(robot, method), name='{} {}'.format(robot, method)) for robot in self]
+        [x.start() for x in threads]
+        [x.join() for x in threads]
+
+    def halt(self):
+        self.forEach('halt')
+
+    def shutdownSafely(self):
+        self.forEach('shutdownSafely')
+        self.ImagePool.shutdown()
+
+
 if __name__ == '__main__':
     robot = Robot()
@@ -0,0 +1,123 @@
+import numpy as np
+
+
+class StateHistory:
+    r"""
+    Class used to store every state the robot was read in, in a preallocated
+    ring buffer of rows with a monotonic timestamp, the joint angles, the tool
+    position, the tool current and the tool bit. Every row is written twice,
+    once in each half of the buffer, so that any window of up to capacity rows
+    is a contiguous slice and can be returned as a view without copying.
+
+    Only one thread should write, any number of threads can read. The row that
+    is written next is the oldest row of a full window, so queries use at most
+    capacity - 1 rows and views stay valid for at least one cycle. Copy a view
+    if it needs to outlive more than capacity - 1 cycles.
+
+    Attributes:
+    -------
+    TIME, JOINTS, TOOL, CURRENT, BIT : int or slice
+        The columns of a row.
+    Capacity : int
+        The number of rows that are kept.
+    Buffer : np.array
+        The 2*capacity x 15 buffer that holds the rows twice.
+    Count : int
+        The total number of rows written so far.
+
+    Example:
+    -------
+    -> history.latest(10)[:, StateHistory.JOINTS]
+    The joint angles of the last ten samples, without copying.
+    """
+
+    TIME = 0
+    JOINTS = slice(1, 7)
+    TOOL = slice(7, 13)
+    CURRENT = 13
+    BIT = 14
+    WIDTH = 15
+
+    def __init__(self, capacity=4096):
+        if capacity < 2:
+            raise ValueError("The capacity of the history should be at least 2 rows.")
+        self.Capacity = capacity
+        self.Buffer = np.zeros((2 * capacity, self.WIDTH), np.float64)
+        self.Count = 0
+
+    def __len__(self):
+        return min(self.Count, self.Capacity - 1)
+
+    def __repr__(self):
+        return "StateHistory {}/{}".format(len(self), self.Capacity)
+
+    def write(self, timestamp, joint_angles, tool_position, tool_current, tool_bit):
+        r"""
+        Write a new state in both halves of the buffer. The Count is incremented
+        last, so readers never see a row that is partially written.
+        """
+        index = self.Count % self.Capacity
+        row = self.Buffer[index]
+        row[self.TIME] = timestamp
+        row[self.JOINTS] = joint_angles
+        row[self.TOOL] = tool_position
+        row[self.CURRENT] = tool_current
+        row[self.BIT] = tool_bit
+        self.Buffer[index + self.Capacity] = row
+        self.Count += 1
+
+    def latest(self, n=1):
+        r"""
+        Return a view on the last n states, the oldest first.
+
+        Parameters:
+        ----------
+        n : int
+            The number of states. Limited to the number of states that were
+            written, and to capacity - 1.
+
+        Returns:
+        ----------
+        view : np.array
+            The n x 15 view on the buffer.
+        """
+        count = self.Count
+        n = min(n, count, self.Capacity - 1)
+        end = (count - 1) % self.Capacity + self.Capacity + 1
+        return self.Buffer[end - n:end]
+
+    def history(self, t0, t1):
+        r"""
+        Return a view on all states with a timestamp between t0 and t1, inclusive.
+        """
+        window = self.latest(self.Capacity)
+        times = window[:, self.TIME]
+        start = np.searchsorted(times, t0, side='left')
+        stop = np.searchsorted(times, t1, side='right')
+        return window[start:stop]
+
+    def at(self, t):
+        r"""
+        Return the state at time t, interpolated linearly between the two states
+        around t. The tool bit is not interpolated but taken from the earlier
+        state. Times outside the history return the first or last state.
+
+        Returns:
+        ----------
+        state : np.array
+            A new row of 15 values.
+        """
+        window = self.latest(self.Capacity)
+        if len(window) == 0:
+            raise IndexError("No states have been written to the history.")
+        times = window[:, self.TIME]
+        index = np.searchsorted(times, t, side='right')
+        if index == 0:
+            return window[0].copy()
+        if index == len(window):
+            return window[-1].copy()
+        before, after = window[index - 1], window[index]
+        fraction = (t - before[self.TIME]) / (after[self.TIME] - before[self.TIME])
+        state = before + fraction * (after - before)
+        state[self.BIT] = before[self.BIT]
+        return state
@@ -0,0 +1,187 @@
+import itertools
+
+from queue import PriorityQueue
+from threading import Thread, Event, Lock, current_thread
+from concurrent.futures import Future
+
+from Functionalities import communicateError
+
+
+class CancellationToken(Event):
+    r"""
+    Event that a task receives as its stop_event. Setting it cancels only the
+    task it belongs to, and the task notices it wherever it already tests its
+    stop_event, like in sleep() or StateReader.waitUntil().
+    """
+
+    def cancel(self):
+        self.set()
+
+    def isCancelled(self):
+        return self.is_set()
+
+
+class TaskFuture(Future):
+    r"""
+    Future of a task given to a TaskScheduler, which resolves to the return
+    value of the task. Cancelling a task that has not started yet removes it,
+    cancelling a running task sets its token.
+
+    Attributes:
+    -------
+    Function : callable
+        The task, called with the Token as its only argument.
+    Priority : int
+        Tasks with a higher priority run first, tasks with the same priority
+        in the order they were given.
+    Token : CancellationToken
+        The stop_event of the task.
+    """
+
+    def __init__(self, function_handle, priority=0, token=None):
+        super(TaskFuture, self).__init__()
+        self.Function = function_handle
+        self.Priority = priority
+        self.Token = CancellationToken() if token is None else token
+
+    def __repr__(self):
+        return "TaskFuture {} ({})".format(getattr(self.Function, '__name__', self.Function), self._state.lower())
+
+    def cancel(self):
+        self.Token.cancel()
+        return super(TaskFuture, self).cancel()
+
+
+class TaskScheduler:
+    r"""
+    Class used to run the tasks of the robot one at a time in a dedicated
+    thread, by priority. Giving a task returns a TaskFuture, so the caller can
+    wait for that particular task, chain work on its completion with
+    add_done_callback(), or cancel it. The thread blocks on the queue while
+    there is no task, instead of polling it.
+
+    Attributes:
+    -------
+    Queue : PriorityQueue
+        The pending tasks, as (-priority, sequence number, TaskFuture).
+    Thread : Thread
+        The thread that runs the tasks.
+    Current : TaskFuture
+        The task that is running, or None.
+    Idle : Event
+        Set while there is no task running or pending.
+    """
+
+    __slots__ = ('Queue', 'Thread', 'Current', 'Idle', 'Counter', 'Lock')
+
+    STOP = None  # Queued after all tasks to stop the thread
+
+    def __init__(self, name='Async Robot tasks'):
+        self.Queue = PriorityQueue()
+        self.Thread = Thread(target=self.runTasks, daemon=True, name=name)
+        self.Current = None
+        self.Idle = Event()
+        self.Idle.set()
+        self.Counter = itertools.count()
+        self.Lock = Lock()
+
+    def __repr__(self):
+        return "TaskScheduler with {} pending tasks".format(self.Queue.qsize())
+
+    def start(self):
+        self.Thread.start()
+        return self
+
+    def submit(self, function_handle, priority=0, token=None):
+        r"""
+        Queue a task.
+
+        Parameters:
+        ----------
+        function_handle : callable
+            The task, which takes its stop_event as its only argument.
+        priority : int
+            Tasks with a higher priority run first.
+        token : CancellationToken
+            The token of the task, a new one when None. Tasks that share a token
+            are cancelled together.
+
+        Returns:
+        ----------
+        future : TaskFuture
+            The future of the task.
+        """
+        future = TaskFuture(function_handle, priority, token)
+        with self.Lock:
+            self.Idle.clear()
+            self.Queue.put((-priority, next(self.Counter), future))
+        return future
+
+    def runTasks(self):
+        while True:
+            _, _, future = self.Queue.get()  # Sleeps until there is a task
+            if future is self.STOP:
+                break
+            if future.set_running_or_notify_cancel():  # Skip the tasks that were cancelled while pending
+                self.Current = future
+                try:
+                    future.set_result(future.Function(future.Token))
+                except Exception as e:
+                    communicateError(e)
+                    future.set_exception(e)
+                finally:
+                    self.Current = None
+            with self.Lock:
+                if self.Queue.empty():
+                    self.Idle.set()
+
+    def isWorkerThread(self):
+        return current_thread() is self.Thread
+
+    def cancelCurrent(self):
+        future = self.Current
+        if future is not None:
+            future.cancel()
+
+    def clear(self):
+        r"""
+        Cancel all pending tasks, which resolves their futures as cancelled.
+        Called from a task, pending tasks that share its token are cancelled
+        without setting the token, so the task itself keeps running.
+        """
+        current = self.Current if self.isWorkerThread() else None
+        with self.Queue.mutex:
+            pending = list(self.Queue.queue)
+        for _, _, future in pending:
+            if future is self.STOP:
+                continue
+            if current is not None and future.Token is current.Token:
+                Future.cancel(future)
+            else:
+                future.cancel()
+
+    def cancelAll(self):
+        self.clear()
+        self.cancelCurrent()
+
+    def waitUntilIdle(self, timeout=None):
+        r"""
+        Block until no task is running or pending. Returns immediately when
+        called from a task, which would otherwise wait for itself.
+        """
+        if self.isWorkerThread():
+            return True
+        return self.Idle.wait(timeout)
+
+    def shutdown(self, cancel=True):
+        r"""
+        Stop the thread after the running task, cancelling the pending tasks
+        or running them first.
+        """
+        if cancel:
+            self.cancelAll()
+        if self.Thread.is_alive():
+            self.Queue.put((float('inf'), next(self.Counter), self.STOP))
+            if not self.isWorkerThread():
+                self.Thread.join()
+
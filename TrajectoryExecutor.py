@@ -0,0 +1,302 @@
+import time
+import socket
+import numpy as np
+
+from threading import Thread
+
+from KinematicsModule import Backend as kinematics  # The compiled, NumPy or Python implementation, imported on first use
+
+
+def trapezoidalProfile(length, velocity, acceleration, period):
+    r"""
+    Time-parameterise a path of a given length with a trapezoidal velocity
+    profile: accelerate, cruise at the velocity and decelerate to a stop. Short
+    paths never reach the velocity and get a triangular profile.
+
+    Parameters:
+    ----------
+    length : float
+        The length of the path, in meters.
+    velocity : float
+        The cruise velocity, in m/s.
+    acceleration : float
+        The acceleration and deceleration, in m/s^2.
+    period : float
+        The time between two samples, in seconds.
+
+    Returns:
+    ----------
+    distances, speeds : np.array
+        The distance along the path and the speed at every sample, starting at
+        0 and ending at the length with a speed of 0.
+    """
+    if length <= 0 or velocity <= 0 or acceleration <= 0 or period <= 0:
+        raise ValueError("The length, velocity, acceleration and period should be positive.")
+    ramp_time = velocity / acceleration
+    if velocity * ramp_time > length:  # Triangular: decelerate before the velocity is reached
+        ramp_time = np.sqrt(length / acceleration)
+        velocity = acceleration * ramp_time
+    cruise_time = (length - velocity * ramp_time) / velocity
+    total_time = 2 * ramp_time + cruise_time
+
+    times = np.minimum(np.arange(int(np.ceil(total_time / period)) + 1) * period, total_time)
+    remaining = total_time - times
+    distances = np.where(times < ramp_time, 0.5 * acceleration * times**2,
+                         np.where(remaining < ramp_time, length - 0.5 * acceleration * remaining**2,
+                                  0.5 * velocity * ramp_time + velocity * (times - ramp_time)))
+    speeds = np.minimum(velocity, acceleration * np.minimum(times, remaining))
+    return distances, speeds
+
+
+class TrajectoryExecutor:
+    r"""
+    Class used to move the tool along a line in one continuous motion, instead
+    of a movel per piece that stops and settles. One URscript program is
+    uploaded per line, which connects back to a socket of this class and
+    executes every setpoint it reads from it, while a dedicated thread streams
+    the setpoints at a fixed rate. The line is time-parameterised with a
+    trapezoidal profile. With servoj, the setpoints are the joint angles of the
+    tool positions along the line at every period. With speedl, they are the
+    tool velocity of the profile, corrected towards the planned position by
+    the measured tool position. Marks along the line call a progress callback
+    from the streaming thread as soon as the measured tool position passes
+    them, for instance to note the moment an image should be taken.
+
+    Attributes:
+    -------
+    Robot : Robot
+        The robot the program is sent to and the states are read from.
+    Period : float
+        The time between two setpoints, in seconds. The controller runs at 125 Hz.
+    Mode : str
+        'servoj', which needs the inverse kinematics of the compiled backend,
+        or 'speedl', which only sweeps lines with a constant orientation.
+    LookAheadTime : float
+        The lookahead_time of servoj, which smoothens the trajectory, in seconds.
+    Gain : float
+        The gain of servoj.
+    Correction : float
+        The gain of the position correction of speedl, in 1/s.
+    Thread : Thread
+        The thread that streams the setpoints of the current line.
+    Passed : int
+        The number of marks the measured tool position has passed.
+    Error : Exception
+        The error that stopped the streaming, raised again by join().
+    """
+
+    __slots__ = ('Robot', 'Period', 'Mode', 'LookAheadTime', 'Gain', 'Correction', 'Thread', 'Passed', 'Error')
+
+    SOCKET_NAME = "setpoints"  # The name of the socket in the program
+
+    def __init__(self, robot, period=0.008, mode=None, lookahead_time=0.1, gain=300, correction=2.0):
+        if mode is None:
+            mode = 'servoj' if kinematics.provides('toolPathToJointPath') else 'speedl'
+        if mode not in ('servoj', 'speedl'):
+            raise ValueError("{} is not a streaming mode, use servoj or speedl.".format(mode))
+        self.Robot = robot
+        self.Period = period
+        self.Mode = mode
+        self.LookAheadTime = lookahead_time
+        self.Gain = gain
+        self.Correction = correction
+        self.Thread = None
+        self.Passed = 0
+        self.Error = None
+
+    def __repr__(self):
+        return "TrajectoryExecutor {} at {:.0f} Hz".format(self.Mode, 1.0 / self.Period)
+
+    def isRunning(self):
+        return self.Thread is not None and self.Thread.is_alive()
+
+    def sweepLine(self, stop_event, target_position, velocity=0.01, acceleration=0.1, marks=(), progress_callback=None, check_collisions=True):
+        r"""
+        Plan the line from the current tool position to the target and start
+        streaming it. Returns immediately, join() waits for the end of the line.
+
+        Parameters:
+        ----------
+        stop_event: Event
+            The threading event designed to halt the execution of a thread.
+            Stops the robot when it is set during the line.
+        target_position : list
+            The tool position at the end of the line.
+        velocity : float
+            The cruise velocity of the tool, in m/s.
+        acceleration : float
+            The acceleration of the tool, in m/s^2.
+        marks : list of float
+            The fractions of the line at which the progress callback is called,
+            between 0 and 1, in increasing order.
+        progress_callback : callable
+            Called with the index of every mark and the state that passed it.
+            Runs in the streaming thread, so it should return quickly.
+        check_collisions: bool
+            Validate the line before streaming it, and test every state for
+            collisions while it runs.
+        """
+        if self.isRunning():
+            raise RuntimeError("The previous line is still being streamed.")
+        state = self.Robot.getState()
+        start = np.array(state.ToolPosition, np.float64)
+        target = np.array(target_position, np.float64)
+        length = np.linalg.norm(target[:3] - start[:3])
+        MINIMUM_LENGTH = 1e-4  # m, shorter lines have no direction to sweep in
+        if length < MINIMUM_LENGTH:
+            raise ValueError("The target is {:.2e} m from the tool, which is too short for a line.".format(length))
+        distances, speeds = trapezoidalProfile(length, velocity, acceleration, self.Period)
+        direction = (target[:3] - start[:3]) / length
+
+        if self.Mode == 'servoj':
+            setpoints = self.planServoj(state, target, distances / length, check_collisions)
+        else:
+            if np.abs(kinematics.toolPositionDifference(start, target)[3:]).max() > 1e-3:
+                raise ValueError("speedl only sweeps lines with a constant orientation.")
+            setpoints = self.planSpeedl(start, direction, distances, speeds)
+
+        self.Passed = 0
+        self.Error = None
+        self.Thread = Thread(target=self.stream, args=[stop_event, setpoints, start[:3], direction, np.asarray(marks, np.float64) * length,
+                                                       progress_callback, check_collisions, acceleration],
+                             daemon=True, name='{} stream'.format(self.Mode))
+        self.Thread.start()
+        return self
+
+    def planServoj(self, state, target, fractions, check_collisions):
+        r"""
+        Compute the servoj setpoints: the line is converted to joint angles at
+        every millimeter, and the joint angles are interpolated at the fractions
+        of the profile.
+        """
+        RESOLUTION = 0.001  # m between samples of the joint path
+        start = np.array(state.ToolPosition, np.float64)
+        samples = max(2, int(np.ceil(np.linalg.norm(target[:3] - start[:3]) / RESOLUTION)) + 1)
+        transform = kinematics.toolTransform(state.JointAngles, state.ToolPosition)
+        tool_path = kinematics.interpolateToolPath(start, target, samples)
+        joint_path = kinematics.toolPathToJointPath(tool_path, np.array(state.JointAngles, np.float64), transform)
+        if check_collisions and kinematics.sweptPathCollision(joint_path, transform) >= 0:
+            raise RuntimeError('The line to {} would bump in to stuff.'.format(target.tolist()))
+
+        uniform = np.linspace(0, 1, samples)
+        return np.stack([np.interp(fractions, uniform, joint_path[:, j]) for j in range(6)], axis=1)
+
+    def planSpeedl(self, start, direction, distances, speeds):
+        r"""
+        Compute the speedl setpoints as functions of the measured state, which
+        add a correction towards the planned position to the planned velocity.
+        """
+        positions = start[:3] + distances[:, None] * direction
+        velocities = speeds[:, None] * direction
+
+        def setpoint(k, state):
+            velocity = velocities[k] + self.Correction * (positions[k] - np.array(state.ToolPosition[:3]))
+            return [*velocity, 0.0, 0.0, 0.0]
+        return [lambda state, k=k: setpoint(k, state) for k in range(len(positions))]
+
+    def buildProgram(self, host, port, acceleration):
+        r"""
+        Return the program that connects to host:port and executes every
+        setpoint it reads, as the bytestring that is sent to the controller. A
+        setpoint is a flag and 6 values: the joint angles of servoj or the tool
+        velocity of speedl. The program stops the arm and ends on a flag of 0,
+        or when the stream breaks off and socket_read_ascii_float() times out.
+        """
+        values = ", ".join("setpoint[{}]".format(i) for i in range(2, 8))
+        if self.Mode == 'servoj':
+            command = "servoj([{}], 0, 0, {}, {}, {})".format(values, self.Period, self.LookAheadTime, self.Gain)
+            stop = "stopj(1)"
+        else:
+            command = "speedl([{}], {}, {})".format(values, acceleration, self.Period)
+            stop = "stopl({})".format(acceleration)
+        lines = ['def sweep():',
+                 '  socket_open("{}", {}, "{}")'.format(host, port, self.SOCKET_NAME),
+                 '  while True:',
+                 '    setpoint = socket_read_ascii_float(7, "{}")'.format(self.SOCKET_NAME),
+                 '    if setpoint[0] != 7 or setpoint[1] == 0:',
+                 '      break',
+                 '    end',
+                 '    ' + command,
+                 '  end',
+                 '  socket_close("{}")'.format(self.SOCKET_NAME),
+                 '  ' + stop,
+                 'end']
+        return str.encode("\n".join(lines))
+
+    @staticmethod
+    def formatSetpoint(flag, values):
+        r"""
+        Format a setpoint as the ascii the program reads: (flag,v1,...,v6).
+        """
+        return str.encode("({},{})\n".format(flag, ",".join("{:.6f}".format(float(value)) for value in values)))
+
+    def stream(self, stop_event, setpoints, start, direction, marks, progress_callback, check_collisions, acceleration):
+        r"""
+        Upload the program, wait for it to connect and send it one setpoint
+        every period, on a fixed schedule, while calling the progress callback
+        for every mark the measured tool position passes. After the last
+        setpoint the arm may lag behind, so the last marks are awaited.
+        """
+        CONNECT_TIME = 2.0
+        SETTLE_TIME = 1.0
+        TOLERANCE = 2e-4  # m before a mark that counts as passed
+
+        def passMarks(state):
+            if check_collisions and self.Robot.detectCollision(state):
+                raise RuntimeError('Bumping in to stuff!')
+            distance = np.dot(np.array(state.ToolPosition[:3]) - start, direction)
+            while self.Passed < len(marks) and distance >= marks[self.Passed] - TOLERANCE:
+                if progress_callback is not None:
+                    progress_callback(self.Passed, state)
+                self.Passed += 1
+            return self.Passed == len(marks)
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        connection = None
+        try:
+            server.bind((self.Robot.RobotCCO.getsockname()[0], 0))  # The address the controller reaches us on
+            server.listen(1)
+            server.settimeout(CONNECT_TIME)
+            self.Robot.send(self.buildProgram(*server.getsockname(), acceleration))
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                raise TimeoutError('The {} program did not connect within {} s.'.format(self.Mode, CONNECT_TIME))
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            next_time = time.perf_counter()
+            for setpoint in setpoints:
+                if stop_event.isSet():
+                    raise InterruptedError("Stop event has been raised.")
+                state = self.Robot.getState()
+                connection.sendall(self.formatSetpoint(1, setpoint(state) if callable(setpoint) else setpoint))
+                passMarks(state)
+                next_time += self.Period
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            connection.sendall(self.formatSetpoint(0, np.zeros(6)))  # Ends the program
+            if self.Passed < len(marks) and self.Robot.StateReader.waitUntil(passMarks, SETTLE_TIME, stop_event) is None:
+                raise TimeoutError('Passed {} of {} marks within {} s after the end of the line.'.format(self.Passed, len(marks), SETTLE_TIME))
+        except Exception as e:
+            self.Robot.stop()
+            self.Error = e
+        finally:
+            if connection is not None:
+                connection.close()
+            server.close()
+
+    def join(self, timeout=None):
+        r"""
+        Wait until the line was streamed, and raise the error that stopped it.
+
+        Returns:
+        ----------
+        passed : int
+            The number of marks that were passed.
+        """
+        if self.Thread is not None:
+            self.Thread.join(timeout)
+        if self.Error is not None:
+            raise self.Error
+        return self.Passed
@@ -0,0 +1,113 @@
+from collections import namedtuple
+
+
+# One step of a program: a move, or a command like set_digital_out or sleep.
+# Target holds the position of a move and the arguments of a command, Radius is
+# the blend radius of a move in meters and Script the URscript statement.
+Waypoint = namedtuple('Waypoint', ['Command', 'Target', 'P', 'Radius', 'Script'])
+
+
+def formatPosition(position, p):
+    r"""
+    Format a tool position as p[x, y, z, rx, ry, rz] or joint angles as
+    [b, s, e, w1, w2, w3], with a fixed precision so NumPy scalars print as
+    numbers too.
+    """
+    return "{}[{}]".format("p" if p else "", ", ".join("{:.6f}".format(float(value)) for value in position))
+
+
+class URScriptProgram:
+    r"""
+    Class used to compose a sequence of moves and IO commands into a single
+    URscript program, which the controller executes in one go. Moves with a
+    blend radius do not stop at their target but blend into the next move, so
+    the arm does not stop and settle at every waypoint. The steps are kept as
+    Waypoints, so the Robot can follow the progress of the program from the
+    states it reads.
+
+    Attributes:
+    -------
+    Name : str
+        The name of the program function, def <Name>(): ... end.
+    Waypoints : list of Waypoint
+        The steps of the program in the order they are executed.
+    """
+
+    __slots__ = ('Name', 'Waypoints')
+
+    def __init__(self, name="program"):
+        if not name.isidentifier():
+            raise ValueError("{} is not a valid URscript function name.".format(name))
+        self.Name = name
+        self.Waypoints = list()
+
+    def __repr__(self):
+        return "URScriptProgram {} with {} steps".format(self.Name, len(self.Waypoints))
+
+    def __len__(self):
+        return len(self.Waypoints)
+
+    def move(self, move, target_position, p, a=None, v=None, r=0.0):
+        r"""
+        Append a move to the program.
+
+        Parameters:
+        ----------
+        move: str
+            The motion: movej (find best move) or movel (move in a line).
+        target_position : list
+            The target position, given by either joint angles or a tool position.
+        p : bool
+            Whether the target is a tool position (p=True) or joint angles.
+        a, v : float
+            The acceleration and velocity, or None for the defaults of the controller.
+        r : float
+            The blend radius in meters. 0 stops the arm at the target.
+        """
+        if move not in ("movej", "movel"):
+            raise ValueError("{} is not a move, use movej or movel.".format(move))
+        if len(target_position) != 6:
+            raise ValueError("A target position needs 6 values, got {}.".format(len(target_position)))
+        if r < 0:
+            raise ValueError("The blend radius cannot be negative.")
+        arguments = [formatPosition(target_position, p)]
+        arguments += ["{}={}".format(name, value) for name, value in (("a", a), ("v", v)) if value is not None]
+        if r > 0:
+            arguments.append("r={}".format(r))
+        script = "{}({})".format(move, ", ".join(arguments))
+        self.Waypoints.append(Waypoint(move, tuple(float(value) for value in target_position), p, float(r), script))
+        return self
+
+    def movej(self, target_position, p=False, a=None, v=None, r=0.0):
+        return self.move("movej", target_position, p, a, v, r)
+
+    def movel(self, target_position, p=True, a=None, v=None, r=0.0):
+        return self.move("movel", target_position, p, a, v, r)
+
+    def setDigitalOut(self, port_number, on):
+        r"""
+        Append setting an IO port. Port 8 is the gripper, as in Robot.set_IO_PORT.
+        """
+        if not (0 <= port_number <= 8) or not isinstance(port_number, int):
+            raise ValueError("{} is not an IO port.".format(port_number))
+        script = "set_digital_out({}, {})".format(port_number, bool(on))
+        self.Waypoints.append(Waypoint("set_digital_out", (port_number, bool(on)), False, 0.0, script))
+        return self
+
+    def sleep(self, seconds):
+        r"""
+        Append a pause, for instance to let the gripper close before moving on.
+        """
+        if seconds < 0:
+            raise ValueError("Cannot sleep for a negative time.")
+        self.Waypoints.append(Waypoint("sleep", (float(seconds),), False, 0.0, "sleep({})".format(float(seconds))))
+        return self
+
+    def build(self):
+        r"""
+        Return the program as the bytestring that is sent to the controller.
+        """
+        if not self.Waypoints:
+            raise ValueError("The program {} has no steps.".format(self.Name))
+        body = "\n".join("  " + waypoint.Script for waypoint in self.Waypoints)
+        return str.encode("def {}():\n{}\nend".format(self.Name, body))
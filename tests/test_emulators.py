@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from KinematicsModule import Backend as kinematics
+from Emulators import ControllerEmulator
+
+
+pytestmark = pytest.mark.skipif(not kinematics.provides('toolPathToJointPath'),
+                                reason="The simulated arm needs the compiled kinematics, build it with make in KinematicsModule.")
+
+MARKS = (0.25, 0.5, 0.75, 0.999)
+
+
+@pytest.fixture
+def controller(request):
+    r"""
+    A Robot connected to a ControllerEmulator, at the time scale of the test parameter.
+    """
+    from RobotClass import Robot
+
+    emulator = ControllerEmulator(time_scale=getattr(request, 'param', 1.0)).start()
+    robot = Robot(**emulator.robotArguments())
+    robot.Tasks.waitUntilIdle()
+    yield robot, emulator
+    robot.shutdownSafely()
+    emulator.shutdownSafely()
+
+
+def sweep(robot, mode, offset, velocity=0.05):
+    r"""
+    Sweep the tool over an offset from where it is, and return the marks it passed.
+    """
+    from TrajectoryExecutor import TrajectoryExecutor
+
+    target = np.array(robot.getState().ToolPosition) + offset
+    passed = list()
+
+    def task(stop_event):
+        executor = TrajectoryExecutor(robot, mode=mode)
+        executor.sweepLine(stop_event, target, velocity=velocity, acceleration=0.5, marks=MARKS,
+                           progress_callback=lambda index, state: passed.append(index))
+        executor.join()
+    robot.giveTask(task).result()
+    return passed, target
+
+
+@pytest.mark.parametrize('controller', [10.0], indirect=True)
+def test_pick_closes_the_gripper(controller):
+    robot, emulator = controller
+    picked = robot.giveTask(lambda stop_event: robot.pickUpObject(stop_event, ((0.05, 0.05), (0.02, 0.02), 0.1))).result()
+    assert picked is not None
+    assert not robot.isGripperOpen()
+    assert emulator.Arm.DigitalOutputs >> 8 & 1
+
+
+@pytest.mark.parametrize('mode', ['servoj', 'speedl'])
+def test_sweep_passes_all_marks(controller, mode):
+    robot, emulator = controller
+    passed, target = sweep(robot, mode, [0.05, 0.0, 0.0, 0.0, 0.0, 0.0])
+    assert passed == list(range(len(MARKS)))
+    end = emulator.Arm.toolPosition(emulator.Arm.jointAngles())
+    assert np.linalg.norm(np.array(end[:3]) - target[:3]) < 1e-3
+
+
+def test_sweep_refuses_a_line_without_length(controller):
+    robot, _ = controller
+    with pytest.raises(ValueError):
+        sweep(robot, 'servoj', np.zeros(6))
@@ -0,0 +1,108 @@
+import time
+import struct
+
+from Emulators import ModBusEmulator, RTDEEmulator
+from Readers import ModBusReader
+from RTDE import RTDEReader
+
+
+JOINT_ANGLES = [0.1, -1.2, 1.3, -0.4, -1.5, 0.6]
+TOOL_POSITION = [0.1234, -0.4321, 0.3, 0.0, 3.1, 0.2]
+
+
+def constantTrajectory(t):
+    return JOINT_ANGLES, TOOL_POSITION, 1, 20
+
+
+def waitForCycles(reader, cycles, timeout=5.0):
+    r"""
+    Wait until the reader published a number of new states, and return whether it did.
+    """
+    count = reader.History.Count + cycles
+    deadline = time.monotonic() + timeout
+    while reader.History.Count < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return reader.History.Count >= count
+
+
+def assertClose(values, expected, tolerance):
+    assert len(values) == len(expected)
+    assert all(abs(a - b) <= tolerance for a, b in zip(values, expected)), "{} != {}".format(values, expected)
+
+
+def test_rtde_recipe_is_negotiated_and_decoded():
+    emulator = RTDEEmulator(constantTrajectory).start()
+    reader = RTDEReader(*emulator.Address)
+    try:
+        assert reader.Recipe.Names == RTDEReader.Variables
+        assert reader.Recipe.Types == [RTDEEmulator.Outputs[name] for name in RTDEReader.Variables]
+        assert waitForCycles(reader, 10)
+        state = reader.getState()
+        assertClose(state.JointAngles, JOINT_ANGLES, 1e-12)
+        assertClose(state.ToolPosition, TOOL_POSITION, 1e-12)
+        assertClose(state.JointVelocities, [0.0] * 6, 1e-12)
+        assert state.ToolBit == 1
+        assert state.DigitalOutputs == 1 << RTDEReader.GRIPPER_BIT
+        assert state.RobotMode == 7
+        assert state.ControllerTime > 0
+    finally:
+        reader.shutdownSafely()
+        emulator.shutdownSafely()
+
+
+def test_modbus_pipelined_reads():
+    emulator = ModBusEmulator(constantTrajectory, latency=0.002, jitter=0.001, seed=0).start()
+    reader = ModBusReader(*emulator.Address, pipelined=True)
+    try:
+        assert waitForCycles(reader, 10)
+        in_flight, latencies = reader.getTransactionStatistics()
+        assert in_flight == len(reader.ReadPlan)
+        assert set(latencies) == set(reader.ReadPlan)
+        state = reader.getState()
+        assertClose(state.JointAngles, JOINT_ANGLES, 1e-3)
+        assertClose(state.ToolPosition[:3], TOOL_POSITION[:3], 1e-4)
+        assertClose(state.ToolPosition[3:], TOOL_POSITION[3:], 1e-3)
+        assert state.ToolBit == 1
+        assert state.ToolCurrent == 20
+    finally:
+        reader.shutdownSafely()
+        emulator.shutdownSafely()
+
+
+def test_modbus_pipelined_reads_continue_after_a_dropped_reply():
+    emulator = ModBusEmulator(constantTrajectory, drop_rate=0.02, seed=1).start()
+    reader = ModBusReader(*emulator.Address, pipelined=True)
+    try:
+        deadline = time.monotonic() + 5.0
+        while emulator.DropCount == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert emulator.DropCount > 0
+        assert waitForCycles(reader, 10)  # The cycle of the dropped reply times out, the next ones are read
+        assertClose(reader.getState().JointAngles, JOINT_ANGLES, 1e-3)
+    finally:
+        reader.shutdownSafely()
+        emulator.shutdownSafely()
+
+
+class CorruptModBusEmulator(ModBusEmulator):
+    r"""
+    Sends one reply whose header claims more bytes than any reply has.
+    """
+
+    def reply(self, transaction_id, unit, function_code, start, count):
+        message = super(CorruptModBusEmulator, self).reply(transaction_id, unit, function_code, start, count)
+        if self.RequestCount == 20:
+            return message[:4] + struct.pack('>H', 0xFFFF) + message[6:]
+        return message
+
+
+def test_modbus_reader_reconnects_after_a_corrupt_length():
+    emulator = CorruptModBusEmulator(constantTrajectory).start()
+    reader = ModBusReader(*emulator.Address, pipelined=True)
+    try:
+        assert waitForCycles(reader, 20)
+        assert reader.CommunicationThread.is_alive()
+        assertClose(reader.getState().JointAngles, JOINT_ANGLES, 1e-3)
+    finally:
+        reader.shutdownSafely()
+        emulator.shutdownSafely()